@@ -0,0 +1,7 @@
+"""Performance benchmarks for the engine. Run with:
+
+python -m benchmarks                      # Run everything
+python -m benchmarks -k "Deck.*"          # Run benchmarks matching a glob
+python -m benchmarks --compare            # Compare to benchmarks/baseline.json
+python -m benchmarks --save               # Store a new baseline
+"""
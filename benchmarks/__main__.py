@@ -0,0 +1,76 @@
+"""Command line entry point for the benchmarks. See benchmarks/__init__.py."""
+
+# Python stdlib
+import argparse
+import os
+import sys
+
+from . import engine  # noqa: F401 (registers the benchmarks)
+from . import harness
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the engine benchmarks.")
+    parser.add_argument(
+        "-k", dest="pattern", default="*", help="glob of benchmark names to run"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="minimum seconds per timed repeat (default: 0.2)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timed repeats per benchmark"
+    )
+    parser.add_argument(
+        "--save",
+        nargs="?",
+        const=BASELINE,
+        help="save the results as a baseline (default: benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const=BASELINE,
+        help="compare to a baseline (default: benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown that counts as a regression, as a fraction (default: 0.1)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    def report(result):
+        print(
+            f"{result.name:<36} {harness.format_ns(result.ns_per_op):>10}/op "
+            f"{result.ops_per_sec:>14,.1f} ops/s",
+            flush=True,
+        )
+
+    results = harness.run(
+        args.pattern, min_time=args.min_time, repeat=args.repeat, report=report
+    )
+    if args.save:
+        harness.save(results, args.save)
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        changes = harness.compare(results, harness.load(args.compare))
+        print()
+        print(harness.format_report(changes, threshold=args.threshold))
+        if harness.regressions(changes, threshold=args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
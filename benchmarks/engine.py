@@ -0,0 +1,132 @@
+"""Benchmarks for the engine's hot paths: deck operations, the event queue, the
+end-of-game check, buying, option building, scoring, and whole games. Deck
+benchmarks run with both deck implementations.
+"""
+
+# From dominion module
+from dominion.cards.base_game import (
+    COPPER,
+    DUCHY,
+    ESTATE,
+    GARDENS,
+    GOLD,
+    PROVINCE,
+    SILVER,
+    SMITHY,
+    VILLAGE,
+)
+from dominion.common import DeckPile
+from dominion.events import get_purchasable_cards_as_options
+from dominion.game import GameContext
+from dominion.players import CompactDeck, ComputerPlayer, Deck
+from dominion.policy import RandomPolicy
+from dominion.simulation import SimulationRunner
+from dominion.util.logging import NullSink
+
+from .harness import benchmark
+
+DECK_CLASSES = {"Deck": Deck, "CompactDeck": CompactDeck}
+
+# A mid-game deck of 30 cards
+MID_GAME_DECK = (
+    [COPPER] * 7
+    + [ESTATE] * 3
+    + [SILVER] * 6
+    + [GOLD] * 3
+    + [VILLAGE] * 3
+    + [SMITHY] * 3
+    + [DUCHY, PROVINCE, GARDENS]
+    + [PROVINCE] * 2
+)
+
+
+def make_player(deck_cls=Deck, seed=0):
+    """Returns a player with a mid-game deck and a hand of 5 cards, seated in
+    a seeded game that logs to a NullSink.
+    """
+    player = ComputerPlayer(
+        "Player 1 (CPU)", RandomPolicy(), deck=deck_cls(starter_deck=MID_GAME_DECK)
+    )
+    other = ComputerPlayer("Player 2 (CPU)", RandomPolicy(), deck=deck_cls())
+    ctx = GameContext([player, other], log_sink=NullSink(), seed=seed)
+    player.deck.draw_cards(5)
+    return ctx, player
+
+
+for deck_name, deck_cls in DECK_CLASSES.items():
+
+    @benchmark(f"{deck_name}.draw_cards")
+    def bench_draw_cards(deck_cls=deck_cls):
+        # Discard the hand and draw a new one, reshuffling when needed
+        _, player = make_player(deck_cls)
+        return lambda: player.deck.draw_cards(5)
+
+    @benchmark(f"{deck_name}.move")
+    def bench_move(deck_cls=deck_cls):
+        # Play a card from hand, and put it back
+        deck = make_player(deck_cls)[1].deck
+
+        def op():
+            deck.move(0, from_pile=DeckPile.HAND, to_pile=DeckPile.PLAYED)
+            deck.move(0, from_pile=DeckPile.PLAYED, to_pile=DeckPile.HAND)
+
+        return op
+
+    @benchmark(f"{deck_name}.game")
+    def bench_game(deck_cls=deck_cls):
+        # A full random-vs-random game; ops/sec is games/sec
+        policies = [RandomPolicy(), RandomPolicy()]
+        runner = SimulationRunner(policies, deck_cls=deck_cls, seed=0)
+        return runner.play_game
+
+
+@benchmark("Deck._update_counts")
+def bench_update_counts():
+    deck = make_player()[1].deck
+    return deck._update_counts
+
+
+@benchmark("GameContext.get_next_event")
+def bench_get_next_event():
+    # Pops events without playing them; a new turn is queued when it runs dry
+    ctx, _ = make_player()
+    return ctx.get_next_event
+
+
+@benchmark("GameContext.reached_end")
+def bench_reached_end():
+    ctx, _ = make_player()
+    return ctx.reached_end
+
+
+@benchmark("Supply.buy")
+def bench_buy():
+    # Buy Silvers, going back to the starting position before the pile runs
+    # out, so every timed buy is legal and the deck stays mid-game sized
+    ctx, player = make_player()
+    start = ctx.snapshot(rng=False)
+
+    def op():
+        if ctx.supply[SILVER] == 1:
+            ctx.restore(start)
+        ctx.supply.buy(SILVER, player)
+
+    return op
+
+
+@benchmark("get_purchasable_cards_as_options")
+def bench_purchasable_options():
+    ctx, player = make_player()
+    return lambda: get_purchasable_cards_as_options(ctx.supply, player)
+
+
+@benchmark("Player.treasure")
+def bench_treasure():
+    _, player = make_player()
+    return lambda: player.treasure
+
+
+@benchmark("Player.compute_score")
+def bench_compute_score():
+    _, player = make_player()
+    return player.compute_score
@@ -0,0 +1,183 @@
+"""A small asv-style benchmark harness. Benchmarks are registered with the
+@benchmark decorator; each is a setup function that builds whatever state the
+operation needs and returns the operation to time, as a function of no
+arguments. The harness calls the operation in timed loops and reports the time
+per call.
+
+Results can be saved as a JSON baseline and compared against later runs, to
+see how an engine change moved each number.
+"""
+
+# Python stdlib
+import fnmatch
+import json
+import platform
+import statistics
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    """Registers a benchmark under name. The decorated function is the setup;
+    it returns the operation to time.
+    """
+
+    def register(setup):
+        if name in BENCHMARKS:
+            raise ValueError(f"benchmark {name!r} is already registered")
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+class Result(NamedTuple):
+    """Timing of one benchmark. ns_per_op is the median over the repeats."""
+
+    name: str
+    ns_per_op: float
+    ops_per_sec: float
+    n_ops: int  # Calls per repeat
+    repeat: int
+
+
+def time_op(op: Callable[[], object], min_time: float = 0.2, repeat: int = 5):
+    """Times op, returning the median time per call in nanoseconds and the
+    number of calls per repeat. Calls per repeat are doubled until a repeat
+    takes at least min_time seconds, as timeit's autorange does.
+    """
+    n = 1
+    while True:
+        tick = time.perf_counter_ns()
+        for _ in range(n):
+            op()
+        elapsed = time.perf_counter_ns() - tick
+        if elapsed >= min_time * 1e9:
+            break
+        n *= 2
+
+    samples = [elapsed / n]
+    for _ in range(repeat - 1):
+        tick = time.perf_counter_ns()
+        for _ in range(n):
+            op()
+        samples.append((time.perf_counter_ns() - tick) / n)
+    return statistics.median(samples), n
+
+
+def run(
+    pattern: str = "*",
+    min_time: float = 0.2,
+    repeat: int = 5,
+    report: Optional[Callable[[Result], None]] = None,
+) -> List[Result]:
+    """Runs the registered benchmarks whose names match pattern (a glob).
+    Each benchmark's setup runs once; its operation is then timed.
+
+    Args:
+        pattern (str): Glob of benchmark names to run.
+        min_time (float): Minimum duration of each repeat, in seconds.
+        repeat (int): Timed repeats per benchmark.
+        report (Callable): Optional callback, given each result as it is done.
+    Returns:
+        (List[Result]) One result per benchmark run, in registration order.
+    """
+    results = []
+    for name, setup in BENCHMARKS.items():
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        ns, n = time_op(setup(), min_time=min_time, repeat=repeat)
+        result = Result(name, ns, 1e9 / ns, n, repeat)
+        results.append(result)
+        if report is not None:
+            report(result)
+    return results
+
+
+def save(results: List[Result], path: str) -> None:
+    """Writes results as a JSON baseline, with the machine they ran on."""
+    data = {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "results": {
+            r.name: {"ns_per_op": r.ns_per_op, "ops_per_sec": r.ops_per_sec}
+            for r in results
+        },
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load(path: str) -> Dict[str, float]:
+    """Reads a JSON baseline, returning the time per op of each benchmark."""
+    with open(path) as f:
+        data = json.load(f)
+    return {name: r["ns_per_op"] for name, r in data["results"].items()}
+
+
+class Change(NamedTuple):
+    """How a benchmark compares to its baseline. ratio is new time over
+    baseline time, so above 1 is slower.
+    """
+
+    name: str
+    ns_per_op: float
+    baseline_ns: Optional[float]
+    ratio: Optional[float]
+
+
+def compare(results: List[Result], baseline: Dict[str, float]) -> List[Change]:
+    """Compares results to a baseline loaded with load()."""
+    changes = []
+    for r in results:
+        base = baseline.get(r.name)
+        ratio = r.ns_per_op / base if base else None
+        changes.append(Change(r.name, r.ns_per_op, base, ratio))
+    return changes
+
+
+def format_ns(ns: float) -> str:
+    """Formats a duration in the most readable unit."""
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def format_report(changes: List[Change], threshold: float = 0.1) -> str:
+    """Formats a comparison as a table. Changes beyond threshold (a fraction)
+    are marked as regressions or improvements.
+    """
+    width = max([len(c.name) for c in changes] + [9])
+    lines = [
+        f"{'benchmark':<{width}}  {'time/op':>10}  {'baseline':>10}  {'change':>8}",
+        "-" * (width + 36),
+    ]
+    for c in changes:
+        if c.ratio is None:
+            base, change, mark = "-", "new", ""
+        else:
+            base, change = format_ns(c.baseline_ns), f"{c.ratio - 1:+.1%}"
+            mark = ""
+            if c.ratio > 1 + threshold:
+                mark = "  REGRESSION"
+            elif c.ratio < 1 / (1 + threshold):
+                mark = "  improved"
+        lines.append(
+            f"{c.name:<{width}}  {format_ns(c.ns_per_op):>10}  {base:>10}  "
+            f"{change:>8}{mark}"
+        )
+    return "\n".join(lines)
+
+
+def regressions(changes: List[Change], threshold: float = 0.1) -> List[Change]:
+    """Returns the changes that are slower than their baseline by more than
+    threshold (a fraction).
+    """
+    return [c for c in changes if c.ratio is not None and c.ratio > 1 + threshold]
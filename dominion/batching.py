@@ -0,0 +1,159 @@
+"""Dynamic batching of model inference. Many games, each running in its own
+thread, ask for predictions on a few rows at a time; per-call overhead of a
+model dwarfs the math for batches that small. An InferenceBatcher collects the
+requests of every caller and serves them with one predict call, made as soon
+as either enough rows are waiting or the oldest request has waited long enough.
+Each caller gets back the rows of the result that belong to it.
+
+Intended usage:
+    batcher = InferenceBatcher(model.predict, max_batch_size=512, max_delay_ms=2)
+    policy = BatchedPolicy(QLearningPolicy(model, raw_state_cb), batcher)
+    ...  # Play games in several threads, each with its own BatchedPolicy
+    batcher.close()
+"""
+
+# Python stdlib
+import threading
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+
+class _Request:
+    """Rows waiting for a prediction, and where the result goes."""
+
+    __slots__ = ("rows", "time", "done", "result", "error")
+
+    def __init__(self, rows: np.ndarray) -> None:
+        self.rows = rows
+        self.time = time.perf_counter()
+        self.done = threading.Event()
+        self.result: Optional[np.ndarray] = None
+        self.error: Optional[BaseException] = None
+
+
+class InferenceBatcher:
+    def __init__(
+        self,
+        predict: Callable[[np.ndarray], np.ndarray],
+        max_batch_size: int = 256,
+        max_delay_ms: float = 2.0,
+    ) -> None:
+        """Starts a batcher, with a thread that makes the batched calls.
+
+        Args:
+            predict (Callable): The batched function, e.g. a Keras model's
+                predict. Given rows stacked along the first axis, it returns
+                one output per row.
+            max_batch_size (int): A batch is run as soon as this many rows
+                are waiting. Requests are never split, so one request larger
+                than this is run as a batch of its own.
+            max_delay_ms (float): The longest a request waits for others to
+                join its batch, in milliseconds.
+        """
+        self.predict_batch = predict
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000
+
+        self.n_batches = 0  # Batched calls made so far
+        self.n_rows = 0  # Rows predicted so far
+
+        self._requests: List[_Request] = []
+        self._n_waiting = 0  # Rows in self._requests
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.n_rows / self.n_batches if self.n_batches else 0.0
+
+    def predict(self, rows) -> np.ndarray:
+        """Predicts rows as part of a batch. Blocks until the batch has run;
+        safe to call from any number of threads.
+
+        Args:
+            rows (array-like): Inputs stacked along the first axis.
+        Returns:
+            (np.ndarray) The outputs for these rows only.
+        Raises:
+            RuntimeError: If the batcher has been closed.
+            Exception: Whatever the batched function raised, if it failed.
+        """
+        request = _Request(np.asarray(rows))
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("inference batcher is closed")
+            self._requests.append(request)
+            self._n_waiting += len(request.rows)
+            self._cond.notify()
+
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _serve(self) -> None:
+        """Runs in the batcher's thread: waits for each batch to fill or time
+        out, then runs it.
+        """
+        while True:
+            with self._cond:
+                while not self._requests and not self._closed:
+                    self._cond.wait()
+                if not self._requests:
+                    return  # Closed, and nothing left to serve
+
+                deadline = self._requests[0].time + self.max_delay
+                while self._n_waiting < self.max_batch_size and not self._closed:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                # Take the oldest requests that fit in one batch
+                n_rows, n_requests = 0, 0
+                for request in self._requests:
+                    if n_requests and n_rows + len(request.rows) > self.max_batch_size:
+                        break
+                    n_rows += len(request.rows)
+                    n_requests += 1
+                batch = self._requests[:n_requests]
+                del self._requests[:n_requests]
+                self._n_waiting -= n_rows
+
+            self._run(batch)
+
+    def _run(self, batch: List[_Request]) -> None:
+        """Helper that makes one batched call and hands out the results."""
+        try:
+            outputs = self.predict_batch(np.concatenate([r.rows for r in batch]))
+            start = 0
+            for request in batch:
+                end = start + len(request.rows)
+                request.result = outputs[start:end]
+                start = end
+            self.n_batches += 1
+            self.n_rows += start
+        except Exception as e:
+            for request in batch:
+                request.error = e
+        for request in batch:
+            request.done.set()
+
+    def close(self) -> None:
+        """Serves any requests still waiting, then stops the batcher's
+        thread. Later calls to predict() raise.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def __enter__(self) -> "InferenceBatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -6,18 +6,13 @@ your hand onto your deck.
 import dominion.util.logging as logging
 from dominion.cards import ActionCard
 from dominion.common import DeckPile, QueuePosition
-from dominion.events import Event, clear_events_ahead_of_self
-from dominion.util.prettyprint import card_to_str, hand_to_str, options_to_str
+from dominion.events import Decision, Event, clear_events_ahead_of_self
+from dominion.util.message import Message
+from dominion.util.prettyprint import hand_to_str, options_to_str
 
 
 def get_buy_options(supply):
-    value = 5
-    options = {}
-    for idx, card in enumerate(supply):
-        left = supply[card]
-        if card.cost <= value and left > 0:
-            options[idx] = card.name
-    return options
+    return supply.options(5)
 
 
 def get_place_options(hand):
@@ -35,34 +30,48 @@ class ArtisanEvent(Event):
             clear_events_ahead_of_self(game_ctx, self)
             return
 
-        player.show(options_to_str(options))
+        player.show(Message(options_to_str, options))
         prompt_str = "Gain a card costing up to (5)"
-        c = player.get_input(prompt_str, options, allow_skip=True)
+        c = yield Decision(player, prompt_str, options, allow_skip=True)
         if c == "Skip":
             return
 
         card = game_ctx.supply.buy(c, player, free=True, to_pile=DeckPile.HAND)
-        logging.log(
+        game_ctx.log(
             [logging.GAME, logging.OBSERVER],
-            f"{player.name} acquired {card_to_str(card)}",
+            Message(
+                "{} acquired {}", player.name, card, kind="gain", player=player.name
+            ),
         )
 
-        player.show(hand_to_str(player.hand))
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
         options = get_place_options(player.hand)
         prompt_str = "Put a card from your hand onto your deck"
-        c = player.get_input(prompt_str, options, allow_skip=False)
+        c = yield Decision(player, prompt_str, options, allow_skip=False)
 
         card = player.hand[c]
         player.deck.move([card], from_pile=DeckPile.HAND, to_pile=DeckPile.DRAW)
 
-        logging.log(
+        game_ctx.log(
             logging.OBSERVER,
-            f"{player.name} moved a card from their hand to their deck",
+            Message(
+                "{} moved a card from their hand to their deck",
+                player.name,
+                kind="topdeck",
+                player=player.name,
+            ),
         )
 
-        logging.log(
+        game_ctx.log(
             logging.GAME,
-            f"{player.name} moved {card_to_str(card)} from their hand to their deck",
+            Message(
+                "{} moved {} from their hand to their deck",
+                player.name,
+                card,
+                kind="topdeck",
+                player=player.name,
+            ),
         )
 
 
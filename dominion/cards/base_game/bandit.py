@@ -6,13 +6,9 @@ trashes a revealed treasure other than Copper, and discards the rest.
 import dominion.util.logging as logging
 from dominion.cards import ActionAttackCard
 from dominion.common import DeckPile, QueuePosition
-from dominion.events import Event
-from dominion.util.prettyprint import (
-    card_to_str,
-    cards_to_str,
-    hand_to_str,
-    options_to_str,
-)
+from dominion.events import Decision, Event
+from dominion.util.message import Message
+from dominion.util.prettyprint import cards_to_str, hand_to_str, options_to_str
 
 from .gold import GOLD
 from .moat import MOAT
@@ -40,54 +36,86 @@ class BanditEventSelf(Event):
     def forward(self, game_ctx, player):
         if game_ctx.supply[GOLD] > 0:
             game_ctx.supply.buy(GOLD, player, free=True, to_pile=DeckPile.DISCARD)
-            logging.log(
+            game_ctx.log(
                 [logging.GAME, logging.OBSERVER],
-                f"{player.name} acquired a {card_to_str(GOLD)}",
+                Message(
+                    "{} acquired a {}",
+                    player.name,
+                    GOLD,
+                    kind="gain",
+                    player=player.name,
+                ),
             )
         else:
             player.show("There are no more Golds in the Supply.")
-            logging.log(
+            game_ctx.log(
                 [logging.GAME, logging.OBSERVER],
-                f"{player.name} cannot acquire a a {card_to_str(GOLD)}, as there are no more in the Supply.",
+                Message(
+                    "{} cannot acquire a a {}, as there are no more in the Supply.",
+                    player.name,
+                    GOLD,
+                    kind="no_gain",
+                    player=player.name,
+                ),
             )
 
 
 class BanditEventOther(Event):
     def forward(self, game_ctx, player):
         if MOAT in player.hand:
-            player.show(hand_to_str(player.hand))
+            if player.show_enabled:
+                player.show(Message(hand_to_str, tuple(player.hand)))
 
             options = get_reaction_options(player.hand)
             prompt_str = (
                 "You may reveal a Moat from your hand to be unaffected by this attack"
             )
-            c = player.get_input(prompt_str, options, allow_skip=True)
+            c = yield Decision(player, prompt_str, options, allow_skip=True)
             if c is not "Skip":
                 card = player.hand[c]
-                logging.log(
+                game_ctx.log(
                     [logging.GAME, logging.OBSERVER],
-                    f"{player.name} reveals a {card_to_str(card)}, defending themselves!",
+                    Message(
+                        "{} reveals a {}, defending themselves!",
+                        player.name,
+                        card,
+                        kind="defend",
+                        player=player.name,
+                    ),
                 )
                 return
 
         top_cards = player.deck.draw_cards(n=2, to_caller=True)
-        logging.log(
-            [logging.GAME, logging.OBSERVER],
-            f"{player.name} reveals top two cards: {cards_to_str(top_cards)}",
-        )
+        if game_ctx.log_enabled:
+            game_ctx.log(
+                [logging.GAME, logging.OBSERVER],
+                Message(
+                    "{} reveals top two cards: {}",
+                    player.name,
+                    Message(cards_to_str, tuple(top_cards)),
+                    kind="reveal",
+                    player=player.name,
+                ),
+            )
 
         if any(treasure in top_cards for treasure in [GOLD, SILVER]):
             options = get_treasures_as_options(top_cards)
-            player.show(options_to_str(options))
+            player.show(Message(options_to_str, options))
             prompt_str = "You must trash a treasure other than Copper"
-            c = player.get_input(prompt_str, options, allow_skip=False)
+            c = yield Decision(player, prompt_str, options, allow_skip=False)
 
             # By not adding the card to discard, it's implicitly trashed.
             # Add will update counts
-            del top_cards[c]
-            logging.log(
+            trashed = top_cards.pop(c)
+            game_ctx.log(
                 [logging.GAME, logging.OBSERVER],
-                f"{player.name} trashes {options[c]}",
+                Message(
+                    "{} trashes {}",
+                    player.name,
+                    trashed,
+                    kind="trash",
+                    player=player.name,
+                ),
             )
 
         player.deck.add(top_cards, to_pile=DeckPile.DISCARD)
@@ -7,8 +7,9 @@ no Victory cards).
 import dominion.util.logging as logging
 from dominion.cards import ActionAttackCard
 from dominion.common import CardType, DeckPile, QueuePosition
-from dominion.events import Event
-from dominion.util.prettyprint import card_to_str, hand_to_str
+from dominion.events import Decision, Event
+from dominion.util.message import Message
+from dominion.util.prettyprint import hand_to_str
 
 from .moat import MOAT
 from .silver import SILVER
@@ -34,54 +35,87 @@ class BureaucratEventSelf(Event):
     def forward(self, game_ctx, player):
         if game_ctx.supply[SILVER] > 0:
             game_ctx.supply.buy(SILVER, player, free=True, to_pile=DeckPile.DRAW)
-            logging.log(
+            game_ctx.log(
                 [logging.GAME, logging.OBSERVER],
-                f"{player.name} acquired a {card_to_str(SILVER)}",
+                Message(
+                    "{} acquired a {}",
+                    player.name,
+                    SILVER,
+                    kind="gain",
+                    player=player.name,
+                ),
             )
         else:
             player.show("There are no more Silvers.")
-            logging.log(
+            game_ctx.log(
                 [logging.GAME, logging.OBSERVER],
-                f"{player.name} cannot acquire a a {card_to_str(SILVER)}, as there are no more in the Supply.",
+                Message(
+                    "{} cannot acquire a a {}, as there are no more in the Supply.",
+                    player.name,
+                    SILVER,
+                    kind="no_gain",
+                    player=player.name,
+                ),
             )
 
 
 class BureaucratEventOther(Event):
     def forward(self, game_ctx, player):
         if MOAT in player.hand:
-            player.show(hand_to_str(player.hand))
+            if player.show_enabled:
+                player.show(Message(hand_to_str, tuple(player.hand)))
 
             options = get_reaction_options(player.hand)
             prompt_str = (
                 "You may reveal a Moat from your hand to be unaffected by this attack"
             )
-            c = player.get_input(prompt_str, options, allow_skip=True)
+            c = yield Decision(player, prompt_str, options, allow_skip=True)
             if c is not "Skip":
                 card = player.hand[c]
-                logging.log(
+                game_ctx.log(
                     [logging.GAME, logging.OBSERVER],
-                    f"{player.name} reveals a {card_to_str(card)}, defending themselves!",
+                    Message(
+                        "{} reveals a {}, defending themselves!",
+                        player.name,
+                        card,
+                        kind="defend",
+                        player=player.name,
+                    ),
                 )
                 return
 
         # Player must reveal a Victory card, or a hand with no Victory cards
-        player.show(hand_to_str(player.hand))
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
         options = get_victory_card_options(player.hand)
 
         if not options:
-            logging.log(
-                [logging.GAME, logging.OBSERVER],
-                f"{player.name} reveals hand, with no Victory cards: {hand_to_str(player.hand)}",
-            )
+            if game_ctx.log_enabled:
+                game_ctx.log(
+                    [logging.GAME, logging.OBSERVER],
+                    Message(
+                        "{} reveals hand, with no Victory cards: {}",
+                        player.name,
+                        Message(hand_to_str, tuple(player.hand)),
+                        kind="reveal",
+                        player=player.name,
+                    ),
+                )
         else:
             prompt_str = (
                 "Reveal a Victory card from your hand and put it onto your deck"
             )
-            c = player.get_input(prompt_str, options, allow_skip=False)
+            c = yield Decision(player, prompt_str, options, allow_skip=False)
             card = player.hand[c]
-            logging.log(
+            game_ctx.log(
                 [logging.GAME, logging.OBSERVER],
-                f"{player.name} reveals a {card_to_str(card)} and places it on top of their deck.",
+                Message(
+                    "{} reveals a {} and places it on top of their deck.",
+                    player.name,
+                    card,
+                    kind="topdeck",
+                    player=player.name,
+                ),
             )
             player.deck.move([card], from_pile=DeckPile.HAND, to_pile=DeckPile.DRAW)
 
@@ -4,7 +4,8 @@
 # From dominion module
 from dominion.cards import ActionCard
 from dominion.common import DeckPile, QueuePosition
-from dominion.events import Event
+from dominion.events import Decision, Event
+from dominion.util.message import Message
 from dominion.util.prettyprint import hand_to_str
 
 
@@ -18,13 +19,14 @@ def get_discard_options(hand, already_discarded):
 
 class CellarEvent(Event):
     def forward(self, game_ctx, player):
-        player.show(hand_to_str(player.hand))
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
 
         marked_for_discard = []
         while len(marked_for_discard) < len(player.hand):
             options = get_discard_options(player.hand, marked_for_discard)
             prompt_str = "You may discard a card from your hand"
-            c = player.get_input(prompt_str, options, allow_skip=True)
+            c = yield Decision(player, prompt_str, options, allow_skip=True)
             if c == "Skip":
                 break
 
@@ -35,7 +37,8 @@ class CellarEvent(Event):
             marked_for_discard, from_pile=DeckPile.HAND, to_pile=DeckPile.DISCARD
         )
         player.deck.draw_cards(n=len(marked_for_discard), replace_hand=False)
-        player.show(hand_to_str(player.hand))
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
 
 
 class Cellar(ActionCard):
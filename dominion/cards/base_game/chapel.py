@@ -3,7 +3,7 @@
 
 from dominion.cards import ActionCard
 from dominion.common import QueuePosition, DeckPile
-from dominion.events import Event, get_all_as_options
+from dominion.events import Decision, Event, get_all_as_options
 
 
 class ChapelEvent(Event):
@@ -11,7 +11,7 @@ class ChapelEvent(Event):
         for i in range(4):
             options = get_all_as_options(player.hand)
             prompt_str = "Choose a card to trash ({}/4)".format(i + 1)
-            c = player.get_input(prompt_str, options, allow_skip=True)
+            c = yield Decision(player, prompt_str, options, allow_skip=True)
 
             if c == "Skip":
                 break
@@ -8,7 +8,7 @@ from dominion.events import Event, PlayActionEvent, BuyEvent
 
 class FestivalEvent(Event):
     def forward(self, game_ctx, player):
-        player.set_modifier("extra_treasure", lambda v: v + 2)
+        player.turn.coins += 2
 
 
 class Festival(ActionCard):
@@ -5,14 +5,17 @@ card from it onto your deck.
 # From dominion module
 from dominion.cards import ActionCard
 from dominion.common import DeckPile, QueuePosition
-from dominion.events import Event, PlayActionEvent
+from dominion.events import Decision, Event, PlayActionEvent
+from dominion.util.message import Message
 from dominion.util.prettyprint import cards_to_str
 
 
 class HarbingerEvent(Event):
     def forward(self, game_ctx, player):
         player.deck.draw_cards(n=1, replace_hand=False)
-        player.show(cards_to_str(player.deck.discard_pile, header="Discard pile"))
+        if player.show_enabled:
+            discard_pile = tuple(player.deck.discard_pile)
+            player.show(Message(cards_to_str, discard_pile, "Discard pile"))
         options = {i: card.name for i, card in enumerate(player.deck.discard_pile)}
 
         if not options:
@@ -20,7 +23,7 @@ class HarbingerEvent(Event):
             return
 
         prompt_str = "You may put a card from your discard pile onto your deck"
-        c = player.get_input(prompt_str, options, allow_skip=True)
+        c = yield Decision(player, prompt_str, options, allow_skip=True)
         if c == "Skip":
             return
 
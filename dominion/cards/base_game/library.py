@@ -5,27 +5,36 @@ choose to; set those aside, discarding them afterwards.
 # From dominion module
 from dominion.cards import ActionCard
 from dominion.common import DeckPile, QueuePosition
-from dominion.events import Event
+from dominion.events import Decision, Event
 from dominion.util.cardfuncs import is_action_card
+from dominion.util.message import Message
 from dominion.util.prettyprint import hand_to_str, options_to_str
 
 
 class LibraryEvent(Event):
     def forward(self, game_ctx, player):
+        set_aside = []
         while len(player.hand) < 7:
-            next_card = player.deck.draw_cards(n=1, to_caller=True)[0]
+            drawn = player.deck.draw_cards(n=1, to_caller=True)
+            if not drawn:
+                break  # No cards left to draw
+
+            next_card = drawn[0]
             if is_action_card(next_card):
                 options = {1: next_card.name}
-                player.show(options_to_str(options))
+                player.show(Message(options_to_str, options))
                 prompt_str = "You may add this card to your hand"
-                c = player.get_input(prompt_str, options, allow_skip=True)
+                c = yield Decision(player, prompt_str, options, allow_skip=True)
                 if c == "Skip":
-                    # Add to discard
-                    player.deck.add([next_card], to_pile=DeckPile.DISCARD)
+                    set_aside.append(next_card)
+                    continue
 
             player.deck.add([next_card], to_pile=DeckPile.HAND)
 
-        player.show(hand_to_str(player.hand))
+        # Discard the set aside cards
+        player.deck.add(set_aside, to_pile=DeckPile.DISCARD)
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
 
 
 class Library(ActionCard):
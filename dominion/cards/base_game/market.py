@@ -9,7 +9,7 @@ from dominion.events import Event, PlayActionEvent, BuyEvent
 class MarketEvent(Event):
     def forward(self, game_ctx, player):
         player.deck.draw_cards(n=1, replace_hand=False)
-        player.set_modifier("extra_treasure", lambda v: v + 1)
+        player.turn.coins += 1
 
 
 class Market(ActionCard):
@@ -14,7 +14,7 @@ class MerchantEvent(Event):
         player.deck.draw_cards(n=1, replace_hand=False)
 
         if SILVER in player.hand:
-            player.set_modifier("extra_treasure", lambda v: v + 1)
+            player.turn.coins += 1
 
 
 class Merchant(ActionCard):
@@ -5,13 +5,9 @@
 import dominion.util.logging as logging
 from dominion.cards import ActionAttackCard
 from dominion.common import DeckPile, QueuePosition
-from dominion.events import Event
-from dominion.util.prettyprint import (
-    card_to_str,
-    cards_to_str,
-    hand_to_str,
-    options_to_str,
-)
+from dominion.events import Decision, Event
+from dominion.util.message import Message
+from dominion.util.prettyprint import cards_to_str, hand_to_str, options_to_str
 
 from .moat import MOAT
 
@@ -33,50 +29,75 @@ def get_discard_options(hand, already_discarded):
 
 class MilitiaEventSelf(Event):
     def forward(self, game_ctx, player):
-        player.set_modifier("extra_treasure", lambda v: v + 2)
+        player.turn.coins += 2
 
 
 class MilitiaEventOther(Event):
     def forward(self, game_ctx, player):
         if MOAT in player.hand:
-            player.show(hand_to_str(player.hand))
+            if player.show_enabled:
+                player.show(Message(hand_to_str, tuple(player.hand)))
 
             options = get_reaction_options(player.hand)
             prompt_str = (
                 "You may reveal a Moat from your hand to be unaffected by this attack"
             )
-            c = player.get_input(prompt_str, options, allow_skip=True)
+            c = yield Decision(player, prompt_str, options, allow_skip=True)
             if c is not "Skip":
                 card = player.hand[c]
-                logging.log(
+                game_ctx.log(
                     [logging.GAME, logging.OBSERVER],
-                    f"{player.name} reveals a {card_to_str(card)}, defending themselves!",
+                    Message(
+                        "{} reveals a {}, defending themselves!",
+                        player.name,
+                        card,
+                        kind="defend",
+                        player=player.name,
+                    ),
                 )
                 return
 
         # Discard down to three cards in hand
-        player.show(hand_to_str(player.hand))
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
 
         marked_for_discard = []
         while len(player.hand) - len(marked_for_discard) > 3:
             options = get_discard_options(player.hand, marked_for_discard)
-            player.show(options_to_str(options))
+            player.show(Message(options_to_str, options))
             prompt_str = "Choose a card to discard"
-            c = player.get_input(prompt_str, options, allow_skip=False)
+            c = yield Decision(player, prompt_str, options, allow_skip=False)
             marked_for_discard.append(c)
 
         to_discard = [player.hand[c] for c in marked_for_discard]
         player.deck.move(to_discard, from_pile=DeckPile.HAND, to_pile=DeckPile.DISCARD)
 
-        player.show(hand_to_str(player.hand))
-        logging.log(
-            logging.OBSERVER,
-            f"{player.name} discarded {len(to_discard)} card{'' if len(to_discard) == 1 else 's'}",
-        )
-        logging.log(
-            logging.GAME,
-            f"{player.name} discarded {len(to_discard)} card{'' if len(to_discard) == 1 else 's'}: {cards_to_str(to_discard)}",
-        )
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
+        if game_ctx.log_enabled:
+            game_ctx.log(
+                logging.OBSERVER,
+                Message(
+                    "{} discarded {} card{}",
+                    player.name,
+                    len(to_discard),
+                    "" if len(to_discard) == 1 else "s",
+                    kind="discard",
+                    player=player.name,
+                ),
+            )
+            game_ctx.log(
+                logging.GAME,
+                Message(
+                    "{} discarded {} card{}: {}",
+                    player.name,
+                    len(to_discard),
+                    "" if len(to_discard) == 1 else 's',
+                    Message(cards_to_str, tuple(to_discard)),
+                    kind="discard",
+                    player=player.name,
+                ),
+            )
 
 
 class Militia(ActionAttackCard):
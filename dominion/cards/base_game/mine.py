@@ -6,8 +6,9 @@ costing up to (3) more than it.
 import dominion.util.logging as logging
 from dominion.cards import ActionCard
 from dominion.common import CardType, DeckPile, QueuePosition
-from dominion.events import Event, clear_events_ahead_of_self
-from dominion.util.prettyprint import card_to_str, hand_to_str, options_to_str
+from dominion.events import Decision, Event, clear_events_ahead_of_self
+from dominion.util.message import Message
+from dominion.util.prettyprint import hand_to_str, options_to_str
 
 
 def get_treasures_as_options(cards):
@@ -35,7 +36,8 @@ class MineEvent(Event):
         and gain a treasure costing up to (3) more than it.
         """
 
-        player.show(hand_to_str(player.hand))
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
 
         options = get_treasures_as_options(player.hand)
         if not options:
@@ -45,7 +47,7 @@ class MineEvent(Event):
             return
 
         prompt_str = "Choose a treasure to trash from your hand"
-        c = player.get_input(prompt_str, options, allow_skip=True)
+        c = yield Decision(player, prompt_str, options, allow_skip=True)
         if c == "Skip":
             return
 
@@ -54,16 +56,23 @@ class MineEvent(Event):
         player.deck.trash([to_trash])
         options = get_eligible_treasures_as_options(game_ctx.supply, new_value)
 
-        player.show(options_to_str(options))
+        player.show(Message(options_to_str, options))
         prompt_str = f"Gain a treasure to costing up to ({new_value})"
-        c = player.get_input(prompt_str, options, allow_skip=True)
+        c = yield Decision(player, prompt_str, options, allow_skip=True)
         if c == "Skip":
             return
 
         card = game_ctx.supply.buy(c, player, free=True)
-        logging.log(
+        game_ctx.log(
             [logging.GAME, logging.OBSERVER],
-            f"{player.name} trashed {card_to_str(to_trash)} and acquired a {card_to_str(card)}.",
+            Message(
+                "{} trashed {} and acquired a {}.",
+                player.name,
+                to_trash,
+                card,
+                kind="upgrade",
+                player=player.name,
+            ),
         )
 
 
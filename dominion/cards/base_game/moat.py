@@ -8,13 +8,15 @@ reveal this from your hand, to be unaffected by it.
 from dominion.cards import ActionReactionCard
 from dominion.common import QueuePosition
 from dominion.events import Event
+from dominion.util.message import Message
 from dominion.util.prettyprint import hand_to_str
 
 
 class MoatEvent(Event):
     def forward(self, game_ctx, player):
         player.deck.draw_cards(n=2, replace_hand=False)
-        player.show(hand_to_str(player.hand))
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
 
 
 class Moat(ActionReactionCard):
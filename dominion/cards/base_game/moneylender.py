@@ -5,7 +5,8 @@
 import dominion.util.logging as logging
 from dominion.cards import ActionCard
 from dominion.common import QueuePosition
-from dominion.events import Event, clear_events_ahead_of_self
+from dominion.events import Decision, Event, clear_events_ahead_of_self
+from dominion.util.message import Message
 from dominion.util.prettyprint import hand_to_str
 
 
@@ -19,7 +20,8 @@ def get_options(hand):
 
 class MoneylenderEvent(Event):
     def forward(self, game_ctx, player):
-        player.show(hand_to_str(player.hand))
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
 
         options = get_options(player.hand)
         if not options:
@@ -29,17 +31,23 @@ class MoneylenderEvent(Event):
             return
 
         prompt_str = "Choose a Copper to trash from your hand"
-        c = player.get_input(prompt_str, options, allow_skip=True)
+        c = yield Decision(player, prompt_str, options, allow_skip=True)
         if c == "Skip":
             return
 
         to_trash = player.hand[c]
         player.deck.trash([to_trash])
-        player.set_modifier("extra_treasure", lambda v: v + 3)
+        player.turn.coins += 3
 
-        logging.log(
+        game_ctx.log(
             [logging.GAME, logging.OBSERVER],
-            f"{player.name} trashed a Copper to get (+3)",
+            Message(
+                "{} trashed a {} to get (+3)",
+                player.name,
+                to_trash,
+                kind="trash",
+                player=player.name,
+            ),
         )
 
 
@@ -4,7 +4,8 @@
 # From dominion module
 from dominion.cards import ActionCard
 from dominion.common import DeckPile, QueuePosition
-from dominion.events import Event, PlayActionEvent
+from dominion.events import Decision, Event, PlayActionEvent
+from dominion.util.message import Message
 from dominion.util.prettyprint import hand_to_str, options_to_str
 
 
@@ -18,23 +19,23 @@ def get_options(cards, already_chosen):
 class PoacherEvent(Event):
     def forward(self, game_ctx, player):
         player.deck.draw_cards(n=1, replace_hand=False)
-        num_empty_piles = 0
-        for card in game_ctx.supply:
-            if game_ctx.supply[card] == 0:
-                num_empty_piles += 1
+        num_empty_piles = game_ctx.supply.n_empty
 
         are_str = "is" if num_empty_piles == 1 else "are"
         piles_str = "pile" if num_empty_piles == 1 else "piles"
         player.show(f"There {are_str} {num_empty_piles} empty supply {piles_str}")
 
+        # Discard a card per empty pile, or the whole hand if it is smaller
+        num_to_discard = min(num_empty_piles, len(player.hand))
         marked_for_discard = []
-        player.show(hand_to_str(player.hand))
-        while len(marked_for_discard) < num_empty_piles:
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
+        while len(marked_for_discard) < num_to_discard:
             options = get_options(player.hand, marked_for_discard)
-            player.show(options_to_str(options))
+            player.show(Message(options_to_str, options))
 
             prompt_str = "Discard a card per empty supply pile"
-            c = player.get_input(prompt_str, options, allow_skip=False)
+            c = yield Decision(player, prompt_str, options, allow_skip=False)
             marked_for_discard.append(c)
 
         player.deck.move(
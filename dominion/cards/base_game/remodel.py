@@ -6,8 +6,9 @@ than it.
 import dominion.util.logging as logging
 from dominion.cards import ActionCard
 from dominion.common import QueuePosition
-from dominion.events import Event, clear_events_ahead_of_self
-from dominion.util.prettyprint import card_to_str, hand_to_str, options_to_str
+from dominion.events import Decision, Event, clear_events_ahead_of_self
+from dominion.util.message import Message
+from dominion.util.prettyprint import hand_to_str, options_to_str
 
 
 def get_trash_options(hand):
@@ -16,17 +17,13 @@ def get_trash_options(hand):
 
 
 def get_buy_options(supply, value):
-    options = {}
-    for idx, card in enumerate(supply):
-        left = supply[card]
-        if card.cost <= value and left > 0:
-            options[idx] = card.name
-    return options
+    return supply.options(value)
 
 
 class RemodelEvent(Event):
     def forward(self, game_ctx, player):
-        player.show(hand_to_str(player.hand))
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
 
         options = get_trash_options(player.hand)
         if not options:
@@ -36,7 +33,7 @@ class RemodelEvent(Event):
             return
 
         prompt_str = "Choose a card to trash from your hand"
-        c = player.get_input(prompt_str, options, allow_skip=True)
+        c = yield Decision(player, prompt_str, options, allow_skip=True)
         if c == "Skip":
             return
 
@@ -46,16 +43,23 @@ class RemodelEvent(Event):
         player.deck.trash([to_trash])
         options = get_buy_options(game_ctx.supply, new_value)
 
-        player.show(options_to_str(options))
+        player.show(Message(options_to_str, options))
         prompt_str = f"Gain a card costing up to ({new_value})"
-        c = player.get_input(prompt_str, options, allow_skip=True)
+        c = yield Decision(player, prompt_str, options, allow_skip=True)
         if c == "Skip":
             return
 
         card = game_ctx.supply.buy(c, player, free=True)
-        logging.log(
+        game_ctx.log(
             [logging.GAME, logging.OBSERVER],
-            f"{player.name} trashed {card_to_str(to_trash)} and acquired {card_to_str(card)}.",
+            Message(
+                "{} trashed {} and acquired {}.",
+                player.name,
+                to_trash,
+                card,
+                kind="upgrade",
+                player=player.name,
+            ),
         )
 
 
@@ -4,7 +4,8 @@ and/or discard any number of them. Put the rest back on top in any order.
 
 from dominion.cards import ActionCard
 from dominion.common import DeckPile, QueuePosition
-from dominion.events import Event, PlayActionEvent
+from dominion.events import Decision, Event, PlayActionEvent
+from dominion.util.message import Message
 from dominion.util.prettyprint import cards_to_str
 
 
@@ -21,13 +22,14 @@ class SentryEvent(Event):
 
         # Look at the top 2 cards of your deck
         cards = player.deck.draw_cards(n=2, to_caller=True)
-        player.show(cards_to_str(cards))
+        if player.show_enabled:
+            player.show(Message(cards_to_str, tuple(cards)))
 
         marked_for_trash = []
         while len(cards) - len(marked_for_trash) > 0:
             options = get_options(cards, marked_for_trash)
             prompt_str = "Trash any number of cards"
-            c = player.get_input(prompt_str, options, allow_skip=True)
+            c = yield Decision(player, prompt_str, options, allow_skip=True)
             if c == "Skip":
                 break
             else:
@@ -36,14 +38,14 @@ class SentryEvent(Event):
         cards = [card for idx, card in enumerate(cards) if idx not in marked_for_trash]
         # Not added back to deck -> automatically trashed
 
-        if cards:
-            player.show(cards_to_str(cards, header="After trashing"))
+        if cards and player.show_enabled:
+            player.show(Message(cards_to_str, tuple(cards), "After trashing"))
 
         marked_for_discard = []
         while len(cards) - len(marked_for_discard) > 0:
             options = get_options(cards, marked_for_discard)
             prompt_str = "Discard any number of cards"
-            c = player.get_input(prompt_str, options, allow_skip=True)
+            c = yield Decision(player, prompt_str, options, allow_skip=True)
             if c == "Skip":
                 break
             else:
@@ -55,13 +57,13 @@ class SentryEvent(Event):
         ]
         player.deck.add(to_discard, to_pile=DeckPile.DISCARD)
 
-        if cards:
-            player.show(cards_to_str(cards, header="After discarding"))
+        if cards and player.show_enabled:
+            player.show(Message(cards_to_str, tuple(cards), "After discarding"))
 
         if len(cards) > 1:
             options = {idx: card.name for idx, card in enumerate(cards)}
             prompt_str = "Choose first card to put back on draw pile"
-            c = player.get_input(prompt_str, options, allow_skip=False)
+            c = yield Decision(player, prompt_str, options, allow_skip=False)
 
             card = cards.pop(c)
             player.deck.add([card], to_pile=DeckPile.DRAW)
@@ -5,9 +5,10 @@
 import dominion.util.logging as logging
 from dominion.cards import ActionCard
 from dominion.common import DeckPile, QueuePosition
-from dominion.events import Event, clear_events_ahead_of_self
+from dominion.events import Decision, Event, clear_events_ahead_of_self
 from dominion.util.cardfuncs import is_action_card
-from dominion.util.prettyprint import card_to_str, hand_to_str
+from dominion.util.message import Message
+from dominion.util.prettyprint import hand_to_str
 
 
 def get_actions_as_options(hand):
@@ -21,7 +22,8 @@ def get_actions_as_options(hand):
 
 class ThroneRoomEvent(Event):
     def forward(self, game_ctx, player):
-        player.show(hand_to_str(player.hand))
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
 
         options = get_actions_as_options(player.hand)
         if not options:
@@ -31,20 +33,26 @@ class ThroneRoomEvent(Event):
             return
 
         prompt_str = "Choose an action to play twice"
-        c = player.get_input(prompt_str, options, allow_skip=True)
+        c = yield Decision(player, prompt_str, options, allow_skip=True)
         if c == "Skip":
             return
 
         action_card = player.hand[c]
         for _ in range(2):
-            action_card.play(game_ctx, player)
+            game_ctx.play_card(action_card, player)
         player.deck.move(
             [action_card], from_pile=DeckPile.HAND, to_pile=DeckPile.PLAYED
         )
 
-        logging.log(
+        game_ctx.log(
             [logging.GAME, logging.OBSERVER],
-            f"{player.name} plays {card_to_str(action_card)} twice.",
+            Message(
+                "{} plays {} twice.",
+                player.name,
+                action_card,
+                kind="play",
+                player=player.name,
+            ),
         )
 
 
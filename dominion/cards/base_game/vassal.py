@@ -6,40 +6,62 @@ play it.
 import dominion.util.logging as logging
 from dominion.cards import ActionCard
 from dominion.common import DeckPile, QueuePosition
-from dominion.events import Event
+from dominion.events import Decision, Event
 from dominion.util.cardfuncs import is_action_card
-from dominion.util.prettyprint import card_to_str, options_to_str
+from dominion.util.message import Message
+from dominion.util.prettyprint import options_to_str
 
 
 class VassalEvent(Event):
     def forward(self, game_ctx, player):
-        player.set_modifier("extra_treasure", lambda v: v + 2)
+        player.turn.coins += 2
 
-        top_card = player.deck.draw_cards(n=1, to_caller=True)[0]
+        drawn = player.deck.draw_cards(n=1, to_caller=True)
+        if not drawn:
+            return  # No cards left to discard
+
+        top_card = drawn[0]
         if is_action_card(top_card):
             options = {1: top_card.name}
-            player.show(options_to_str(options))
+            player.show(Message(options_to_str, options))
             prompt_str = "You may play the action"
-            c = player.get_input(prompt_str, options, allow_skip=True)
+            c = yield Decision(player, prompt_str, options, allow_skip=True)
             if c == "Skip":
                 return
 
-            logging.log(
+            game_ctx.log(
                 [logging.OBSERVER, logging.GAME],
-                f"{player.name} plays the top card of their deck, {card_to_str(top_card)}.",
+                Message(
+                    "{} plays the top card of their deck, {}.",
+                    player.name,
+                    top_card,
+                    kind="play",
+                    player=player.name,
+                ),
             )
-            top_card.play(game_ctx, player)
+            game_ctx.play_card(top_card, player)
 
         # TODO: test more thoroughly
         player.deck.add([top_card], to_pile=DeckPile.DISCARD)
-        logging.log(
+        game_ctx.log(
             logging.OBSERVER,
-            f"{player.name} discards the top card of their deck.",
+            Message(
+                "{} discards the top card of their deck.",
+                player.name,
+                kind="discard",
+                player=player.name,
+            ),
         )
 
-        logging.log(
+        game_ctx.log(
             logging.GAME,
-            f"{player.name} discards the top card of their deck, {card_to_str(top_card)}.",
+            Message(
+                "{} discards the top card of their deck, {}.",
+                player.name,
+                top_card,
+                kind="discard",
+                player=player.name,
+            ),
         )
 
 
@@ -5,8 +5,9 @@
 import dominion.util.logging as logging
 from dominion.cards import ActionAttackCard
 from dominion.common import QueuePosition
-from dominion.events import Event
-from dominion.util.prettyprint import card_to_str, hand_to_str
+from dominion.events import Decision, Event
+from dominion.util.message import Message
+from dominion.util.prettyprint import hand_to_str
 
 from .curse import CURSE
 from .moat import MOAT
@@ -23,38 +24,54 @@ def get_reaction_options(hand):
 class WitchEventSelf(Event):
     def forward(self, game_ctx, player):
         player.deck.draw_cards(n=2, replace_hand=False)
-        player.show(hand_to_str(player.hand))
+        if player.show_enabled:
+            player.show(Message(hand_to_str, tuple(player.hand)))
 
 
 class WitchEventOther(Event):
     def forward(self, game_ctx, player):
         if MOAT in player.hand:
-            player.show(hand_to_str(player.hand))
+            if player.show_enabled:
+                player.show(Message(hand_to_str, tuple(player.hand)))
 
             options = get_reaction_options(player.hand)
             prompt_str = (
                 "You may reveal a Moat from your hand to be unaffected by this attack"
             )
-            c = player.get_input(prompt_str, options, allow_skip=True)
+            c = yield Decision(player, prompt_str, options, allow_skip=True)
             if c is not "Skip":
                 card = player.hand[c]
-                logging.log(
+                game_ctx.log(
                     [logging.GAME, logging.OBSERVER],
-                    f"{player.name} reveals a {card_to_str(card)}, defending themselves!",
+                    Message(
+                        "{} reveals a {}, defending themselves!",
+                        player.name,
+                        card,
+                        kind="defend",
+                        player=player.name,
+                    ),
                 )
                 return
 
         # Player gains a curse, if there are still curses
         if game_ctx.supply[CURSE] > 0:
             game_ctx.supply.buy(CURSE, player, free=True)
-            logging.log(
+            game_ctx.log(
                 [logging.GAME, logging.OBSERVER],
-                f"{player.name} gains a {card_to_str(CURSE)}",
+                Message(
+                    "{} gains a {}", player.name, CURSE, kind="gain", player=player.name
+                ),
             )
         else:
-            logging.log(
+            game_ctx.log(
                 [logging.GAME, logging.OBSERVER],
-                f"{player.name} does not gain a {card_to_str(CURSE)}, as there are no more in the Supply. Phew!",
+                Message(
+                    "{} does not gain a {}, as there are no more in the Supply. Phew!",
+                    player.name,
+                    CURSE,
+                    kind="no_gain",
+                    player=player.name,
+                ),
             )
 
 
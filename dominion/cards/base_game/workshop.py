@@ -5,34 +5,31 @@
 import dominion.util.logging as logging
 from dominion.cards import ActionCard
 from dominion.common import QueuePosition
-from dominion.events import Event
-from dominion.util.prettyprint import card_to_str, options_to_str
+from dominion.events import Decision, Event
+from dominion.util.message import Message
+from dominion.util.prettyprint import options_to_str
 
 
 def get_buy_options(supply):
-    value = 4
-    options = {}
-    for idx, card in enumerate(supply):
-        left = supply[card]
-        if card.cost <= value and left > 0:
-            options[idx] = card.name
-    return options
+    return supply.options(4)
 
 
 class WorkshopEvent(Event):
     def forward(self, game_ctx, player):
         options = get_buy_options(game_ctx.supply)
-        player.show(options_to_str(options))
+        player.show(Message(options_to_str, options))
 
         prompt_str = "Gain a card costing up to (4)"
-        c = player.get_input(prompt_str, options, allow_skip=True)
+        c = yield Decision(player, prompt_str, options, allow_skip=True)
         if c == "Skip":
             return
 
         card = game_ctx.supply.buy(c, player, free=True)
-        logging.log(
+        game_ctx.log(
             [logging.GAME, logging.OBSERVER],
-            f"{player.name} acquired {card_to_str(card)}.",
+            Message(
+                "{} acquired {}.", player.name, card, kind="gain", player=player.name
+            ),
         )
 
 
@@ -0,0 +1,104 @@
+"""The card registry assigns every card in the base game a dense integer ID, so
+cards can be stored and counted as small integers instead of objects.
+
+It also holds each card's properties as read-only NumPy tables indexed by ID, so
+questions about many cards at once (what a set of card counts is worth, which
+piles a player can afford) are array operations instead of loops over Card
+objects. For one card at a time, the Card's attributes or the COINS dict are
+faster than indexing an array.
+
+Intended usage:
+    from dominion.cards.registry import card_id, card_from_id
+    from dominion.cards.registry import COST, IS_ACTION, card_counts, score
+"""
+
+# Python stdlib
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+# From dominion module
+from dominion.common import CardType
+from dominion.util.cardfuncs import is_action_card
+
+from .base_game import *
+from .card import Card
+
+# Base cards in supply order, then kingdom cards. IDs are indices into this list.
+ALL_CARDS: List[Card] = [
+    COPPER,
+    SILVER,
+    GOLD,
+    ESTATE,
+    DUCHY,
+    PROVINCE,
+    CURSE,
+] + KINGDOM_CARDS
+
+NUM_CARDS = len(ALL_CARDS)
+
+CARD_IDS: Dict[Card, int] = {card: idx for idx, card in enumerate(ALL_CARDS)}
+
+# How many coins each card is worth in hand; 0 for anything but treasures
+COINS: Dict[Card, int] = {
+    card: card.value if card.kind == CardType.TREASURE else 0 for card in ALL_CARDS
+}
+
+GARDENS_ID = CARD_IDS[GARDENS]
+
+
+def _table(values, dtype) -> np.ndarray:
+    """Helper that builds a read-only table with one entry per card ID."""
+    table = np.array(values, dtype=dtype)
+    table.setflags(write=False)
+    return table
+
+
+COST = _table([card.cost for card in ALL_CARDS], np.int8)
+VALUE = _table([COINS[card] for card in ALL_CARDS], np.int8)
+# Fixed victory points; Gardens are worth 0 here, as their VP depend on the deck
+VP = _table([card.vp or 0 for card in ALL_CARDS], np.int8)
+
+IS_TREASURE = _table([card.kind == CardType.TREASURE for card in ALL_CARDS], bool)
+IS_VICTORY = _table([card.kind == CardType.VICTORY for card in ALL_CARDS], bool)
+IS_CURSE = _table([card.kind == CardType.CURSE for card in ALL_CARDS], bool)
+IS_ACTION = _table([is_action_card(card) for card in ALL_CARDS], bool)
+IS_ATTACK = _table([card.kind == CardType.ACTION_ATTACK for card in ALL_CARDS], bool)
+IS_REACTION = _table(
+    [card.kind == CardType.ACTION_REACTION for card in ALL_CARDS], bool
+)
+
+
+def card_id(card: Card) -> int:
+    """Returns the integer ID of a card."""
+    return CARD_IDS[card]
+
+
+def card_from_id(idx: int) -> Card:
+    """Returns the card with the given integer ID."""
+    return ALL_CARDS[idx]
+
+
+def count_coins(cards: Iterable[Card]) -> int:
+    """Returns how many coins the treasures among cards are worth."""
+    return sum([COINS[card] for card in cards])
+
+
+def card_counts(cards: Iterable[Card]) -> np.ndarray:
+    """Returns how many of each card are in cards, as a vector indexed by ID."""
+    ids = [CARD_IDS[card] for card in cards]
+    return np.bincount(ids, minlength=NUM_CARDS)
+
+
+def score(counts: np.ndarray) -> np.ndarray:
+    """Scores decks from their card counts, as Player.compute_score does.
+
+    Args:
+        counts (np.ndarray): Card counts indexed by ID along the last axis, e.g.
+            one row per player, or (games, players, NUM_CARDS).
+    Returns:
+        (np.ndarray) The VP of each deck, with the last axis reduced.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    gardens = counts[..., GARDENS_ID] * (counts.sum(axis=-1) // 10)
+    return counts @ VP.astype(np.int64) + gardens
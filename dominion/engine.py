@@ -0,0 +1,159 @@
+"""A step-based driver for a GameContext, with control inverted at decisions.
+Instead of calling Player.get_input from inside an event, the GameEngine
+suspends the game at each decision of an external seat and hands it to the
+caller, who answers it with step(). Because a suspended game is just a paused
+generator, one thread can hold thousands of games and interleave them, batch
+their decisions, or put any of them aside and resume it later.
+
+Events that need input are generators yielding Decisions (see
+dominion.events.Decision); the engine runs them one Decision at a time.
+Decisions of the other seats are answered by their players as usual.
+
+Intended usage:
+    engine = GameEngine(ctx, external=[0])
+    decision = engine.step()  # Runs to the first decision of seat 0
+    while decision is not None:
+        decision = engine.step(choose(decision))  # A key of decision.options
+
+play_async() uses the same suspension to play a game on an asyncio event loop,
+awaiting any policy whose get_input is a coroutine, so games waiting on slow
+policies (remote bots, people over a socket) share one thread.
+"""
+
+# Python stdlib
+import inspect
+from typing import Iterable, Optional
+
+# From dominion module
+from dominion.events import Decision
+from dominion.game import GameContext
+
+
+class GameEngine:
+    def __init__(
+        self,
+        ctx: GameContext,
+        external: Optional[Iterable[int]] = None,
+        max_turns: Optional[int] = None,
+    ) -> None:
+        """Wraps a set-up game. Nothing is played until the first step().
+
+        Args:
+            ctx (GameContext): The game to drive.
+            external (Iterable[int]): Seats whose decisions are returned by
+                step(). Defaults to every seat.
+            max_turns (int): If given, the game stops after this many turns,
+                as in SimulationRunner.
+        """
+        self.ctx = ctx
+        seats = range(len(ctx.player_order)) if external is None else external
+        self.external = {ctx.player_order[seat] for seat in seats}
+        self.seats = {player: seat for seat, player in enumerate(ctx.player_order)}
+        self.max_turns = max_turns
+        self.done = False
+
+        self._name_to_player = {player.name: player for player in ctx.player_order}
+        self._steps = None  # The generator of the event in progress
+        self._pending: Optional[Decision] = None
+
+    def pending_decision(self) -> Optional[Decision]:
+        """Returns the decision the game is waiting on, if any."""
+        return self._pending
+
+    def step(self, choice=None) -> Optional[Decision]:
+        """Answers the pending decision, if any, then plays the game until the
+        next decision of an external seat.
+
+        Args:
+            choice: Answer to the pending decision: a key of its options, or
+                "Skip" if it allows skipping. Ignored if nothing is pending.
+        Returns:
+            (Decision) The next pending decision, or None if the game is over.
+        Raises:
+            ValueError: If choice is not one of the pending decision's options.
+        """
+        decision, self._pending = self._pending, None
+        if decision is not None:
+            if choice not in decision.options and not (
+                choice == "Skip" and decision.allow_skip
+            ):
+                self._pending = decision
+                raise ValueError(f"{choice!r} is not an option of {decision}")
+            player = decision.player
+            if player.recorder is not None:
+                player.recorder.record_choice(player, decision.options, choice)
+        else:
+            choice = None
+
+        ctx = self.ctx
+        while True:
+            if self._steps is None:
+                if self._game_over():
+                    self.done = True
+                    return None
+                event = ctx.get_next_event()
+                player = self._name_to_player[event.target]
+                steps = self._call(event.forward, ctx, player)
+                if steps is None:
+                    continue  # The event needed no decisions
+                self._steps, choice = steps, None
+
+            try:
+                decision = self._call(self._steps.send, choice)
+            except StopIteration:
+                self._steps = None
+                continue
+
+            if decision.player in self.external:
+                self._pending = decision
+                return decision
+            choice = decision.player.get_input(
+                decision.prompt, decision.options, allow_skip=decision.allow_skip
+            )
+
+    def _call(self, func, *args):
+        """Helper that calls func, timing it as the current event if the game
+        has a profiler. A suspended event is timed in parts, so an event with
+        n decisions counts n + 1 calls.
+        """
+        profiler = self.ctx.profiler
+        if profiler is None:
+            return func(*args)
+        return profiler.run(type(self.ctx.current_event).__name__, func, *args)
+
+    def _game_over(self) -> bool:
+        ctx = self.ctx
+        if ctx.reached_end():
+            return True
+        return (
+            self.max_turns is not None
+            and ctx.turn >= self.max_turns
+            and not ctx.event_queue
+        )
+
+
+async def play_async(ctx: GameContext, max_turns: Optional[int] = None) -> None:
+    """Plays a game to the end on the running event loop. Decisions of
+    ComputerPlayers are answered by their policies; if a policy's get_input
+    returns an awaitable (see AsyncPolicy), it is awaited, letting other games
+    run in the meantime. Other players are asked as usual, blocking the loop.
+
+    Args:
+        ctx (GameContext): The game to play.
+        max_turns (int): If given, the game stops after this many turns, as in
+            SimulationRunner.
+    """
+    seats = [
+        seat
+        for seat, player in enumerate(ctx.player_order)
+        if hasattr(player, "policy")
+    ]
+    engine = GameEngine(ctx, external=seats, max_turns=max_turns)
+    decision = engine.step()
+    while decision is not None:
+        choice = decision.player.policy.get_input(
+            decision.options, allow_skip=decision.allow_skip
+        )
+        if inspect.isawaitable(choice):
+            choice = await choice
+        decision = engine.step(choice)
@@ -0,0 +1,135 @@
+"""The EventQueue schedules the events of a game. Events are stored as runs of
+consecutive events of the same type (e.g. the three PlayActionEvents queued by
+a Throne Room'd Village), which makes popping, pushing to either end, and
+counting or clearing a run at the front all O(1).
+"""
+
+# Python stdlib
+from collections import deque
+from typing import Iterator, Sequence
+
+# From dominion module
+from dominion.common import QueuePosition
+from dominion.events import BuyEvent, Event
+
+
+class EventQueue:
+    def __init__(self, events: Sequence[Event] = ()) -> None:
+        # Deque of (event type, deque of events). Adjacent runs always have
+        # different types.
+        self._runs = deque()
+        self._len = 0
+        for event in events:
+            self.append(event)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Event]:
+        for _, run in self._runs:
+            yield from run
+
+    def snapshot(self) -> tuple:
+        """Captures the queued events as a tuple of (type, events) runs. Events
+        only hold the name of their target, so they are shared, not copied.
+        """
+        return tuple((kind, tuple(run)) for kind, run in self._runs)
+
+    def restore(self, state: tuple) -> None:
+        """Returns the queue to a state captured by snapshot()."""
+        self._runs = deque((kind, deque(run)) for kind, run in state)
+        self._len = sum(len(run) for _, run in state)
+
+    def append(self, event: Event) -> None:
+        """Adds an event to the back of the queue."""
+        kind = type(event)
+        if self._runs and self._runs[-1][0] is kind:
+            self._runs[-1][1].append(event)
+        else:
+            self._runs.append((kind, deque([event])))
+        self._len += 1
+
+    def appendleft(self, event: Event) -> None:
+        """Adds an event to the front of the queue."""
+        self._push_run_left(type(event), deque([event]))
+        self._len += 1
+
+    def popleft(self) -> Event:
+        """Removes and returns the event at the front of the queue.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        if not self._runs:
+            raise IndexError("pop from an empty EventQueue")
+
+        _, run = self._runs[0]
+        event = run.popleft()
+        if not run:
+            self._runs.popleft()
+        self._len -= 1
+        return event
+
+    def add(self, events: Sequence[Event], where=QueuePosition.BACK) -> None:
+        """Adds a list of events to the queue, keeping their order.
+
+        Args:
+            events (Sequence[Event]): The events to add.
+            where (QueuePosition): BACK and FRONT add to either end of the queue.
+                AFTER_NEXT adds behind the event at the front of the queue.
+                BEFORE_NEXT_BUY adds ahead of the next BuyEvent in the queue, or
+                to the back if there is none.
+        """
+        if where == QueuePosition.BACK:
+            for event in events:
+                self.append(event)
+        elif where == QueuePosition.FRONT:
+            for event in reversed(events):
+                self.appendleft(event)
+        elif where == QueuePosition.AFTER_NEXT:
+            if not self:
+                self.add(events, where=QueuePosition.BACK)
+                return
+
+            next_event = self.popleft()
+            self.add(events, where=QueuePosition.FRONT)
+            self.appendleft(next_event)
+        elif where == QueuePosition.BEFORE_NEXT_BUY:
+            for idx, (kind, _) in enumerate(self._runs):
+                if issubclass(kind, BuyEvent):
+                    # Set aside the runs ahead of the BuyEvent, then restore
+                    # them in front of the new events
+                    ahead = [self._runs.popleft() for _ in range(idx)]
+                    self.add(events, where=QueuePosition.FRONT)
+                    for ahead_kind, run in reversed(ahead):
+                        self._push_run_left(ahead_kind, run)
+                    return
+
+            self.add(events, where=QueuePosition.BACK)
+        else:
+            raise NotImplementedError("not implemented")
+
+    def count_front(self, kind: type) -> int:
+        """Returns how many events of type kind are at the front of the queue,
+        one after another.
+        """
+        if self._runs and self._runs[0][0] is kind:
+            return len(self._runs[0][1])
+        return 0
+
+    def clear_front(self, kind: type) -> None:
+        """Removes all consecutive events of type kind at the front of the
+        queue.
+        """
+        if self._runs and self._runs[0][0] is kind:
+            _, run = self._runs.popleft()
+            self._len -= len(run)
+
+    def _push_run_left(self, kind: type, run: deque) -> None:
+        """Helper that puts a run at the front, merging it with the front run if
+        the types match.
+        """
+        if self._runs and self._runs[0][0] is kind:
+            self._runs[0][1].extendleft(reversed(run))
+        else:
+            self._runs.appendleft((kind, run))
@@ -6,12 +6,13 @@ purchases off the supply, and more.
 
 # Python stdlib
 from abc import ABC, abstractmethod
+from typing import Any, NamedTuple
 
 # From dominion module
 import dominion.util.logging as logging
 from dominion.util.cardfuncs import is_action_card
+from dominion.util.message import Message
 from dominion.util.prettyprint import (
-    card_to_str,
     filter_treasures_as_str,
     hand_to_str,
     supply_to_str,
@@ -25,21 +26,12 @@ from .common import DeckPile
 
 def get_num_events(ctx, target):
     """Assumes the event passed is sourced from itself"""
-    total = 1
-    for event in ctx.event_queue:
-        if type(event).__name__ == type(target).__name__:
-            total += 1
-        else:
-            break
-    return total
+    return 1 + ctx.event_queue.count_front(type(target))
 
 
 def clear_events_ahead_of_self(ctx, target):
     """Clears all events ahead of self."""
-    for idx, event in enumerate(ctx.event_queue):
-        if type(event).__name__ != type(target).__name__:
-            ctx.event_queue = ctx.event_queue[idx:]
-            return
+    ctx.event_queue.clear_front(type(target))
 
 
 """ Helper functions for getting options
@@ -56,12 +48,7 @@ def get_playable_actions_as_options(cards):
 
 
 def get_purchasable_cards_as_options(supply, player):
-    options = {}
-    for idx, card in enumerate(supply):
-        left = supply[card]
-        if card.cost <= player.treasure and left > 0:
-            options[idx] = card.name
-    return options
+    return supply.options(player.treasure)
 
 
 # TODO: for chapel, decompose
@@ -72,6 +59,34 @@ def get_all_as_options(cards):
     return options
 
 
+class Decision(NamedTuple):
+    """A choice an event needs a player to make. Events yield Decisions from
+    forward() and are sent back the choice, as Player.get_input returns it:
+
+        c = yield Decision(player, prompt_str, options, allow_skip=True)
+    """
+
+    player: Any  # dominion.players.Player
+    prompt: Any  # str or Message
+    options: dict
+    allow_skip: bool = False
+
+
+def resolve(steps) -> None:
+    """Runs the generator returned by an event's forward() to completion,
+    asking the player of each Decision it yields.
+    """
+    try:
+        decision = next(steps)
+        while True:
+            choice = decision.player.get_input(
+                decision.prompt, decision.options, allow_skip=decision.allow_skip
+            )
+            decision = steps.send(choice)
+    except StopIteration:
+        pass
+
+
 class Event(ABC):
     def __init__(self, target):
         """TODO: docstring
@@ -85,22 +100,32 @@ class Event(ABC):
     @abstractmethod
     def forward(self, game_ctx, player):
         """All Events have a forward method which scripts what happens to the game
-        and players when the event occurs.
+        and players when the event occurs. Events that need players to choose
+        are generators, yielding a Decision for each choice (see Decision).
 
         Args:
             game_ctx (dominion.game.GameContext): The context for the current
                 game.
             player (dominion.players.Player): The player of the event
         Returns:
-            None
+            None, or a generator of Decisions
         Raises:
             TypeError: If forward is not implemented, Python will complain.
         """
         pass
 
+    def run(self, game_ctx, player) -> None:
+        """Plays the event to completion, asking players for any decisions."""
+        steps = self.forward(game_ctx, player)
+        if steps is not None:
+            resolve(steps)
+
     # Allow instances to be called like functions
     def __call__(self, game_ctx, player):
-        self.forward(game_ctx, player)
+        if game_ctx.profiler is None:
+            self.run(game_ctx, player)
+        else:
+            game_ctx.profiler.run(type(self).__name__, self.run, game_ctx, player)
 
 
 class PlayActionEvent(Event):
@@ -115,41 +140,51 @@ class PlayActionEvent(Event):
         Returns:
             None
         """
-        player.show(hand_to_str(player.hand))
+        show = player.show_enabled
+        if show:
+            player.show(Message(hand_to_str, tuple(player.hand)))
 
         options = get_playable_actions_as_options(player.hand)
         if not options:
-            player.show("No actions are available to be played.\n")
+            if show:
+                player.show("No actions are available to be played.\n")
             # If there are any other PlayActionEvents, clear them
             clear_events_ahead_of_self(game_ctx, self)
             return
 
-        prompt_str = "Play an action ({} remaining)".format(
-            get_num_events(game_ctx, self)
+        prompt_str = Message(
+            "Play an action ({} remaining)", get_num_events(game_ctx, self)
         )
-        c = player.get_input(prompt_str, options, allow_skip=True)
+        c = yield Decision(player, prompt_str, options, allow_skip=True)
 
         if c == "Skip":
             return
 
         action_card = player.hand[c]
-        action_card.play(game_ctx, player)
+        player.turn.actions += 1
+        game_ctx.play_card(action_card, player)
         player.deck.move(
             [action_card], from_pile=DeckPile.HAND, to_pile=DeckPile.PLAYED
         )
 
-        logging.log(
-            [logging.GAME, logging.OBSERVER],
-            f"{player.name} played {card_to_str(action_card)}.",
-        )
+        if game_ctx.log_enabled:
+            game_ctx.log(
+                [logging.GAME, logging.OBSERVER],
+                Message(
+                    "{} played {}.",
+                    player.name,
+                    action_card,
+                    kind="play",
+                    player=player.name,
+                ),
+            )
 
 
-def get_treasures_msg(player):
-    s = filter_treasures_as_str(player.hand)
-    if "extra_treasure" in player.modifiers:
-        s += " (+{} bonus)".format(player.modifiers["extra_treasure"])
+def get_treasures_msg(hand, extra_treasure, treasure):
+    s = filter_treasures_as_str(hand)
+    if extra_treasure is not None:
+        s += " (+{} bonus)".format(extra_treasure)
 
-    treasure = player.treasure
     s += " -> You have {}".format(treasure)
     s += " treasure{} to spend\n".format("s" if treasure != 1 else "")
     return s
@@ -166,28 +201,43 @@ class BuyEvent(Event):
         Returns:
             None
         """
-        player.show(get_treasures_msg(player))
+        # Hand and supply are copied, as they change before a deferred sink
+        # renders them; the copies are only made if the player is shown anything
+        show = player.show_enabled
+        if show:
+            player.show(
+                Message(
+                    get_treasures_msg,
+                    tuple(player.hand),
+                    player.turn.coins or None,
+                    player.treasure,
+                )
+            )
+            player.show(Message(supply_to_str, dict(game_ctx.supply.items())))
 
-        player.show(supply_to_str(game_ctx.supply))
         options = get_purchasable_cards_as_options(game_ctx.supply, player)
         if not options:
-            player.show("Cannot afford anything this turn.\n")
+            if show:
+                player.show("Cannot afford anything this turn.\n")
             # If there are any other BuyEvents, clear them
             clear_events_ahead_of_self(game_ctx, self)
             return
 
         n = get_num_events(game_ctx, self)
-        prompt_str = "Buy a card ({} buy{} left)".format(n, "s" if n != 1 else "")
-        c = player.get_input(prompt_str, options, allow_skip=True)
+        prompt_str = Message("Buy a card ({} buy{} left)", n, "s" if n != 1 else "")
+        c = yield Decision(player, prompt_str, options, allow_skip=True)
 
         if c == "Skip":
             return
 
         card = game_ctx.supply.buy(c, player)
-        logging.log(
-            [logging.GAME, logging.OBSERVER],
-            f"{player.name} bought {card_to_str(card)}.",
-        )
+        if game_ctx.log_enabled:
+            game_ctx.log(
+                [logging.GAME, logging.OBSERVER],
+                Message(
+                    "{} bought {}.", player.name, card, kind="buy", player=player.name
+                ),
+            )
 
 
 # TODO: add played cards back to discard pile
@@ -206,11 +256,19 @@ class CleanupEvent(Event):
         """
         player.cleanup()  # Clear spent, any status effects
         player.deck.draw_cards(n=5, replace_hand=True)
-        player.show("Drawing 5 cards and ending turn.")
-        logging.log(
-            [logging.GAME, logging.OBSERVER],
-            f"{player.name} draws 5 cards and ends their turn.\n---",
-        )
+
+        if player.show_enabled:
+            player.show("Drawing 5 cards and ending turn.")
+        if game_ctx.log_enabled:
+            game_ctx.log(
+                [logging.GAME, logging.OBSERVER],
+                Message(
+                    "{} draws 5 cards and ends their turn.\n---",
+                    player.name,
+                    kind="cleanup",
+                    player=player.name,
+                ),
+            )
 
 
 class SetupEvent(Event):
@@ -225,9 +283,14 @@ class SetupEvent(Event):
         Returns:
             None
         """
-        logging.log(
-            [logging.GAME, logging.OBSERVER],
-            f"{player.name} draws 5 cards.\n---",
-        )
+        if game_ctx.log_enabled:
+            game_ctx.log(
+                [logging.GAME, logging.OBSERVER],
+                Message(
+                    "{} draws 5 cards.\n---",
+                    player.name,
+                    kind="setup",
+                    player=player.name,
+                ),
+            )
         player.deck.draw_cards(n=5, replace_hand=True)
-        pass
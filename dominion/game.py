@@ -3,24 +3,84 @@ conditions.
 """
 
 # Python stdlib
-from typing import Sequence, Tuple
+import random
+from functools import partial
+from typing import NamedTuple, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 # From dominion module
 import dominion.events as events
 import dominion.util.logging as logging
+from dominion.cards import Card
 from dominion.cards.base_game import PROVINCE
 from dominion.common import *
+from dominion.event_queue import EventQueue
 from dominion.players import ComputerPlayer, HumanPlayer, Player
 from dominion.policy import RandomPolicy
+from dominion.profiling import Profiler
 from dominion.supply import Supply
+from dominion.util.message import Message
+
+
+class GameSnapshot(NamedTuple):
+    """The full mutable state of a GameContext, as captured by
+    GameContext.snapshot(). Every field is immutable, so one snapshot can be
+    restored any number of times.
+    """
+
+    turn: int
+    events: tuple
+    supply: tuple
+    players: tuple  # One Player.snapshot() per player, in player order
+    rng: Optional[tuple]  # State of the game's generator, if captured
 
 
 # Game context stores order for players
 class GameContext:
-    def __init__(self, players=None) -> None:
+    def __init__(
+        self,
+        players=None,
+        log_sink: Optional[logging.LogSink] = None,
+        recorder=None,
+        kingdom: Optional[Sequence[Card]] = None,
+        seed: Optional[int] = None,
+        profiler: Optional[Profiler] = None,
+    ) -> None:
+        """Creates the context for a game.
+
+        Args:
+            players (Sequence[Player]): Optional players; if given, the context is
+                set up immediately.
+            log_sink (LogSink): Where the game and its players log to. Defaults
+                to the module's default sink (files in a run_* directory).
+            recorder (GameRecorder): Optional recorder that the game's decisions,
+                shuffles and supply changes are written to.
+            kingdom (Sequence[Card]): Optional kingdom cards, instead of 10
+                chosen at random.
+            seed (int): Seed for the game's generator, which makes all of the
+                game's random choices: the kingdom, shuffles, and the moves of
+                the policies seated in it. If None, a seed is drawn from the
+                random module, so seeding that still reproduces games.
+            profiler (Profiler): Optional profiler that times every event and
+                card played in the game.
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
         self.setup = False
+        self.log_sink = log_sink or logging.default_sink
+        self.recorder = recorder
+        self.kingdom = kingdom
+        self.profiler = profiler
+
+        # The event being played, and optionally a snapshot of the game taken
+        # just before it started (see MCTSPolicy)
+        self.current_event = None
+        self.checkpoint_events = False
+        self.checkpoint = None
         if players:
             self.player_order = players
             self._setup()
@@ -30,29 +90,71 @@ class GameContext:
         self._setup()
 
     def _setup(self) -> None:
-        self.event_queue = []
-        self.supply = Supply(n_players=len(self.player_order))
+        self.event_queue = EventQueue()
+        self.supply = Supply(
+            n_players=len(self.player_order), cards=self.kingdom, rng=self.rng
+        )
         # self.supply = Supply(n_players=len(self.player_order), debug=True)
         self.turn = 0
         self.setup = True
+        # Empty piles that end the game
+        self.piles_to_end = 3 if len(self.player_order) < 4 else 4
         # On GameContext creation, scramble player order and create setup events
 
         for player in self.player_order:
+            player.log_sink = self.log_sink
+            player.deck.rng = self.rng
+            player.deck.shuffle_draw_pile()
             self.add_event(events.SetupEvent(target=player.name))
+            if isinstance(player, ComputerPlayer):
+                player.policy.bind(self)
+
+        if self.recorder is not None:
+            self.recorder.start(self)
+            self.set_recorder(self.recorder)
+
+    @property
+    def log_enabled(self) -> bool:
+        """Whether anything logged is ever read. Messages that are costly to
+        build (e.g. copies of a hand) are skipped when it is not.
+        """
+        return self.log_sink.enabled
+
+    def log(self, targets: logging.targetsT, message: Union[str, Message]) -> None:
+        """Logs a message to this game's sink."""
+        self.log_sink.write(logging.as_targets(targets), message)
+
+    def set_log_sink(self, log_sink: logging.LogSink) -> None:
+        """Switches the game and its players to a different sink."""
+        self.log_sink = log_sink
+        for player in self.player_order:
+            player.log_sink = log_sink
+
+    def set_recorder(self, recorder) -> None:
+        """Attaches a recorder to the players and their decks, or detaches it
+        if recorder is None. The recorder must already have started the game.
+        """
+        self.recorder = recorder
+        for player in self.player_order:
+            player.recorder = recorder
+            player.deck.on_shuffle = None
+            if recorder is not None:
+                player.deck.on_shuffle = partial(recorder.record_shuffle, player)
+
+    def play_card(self, card: Card, player: Player) -> None:
+        """Plays a card for player, timing it if the game has a profiler."""
+        if self.profiler is None:
+            card.play(self, player)
+        else:
+            self.profiler.run(f"{card.name}.play", card.play, self, player)
 
     def add_event(self, event, where=QueuePosition.BACK) -> None:
         """Adds a single event to the queue."""
-        if where == QueuePosition.BACK:
-            self.event_queue.append(event)
-        elif where == QueuePosition.FRONT:
-            self.event_queue.insert(0, event)
+        self.event_queue.add([event], where=where)
 
     def add_events(self, events, where=QueuePosition.BACK) -> None:
         """Adds a list of events to the queue."""
-        if where == QueuePosition.BACK:
-            self.event_queue = self.event_queue + events
-        elif where == QueuePosition.FRONT:
-            self.event_queue = events + self.event_queue
+        self.event_queue.add(events, where=where)
 
     def get_next_event(self):
         # Create new turns if event queue empty
@@ -63,7 +165,12 @@ class GameContext:
                 self.add_event(events.BuyEvent(target=player.name))
                 self.add_event(events.CleanupEvent(target=player.name))
 
-        return self.event_queue.pop(0)
+        if self.recorder is not None:
+            self.recorder.record_event(self)
+        self.current_event = self.event_queue.popleft()
+        if self.checkpoint_events:
+            self.checkpoint = self.snapshot(rng=False)
+        return self.current_event
 
     def get_other_players(self, cur_player_name: str):
         """Goes around the circle of player_order, returning all other players"""
@@ -77,16 +184,45 @@ class GameContext:
         - There are no more Provinces
         - 3 piles are empty (4 in a four player game)
         """
+        # Both counts are kept up to date by the supply as cards are bought
         if self.supply[PROVINCE] == 0:
             return True
+        return self.supply.n_empty >= self.piles_to_end
 
-        n_piles_empty = len([v for v in self.supply.values() if v == 0])
-        if n_piles_empty >= 3 and len(self.player_order) < 4:
-            return True
-        if n_piles_empty >= 4:
-            return True
+    def snapshot(self, rng: bool = True) -> GameSnapshot:
+        """Captures the state of the game so it can be returned to later, e.g.
+        to play out rollouts from the same position. Much cheaper than
+        copy.deepcopy, since cards and events are shared rather than copied.
+
+        Args:
+            rng (bool): If True, also captures the state of the game's
+                generator, so restoring replays the same shuffles and moves.
+                Searches that want fresh randomness on every rollout can skip
+                it.
+        Returns:
+            (GameSnapshot) The captured state.
+        """
+        rng_state = self.rng.getstate() if rng else None
+        return GameSnapshot(
+            turn=self.turn,
+            events=self.event_queue.snapshot(),
+            supply=self.supply.snapshot(),
+            players=tuple(player.snapshot() for player in self.player_order),
+            rng=rng_state,
+        )
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """Returns the game to a state captured by snapshot(). The players must
+        be the same objects the snapshot was taken from.
+        """
+        self.turn = snapshot.turn
+        self.event_queue.restore(snapshot.events)
+        self.supply.restore(snapshot.supply)
+        for player, player_state in zip(self.player_order, snapshot.players):
+            player.restore(player_state)
 
-        return False
+        if snapshot.rng is not None:
+            self.rng.setstate(snapshot.rng)
 
     def get_raw_state(self):
         """Returns the raw state of the game: whose turn it is, what cards are
@@ -126,9 +262,9 @@ class Game:
         if not self.ctx.setup:
             raise RuntimeError("game context not set up")
 
-        logging.log(
+        self.ctx.log(
             [logging.GAME, logging.OBSERVER],
-            f"Starting game of Dominion!",
+            Message("Starting game of Dominion!", kind="start"),
         )
 
         while not self.ctx.reached_end():
@@ -137,18 +273,27 @@ class Game:
             player = self.name_to_player[event.target]
             event(self.ctx, player)
 
-        logging.log(
+        self.ctx.log(
             [logging.GAME, logging.OBSERVER],
-            f"Game ended after {self.ctx.turn + 1} turns.",
+            Message("Game ended after {} turns.", self.ctx.turn + 1, kind="end"),
         )
 
         scores = [player.compute_score() for player in self.ctx.player_order]
         idx = np.argmax(scores)
         winner_name = self.ctx.player_order[idx].name
         winner_score = scores[idx]
-        logging.log(
+        self.ctx.log(
             [logging.GAME, logging.OBSERVER],
-            f"{winner_name} won with a score of {winner_score} points!",
+            Message(
+                "{} won with a score of {} points!",
+                winner_name,
+                winner_score,
+                kind="win",
+                player=winner_name,
+            ),
         )
+        self.ctx.log_sink.flush()
+        if self.ctx.recorder is not None:
+            self.ctx.recorder.finish(self.ctx)
 
         return (idx, scores)
@@ -0,0 +1,122 @@
+"""Parallel self-play across processes. Games are split into chunks, each chunk
+is played headlessly by a SimulationRunner in a worker process, and the chunk
+results are merged back into win counts and experience tuples.
+"""
+
+# Python stdlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# From dominion module
+from dominion.policy import Policy
+from dominion.simulation import GameResult, SimulationRunner
+
+# A chunk's output: its game results, and the experiences collected per seat
+ChunkResult = Tuple[List[GameResult], List[list]]
+
+
+class BatchResult(NamedTuple):
+    """Merged output of a parallel run. wins and experiences are indexed by
+    seat; results are in the order the games were scheduled.
+    """
+
+    results: List[GameResult]
+    wins: List[int]
+    experiences: List[list]
+
+
+def play_chunk(
+    policies: Sequence[Policy], n_games: int, max_turns: int, seed: int
+) -> ChunkResult:
+    """Worker entry point. Every game's seed is drawn from the chunk's seed, so
+    a chunk plays out the same way regardless of which worker picks it up.
+    """
+    runner = SimulationRunner(policies, max_turns=max_turns, seed=seed)
+    results = runner.run(n_games)
+    experiences = [policy.pop_experiences() for policy in runner.policies]
+    return results, experiences
+
+
+def merge_chunks(chunks: Sequence[ChunkResult], n_seats: int) -> BatchResult:
+    """Concatenates chunk results in order and tallies wins per seat."""
+    results = []
+    experiences = [[] for _ in range(n_seats)]
+    for chunk_results, chunk_experiences in chunks:
+        results.extend(chunk_results)
+        for seat, seat_experiences in enumerate(chunk_experiences):
+            experiences[seat].extend(seat_experiences)
+
+    wins = [0] * n_seats
+    for result in results:
+        wins[result.winner] += 1
+
+    return BatchResult(results=results, wins=wins, experiences=experiences)
+
+
+class ParallelSimulationRunner:
+    def __init__(
+        self,
+        policies: Sequence[Policy],
+        max_turns: int = 250,
+        n_workers: Optional[int] = None,
+        chunk_size: int = 50,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Creates a runner that fans games out to a persistent process pool.
+
+        Args:
+            policies (Sequence[Policy]): One policy per seat. Policies must be
+                picklable; each chunk plays with its own copy, so any learning
+                happens on the experiences returned by run().
+            max_turns (int): Turn limit per game, as in SimulationRunner.
+            n_workers (int): Number of worker processes. Defaults to the number
+                of cores.
+            chunk_size (int): Games played per task sent to a worker.
+            seed (int): Base seed; each chunk gets an independent seed derived
+                from it. If None, fresh entropy is used.
+        """
+        self.policies = list(policies)
+        self.max_turns = max_turns
+        self.n_workers = n_workers or os.cpu_count()
+        self.chunk_size = chunk_size
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.n_workers)
+        return self._executor
+
+    def run(self, n_games: int) -> BatchResult:
+        """Plays n_games across the worker pool and merges the results."""
+        sizes = [self.chunk_size] * (n_games // self.chunk_size)
+        if n_games % self.chunk_size:
+            sizes.append(n_games % self.chunk_size)
+
+        seeds = [
+            int(child.generate_state(1)[0])
+            for child in self.seed_sequence.spawn(len(sizes))
+        ]
+
+        executor = self._get_executor()
+        futures = [
+            executor.submit(play_chunk, self.policies, size, self.max_turns, seed)
+            for size, seed in zip(sizes, seeds)
+        ]
+        chunks = [future.result() for future in futures]
+        return merge_chunks(chunks, n_seats=len(self.policies))
@@ -1,2 +1,3 @@
+from .compact_deck import CompactDeck
 from .deck import Deck
-from .players import Player, HumanPlayer, ComputerPlayer
+from .players import Player, HumanPlayer, ComputerPlayer, TurnState
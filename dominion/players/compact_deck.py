@@ -0,0 +1,439 @@
+"""A CompactDeck is a drop-in alternative to Deck that stores each pile as a
+byte buffer of integer card IDs (see dominion.cards.registry) instead of a list
+of Card objects, and keeps a vector of card counts for every pile. Piles are
+exposed as read-only sequences of Cards, so cards and events can use either kind
+of deck.
+
+CompactDecks take a fraction of the memory of a Deck, which matters when holding
+many games in memory at once, and moving cards no longer involves list scans and
+removals.
+"""
+
+# Python stdlib
+import random  # Default generator for shuffles
+from collections.abc import Mapping
+from collections.abc import Sequence as SequenceABC
+from typing import Iterable, List, Optional, Sequence, Set, Union
+
+# From dominion module
+from dominion.cards import Card
+from dominion.cards.base_game import STARTER_DECK
+from dominion.cards.registry import ALL_CARDS, CARD_IDS, COINS, NUM_CARDS
+from dominion.common import DeckPile
+
+from .deck import Targets
+
+# Piles are indexed by position internally; trashed cards leave the deck
+DRAW, DISCARD, HAND, PLAYED = range(4)
+PILE_IDXS = {
+    DeckPile.DRAW: DRAW,
+    DeckPile.DISCARD: DISCARD,
+    DeckPile.HAND: HAND,
+    DeckPile.PLAYED: PLAYED,
+}
+
+# Count vectors for each pile, then for the whole deck, share one buffer
+TOTAL = len(PILE_IDXS)
+
+# Offsets of the treasures in the hand's count vector, and their values
+HAND_TREASURES = [
+    (HAND * NUM_CARDS + idx, COINS[card])
+    for idx, card in enumerate(ALL_CARDS)
+    if COINS[card]
+]
+
+
+class PileView(SequenceABC):
+    """A read-only view of a pile of card IDs as a sequence of Cards. The view
+    stays current as the pile changes.
+    """
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids: bytearray) -> None:
+        self._ids = ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [ALL_CARDS[i] for i in self._ids[idx]]
+        return ALL_CARDS[self._ids[idx]]
+
+    def __iter__(self):
+        return map(ALL_CARDS.__getitem__, self._ids)
+
+    def __contains__(self, card):
+        idx = CARD_IDS.get(card)
+        return idx is not None and idx in self._ids
+
+    def __eq__(self, other):
+        if isinstance(other, PileView):
+            return self._ids == other._ids
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class CountsView(Mapping):
+    """A read-only view of a count vector as a mapping from Card to count.
+    Like the defaultdict kept by Deck, cards not in the deck count as 0.
+    """
+
+    __slots__ = ("_counts",)
+
+    def __init__(self, counts: memoryview) -> None:
+        self._counts = counts
+
+    def __getitem__(self, card):
+        return self._counts[CARD_IDS[card]]
+
+    def __contains__(self, card):
+        idx = CARD_IDS.get(card)
+        return idx is not None and self._counts[idx] > 0
+
+    def __iter__(self):
+        return (ALL_CARDS[idx] for idx, n in enumerate(self._counts) if n)
+
+    def __len__(self):
+        return sum(1 for n in self._counts if n)
+
+
+class CompactDeck:
+    __slots__ = (
+        "debug",
+        "rng",
+        "on_shuffle",
+        "_piles",
+        "_views",
+        "_counts",
+        "_n_cards",
+    )
+
+    def __init__(
+        self,
+        *,
+        starter_deck: Sequence[Card] = STARTER_DECK,
+        debug: bool = False,
+        shuffle: bool = True,
+        rng: Optional[random.Random] = None,
+    ):
+        """A CompactDeck has the same piles and operations as a Deck. Counts
+        are stored as bytes, so a deck may hold at most 255 copies of a card.
+
+        Args:
+            starter_deck (Sequence[Card]): The cards the deck starts with.
+            debug (bool): If True, checks the count vectors against a full
+                recount after every operation that changes them.
+            shuffle (bool): If False, the draw pile keeps the order of
+                starter_deck. See Deck.
+            rng (random.Random): Generator for shuffles. See Deck.
+        """
+        self.debug = debug
+        self.rng = rng or random
+        self.on_shuffle = None  # See Deck
+        self._piles = tuple(bytearray() for _ in PILE_IDXS)
+        self._views = tuple(PileView(ids) for ids in self._piles)
+        self._counts = bytearray((TOTAL + 1) * NUM_CARDS)
+        self._n_cards = 0
+
+        ids = self._to_ids(starter_deck)
+        if shuffle:
+            self.rng.shuffle(ids)
+        self._push(DRAW, ids)
+        self._add_counts(ids)
+
+    def __len__(self):
+        """Returns the total number of cards in the deck."""
+        return self._n_cards
+
+    @property
+    def draw_pile(self) -> PileView:
+        return self._views[DRAW]
+
+    @property
+    def discard_pile(self) -> PileView:
+        return self._views[DISCARD]
+
+    @property
+    def hand(self) -> PileView:
+        return self._views[HAND]
+
+    @property
+    def played_cards(self) -> PileView:
+        return self._views[PLAYED]
+
+    @property
+    def hand_coins(self) -> int:
+        """How many coins the treasures in hand are worth, read off the hand's
+        count vector.
+        """
+        counts = self._counts
+        return sum([counts[offset] * value for offset, value in HAND_TREASURES])
+
+    @property
+    def counts(self) -> CountsView:
+        """Card counts over the whole deck, as a mapping from Card to count."""
+        return CountsView(self._count_vector(TOTAL))
+
+    def pile_counts(self, pile: DeckPile) -> memoryview:
+        """Returns the (read-only) count vector of a pile, indexed by card ID.
+        The vector is kept up to date as the pile changes.
+        """
+        return self._count_vector(PILE_IDXS[pile])
+
+    def _count_vector(self, pile_idx: int) -> memoryview:
+        """Helper that returns a read-only slice of the count buffer."""
+        offset = pile_idx * NUM_CARDS
+        view = memoryview(self._counts)[offset : offset + NUM_CARDS]
+        return view.toreadonly()
+
+    def _to_ids(self, cards: Iterable[Card]) -> bytearray:
+        """Helper that converts cards to a buffer of card IDs."""
+        return bytearray([CARD_IDS[card] for card in cards])
+
+    def _push(self, pile_idx: int, ids: bytearray, front: bool = False) -> None:
+        """Helper that puts card IDs at the front or end of a pile."""
+        if front:
+            self._piles[pile_idx][0:0] = ids
+        else:
+            self._piles[pile_idx].extend(ids)
+
+        counts, offset = self._counts, pile_idx * NUM_CARDS
+        for idx in ids:
+            counts[offset + idx] += 1
+
+    def _take_front(self, pile_idx: int, n: int) -> bytearray:
+        """Helper that removes and returns the first n card IDs of a pile."""
+        ids = self._piles[pile_idx]
+        taken = ids[:n]
+        del ids[:n]
+
+        counts, offset = self._counts, pile_idx * NUM_CARDS
+        for idx in taken:
+            counts[offset + idx] -= 1
+        return taken
+
+    def _take_indices(self, pile_idx: int, target_idxs: Set[int]) -> bytearray:
+        """Helper that removes and returns the card IDs at the given positions
+        of a pile, in pile order.
+        """
+        ids = self._piles[pile_idx]
+        taken, kept = bytearray(), bytearray()
+        for pos, idx in enumerate(ids):
+            if pos in target_idxs:
+                taken.append(idx)
+            else:
+                kept.append(idx)
+        ids[:] = kept
+
+        counts, offset = self._counts, pile_idx * NUM_CARDS
+        for idx in taken:
+            counts[offset + idx] -= 1
+        return taken
+
+    def _add_counts(self, ids: bytearray) -> None:
+        """Helper that counts cards entering the player's possession."""
+        counts, offset = self._counts, TOTAL * NUM_CARDS
+        for idx in ids:
+            counts[offset + idx] += 1
+        self._n_cards += len(ids)
+
+        if self.debug:
+            self.check_counts()
+
+    def _remove_counts(self, ids: bytearray) -> None:
+        """Helper that uncounts cards leaving the player's possession."""
+        counts, offset = self._counts, TOTAL * NUM_CARDS
+        for idx in ids:
+            counts[offset + idx] -= 1
+        self._n_cards -= len(ids)
+
+        if self.debug:
+            self.check_counts()
+
+    def check_counts(self) -> None:
+        """Verifies every count vector against a full recount of the piles.
+
+        Raises:
+            RuntimeError: If the counts have drifted from the piles.
+        """
+        recount = bytearray((TOTAL + 1) * NUM_CARDS)
+        for pile_idx, ids in enumerate(self._piles):
+            for idx in ids:
+                recount[pile_idx * NUM_CARDS + idx] += 1
+                recount[TOTAL * NUM_CARDS + idx] += 1
+
+        if recount != self._counts or self._n_cards != sum(map(len, self._piles)):
+            raise RuntimeError("deck counts do not match the cards in the deck")
+
+    def snapshot(self) -> tuple:
+        """Captures the piles and counts as immutable bytes, for restore() to
+        return to.
+        """
+        return tuple(bytes(ids) for ids in self._piles) + (
+            bytes(self._counts),
+            self._n_cards,
+        )
+
+    def restore(self, state: tuple) -> None:
+        """Returns the deck to a state captured by snapshot(). Buffers are
+        refilled in place, so existing pile views stay valid.
+        """
+        *piles, counts, self._n_cards = state
+        for ids, saved in zip(self._piles, piles):
+            ids[:] = saved
+        self._counts[:] = counts
+
+    def redeal(self, include_hand: bool = True) -> None:
+        """Shuffles the draw pile, along with the hand if include_hand, and
+        deals back a hand of the same size. See Deck.redeal.
+        """
+        n_hand = len(self._piles[HAND]) if include_hand else 0
+        pool = self._take_front(DRAW, len(self._piles[DRAW]))
+        pool += self._take_front(HAND, n_hand)
+        self.rng.shuffle(pool)
+        self._push(HAND, pool[:n_hand])
+        self._push(DRAW, pool[n_hand:])
+
+    def _reshuffle(self) -> None:
+        """Helper method that shuffles the discard pile back into the draw
+        pile.
+        """
+        discard = self._take_front(DISCARD, len(self._piles[DISCARD]))
+        self.rng.shuffle(discard)
+        if self.on_shuffle is not None:
+            cards = [ALL_CARDS[idx] for idx in discard]
+            self.on_shuffle(cards)
+            discard = self._to_ids(cards)
+        self._push(DRAW, discard)
+
+    def shuffle_draw_pile(self) -> None:
+        """Shuffles the draw pile in place. See Deck."""
+        ids = self._piles[DRAW]
+        ids[:] = sorted(ids)
+        self.rng.shuffle(ids)
+
+    def _discard_hand(self) -> None:
+        """Helper (only used in CompactDeck) to move cards in hand to discard
+        pile.
+        """
+        self._push(DISCARD, self._take_front(HAND, len(self._piles[HAND])))
+
+    def draw_cards(
+        self, n: int, replace_hand: bool = True, to_caller: bool = False
+    ) -> Union[PileView, List[Card]]:
+        """Draw n cards, optionally replacing (discarding) cards in hand, or
+        returning cards directly. See Deck.draw_cards.
+        """
+        if not to_caller and replace_hand:
+            self._discard_hand()
+
+        # If draw pile is smaller than n, reshuffle
+        if len(self._piles[DRAW]) < n:
+            self._reshuffle()
+
+        drawn = self._take_front(DRAW, n)
+
+        # Return cards to caller if specified; otherwise, add to hand
+        if to_caller:
+            self._remove_counts(drawn)
+            return [ALL_CARDS[idx] for idx in drawn]
+
+        self._push(HAND, drawn)
+        return self.hand
+
+    def trash(self, cards: Targets, from_pile: DeckPile = DeckPile.HAND) -> None:
+        """Remove a list of cards from a specified pile. Reduces overall deck
+        counts. See Deck.trash.
+        """
+        self.move(cards, from_pile=from_pile, to_pile=DeckPile.TRASH)
+
+    def cleanup(self) -> None:
+        """Moves any cards in the played pile to the discard pile. Called when
+        the player's turn ends.
+        """
+        self._push(DISCARD, self._take_front(PLAYED, len(self._piles[PLAYED])))
+
+    def add(
+        self, cards: Union[Sequence[Card], Card], to_pile: DeckPile = DeckPile.DISCARD
+    ) -> None:
+        """Add list of cards to a specified pile. Increases overall deck
+        counts. See Deck.add.
+        """
+        if isinstance(cards, Card):
+            cards = [cards]
+
+        ids = self._to_ids(cards)
+
+        # If cards is an empty list
+        if not ids:
+            return
+
+        if to_pile == DeckPile.DISCARD or to_pile == DeckPile.HAND:
+            self._push(PILE_IDXS[to_pile], ids)
+        elif to_pile == DeckPile.DRAW:
+            # Add to top of draw pile
+            self._push(DRAW, ids, front=True)
+        else:
+            raise NotImplementedError("not implemented")
+        self._add_counts(ids)
+
+    def move(
+        self,
+        targets: Targets,
+        *,
+        from_pile: DeckPile,
+        to_pile: DeckPile,
+        to_pos: str = "TOP",
+    ) -> None:
+        """Move list of cards from one pile to another. Preserves overall deck
+        counts, unless the cards are moved to the trash. See Deck.move.
+
+        Raises:
+            RuntimeError: If any cards could not be found in from_pile
+        """
+        if isinstance(targets, Card) or isinstance(targets, int):
+            targets_arr = [targets]
+        else:
+            targets_arr = list(targets)
+
+        # If targets_arr is an empty list
+        if not targets_arr:
+            return
+
+        from_idx = PILE_IDXS[from_pile]
+        if isinstance(targets_arr[0], int):
+            target_idxs = set(targets_arr)
+        else:  # List of Cards; take the first matching copy of each
+            wanted = {}
+            for card in targets_arr:
+                idx = CARD_IDS[card]
+                wanted[idx] = wanted.get(idx, 0) + 1
+
+            target_idxs = set()
+            for pos, idx in enumerate(self._piles[from_idx]):
+                if wanted.get(idx):
+                    wanted[idx] -= 1
+                    target_idxs.add(pos)
+
+            # If not every card was found, some are missing from the from pile
+            if len(target_idxs) < len(targets_arr):
+                raise RuntimeError("desired card not found in from_pile")
+
+        moved = self._take_indices(from_idx, target_idxs)
+
+        if to_pile == DeckPile.TRASH:
+            self._remove_counts(moved)
+            return
+
+        if to_pos == "TOP":
+            self._push(PILE_IDXS[to_pile], moved)
+        elif to_pos == "BOTTOM":
+            self._push(PILE_IDXS[to_pile], moved, front=True)
+        else:
+            raise NotImplementedError("not implemented")
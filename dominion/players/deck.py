@@ -7,13 +7,14 @@ cleanup).
 """
 
 # Python stdlib
-import random  # For shuffle
+import random  # Default generator for shuffles
 from collections import defaultdict
-from typing import List, Sequence, Union
+from typing import List, Optional, Sequence, Union
 
 # From dominion module
 from dominion.cards import Card
 from dominion.cards.base_game import STARTER_DECK
+from dominion.cards.registry import CARD_IDS, count_coins
 from dominion.common import DeckPile
 
 # target can be a list of ints or Cards, int, or Card
@@ -21,41 +22,152 @@ Targets = Union[Sequence[Union[int, Card]], int, Card]
 
 
 class Deck:
-    def __init__(self, *, starter_deck: Sequence[Card] = STARTER_DECK):
+    def __init__(
+        self,
+        *,
+        starter_deck: Sequence[Card] = STARTER_DECK,
+        debug: bool = False,
+        shuffle: bool = True,
+        rng: Optional[random.Random] = None,
+    ):
         """A Deck has a draw pile, discard pile, hand, a way to hold played cards
-        during a turn, and a dict of card counts.
+        during a turn, a dict of card counts, and the coins the treasures in
+        hand are worth (hand_coins), kept up to date as cards move.
+
+        Args:
+            starter_deck (Sequence[Card]): The cards the deck starts with.
+            debug (bool): If True, checks the incrementally kept card counts
+                against a full recount after every operation that changes them.
+            shuffle (bool): If False, the draw pile keeps the order of
+                starter_deck, e.g. to replay a recorded game.
+            rng (random.Random): Generator for shuffles. Defaults to the random
+                module; a GameContext replaces it with the game's generator.
         """
+        self.debug = debug
+        self.rng = rng or random
         self.draw_pile = list(starter_deck)
-        random.shuffle(self.draw_pile)
+        if shuffle:
+            self.rng.shuffle(self.draw_pile)
+        # Called with the discard pile after each reshuffle, before it becomes
+        # the draw pile; may reorder it in place (see dominion.recording)
+        self.on_shuffle = None
         self.discard_pile = []
         self.hand = []
+        self.hand_coins = 0
         self.played_cards = []
         self._update_counts()
 
     def __len__(self):
         """Returns the total number of cards in the deck."""
-        return sum([v for v in self.counts.values()])
+        return self._n_cards
 
     def _reshuffle(self) -> None:
         """Helper method that shuffles the discard pile back into the draw
         pile.
         """
-        random.shuffle(self.discard_pile)
+        self.rng.shuffle(self.discard_pile)
+        if self.on_shuffle is not None:
+            self.on_shuffle(self.discard_pile)
         self.draw_pile += self.discard_pile
         self.discard_pile = []
 
+    def shuffle_draw_pile(self) -> None:
+        """Shuffles the draw pile in place, e.g. to deal a starting deck. The
+        new order depends only on the cards and the generator, not on the
+        order the pile was in.
+        """
+        self.draw_pile.sort(key=CARD_IDS.__getitem__)
+        self.rng.shuffle(self.draw_pile)
+
     def _update_counts(self) -> None:
-        """Helper that recounts all the cards in the player's possession. Used
-        when cards are (1) trashed or (2) acquired via add().
+        """Helper that recounts all the cards in the player's possession. Only
+        used on creation; afterwards, counts are kept up to date by
+        _add_counts() and _remove_counts().
         """
         self.counts = defaultdict(int)
-        for card in self.draw_pile + self.discard_pile + self.hand + self.played_cards:
+        for pile in (self.draw_pile, self.discard_pile, self.hand, self.played_cards):
+            for card in pile:
+                self.counts[card] += 1
+        self._n_cards = sum(self.counts.values())
+
+    def _add_counts(self, cards: Sequence[Card]) -> None:
+        """Helper that counts cards entering the player's possession."""
+        for card in cards:
             self.counts[card] += 1
+        self._n_cards += len(cards)
+
+        if self.debug:
+            self.check_counts()
+
+    def _remove_counts(self, cards: Sequence[Card]) -> None:
+        """Helper that uncounts cards leaving the player's possession."""
+        for card in cards:
+            self.counts[card] -= 1
+            if self.counts[card] == 0:
+                del self.counts[card]
+        self._n_cards -= len(cards)
+
+        if self.debug:
+            self.check_counts()
+
+    def check_counts(self) -> None:
+        """Verifies the card counts against a full recount of every pile.
+
+        Raises:
+            RuntimeError: If the counts have drifted from the piles.
+        """
+        recount = defaultdict(int)
+        for pile in (self.draw_pile, self.discard_pile, self.hand, self.played_cards):
+            for card in pile:
+                recount[card] += 1
+
+        # Reading a defaultdict can leave zero entries behind; ignore them
+        counts = {card: n for card, n in self.counts.items() if n}
+        if counts != recount or self._n_cards != sum(recount.values()):
+            raise RuntimeError("deck counts do not match the cards in the deck")
+        if self.hand_coins != count_coins(self.hand):
+            raise RuntimeError("hand coins do not match the cards in hand")
+
+    def snapshot(self) -> tuple:
+        """Captures the contents of every pile, for restore() to return to.
+        Cards are shared singletons, so copying the piles is enough.
+        """
+        return (
+            tuple(self.draw_pile),
+            tuple(self.discard_pile),
+            tuple(self.hand),
+            tuple(self.played_cards),
+            dict(self.counts),
+            self._n_cards,
+        )
+
+    def restore(self, state: tuple) -> None:
+        """Returns the deck to a state captured by snapshot()."""
+        draw, discard, hand, played, counts, self._n_cards = state
+        self.draw_pile = list(draw)
+        self.discard_pile = list(discard)
+        self.hand = list(hand)
+        self.hand_coins = count_coins(self.hand)
+        self.played_cards = list(played)
+        self.counts = defaultdict(int, counts)
+
+    def redeal(self, include_hand: bool = True) -> None:
+        """Shuffles the draw pile, along with the hand if include_hand, and
+        deals back a hand of the same size. Counts are unchanged. Used to
+        resample the cards a player cannot see, e.g. when searching a game.
+        """
+        n_hand = len(self.hand) if include_hand else 0
+        pool = self.draw_pile + self.hand[:n_hand]
+        self.rng.shuffle(pool)
+        self.hand = pool[:n_hand] + self.hand[n_hand:]
+        self.hand_coins = count_coins(self.hand)
+        self.draw_pile = pool[n_hand:]
 
     def _discard_hand(self) -> None:
         """Helper (only used in Deck) to move cards in hand to discard pile."""
         self.discard_pile += self.hand
         self.hand = []
+        self.hand_coins = 0
 
     def draw_cards(
         self, n: int, replace_hand: bool = True, to_caller: bool = False
@@ -86,10 +198,11 @@ class Deck:
 
         # Return cards to caller if specified; otherwise, add to hand
         if to_caller:
-            self._update_counts()
+            self._remove_counts(drawn)
             return drawn
 
         self.hand += drawn
+        self.hand_coins += count_coins(drawn)
         return self.hand
 
     def trash(self, cards: Targets, from_pile: DeckPile = DeckPile.HAND) -> None:
@@ -112,7 +225,6 @@ class Deck:
             RuntimeError: If any cards could not be found in from_pile
         """
         self.move(cards, from_pile=from_pile, to_pile=DeckPile.TRASH)
-        self._update_counts()
 
     def cleanup(self) -> None:
         """Moves any cards in the played pile to the discard pile. Called when
@@ -148,12 +260,13 @@ class Deck:
             self.discard_pile += cards_arr
         elif to_pile == DeckPile.HAND:
             self.hand += cards_arr
+            self.hand_coins += count_coins(cards_arr)
         elif to_pile == DeckPile.DRAW:
             # Add to top of draw pile
             self.draw_pile = cards_arr + self.draw_pile
         else:
             raise NotImplementedError("not implemented")
-        self._update_counts()
+        self._add_counts(cards_arr)
 
     def move(
         self,
@@ -164,7 +277,7 @@ class Deck:
         to_pos: str = "TOP",
     ) -> None:
         """Move list of cards from one pile to another. Preserves overall deck
-        counts.
+        counts, unless the cards are moved to the trash.
 
         Args:
             targets: (list or int or Dominion.cards.Card): Accepts a list or
@@ -223,7 +336,15 @@ class Deck:
 
         # Change internal contents by assigning to the *elements* of the list
         from_loc[:] = new_from_loc
+        if from_pile == DeckPile.HAND:
+            self.hand_coins -= count_coins(moved)
+
+        if to_pile == DeckPile.TRASH:
+            self._remove_counts(moved)
+            return
 
+        if to_pile == DeckPile.HAND:
+            self.hand_coins += count_coins(moved)
         if to_pos == "TOP":
             to_loc[:] = to_loc + moved
         elif to_pos == "BOTTOM":
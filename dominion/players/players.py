@@ -9,18 +9,53 @@ from math import floor
 # From dominion module
 import dominion.util.logging as logging
 from dominion.cards.base_game import CURSE, DUCHY, ESTATE, GARDENS, PROVINCE
-from dominion.common import CardType, PlayerType
+from dominion.common import PlayerType
 from dominion.controller import Controller
 from dominion.policy import Policy
 
 from .deck import Deck
 
 
+class TurnState:
+    """Counters for the turn in progress, reset at cleanup."""
+
+    __slots__ = ("coins", "spent", "actions", "buys")
+
+    def __init__(self) -> None:
+        self.coins = 0  # Bonus coins from action cards, e.g. +(2)
+        self.spent = 0  # Coins spent on buys
+        self.actions = 0  # Action cards played from hand
+        self.buys = 0  # Cards bought
+
+    def snapshot(self) -> tuple:
+        return (self.coins, self.spent, self.actions, self.buys)
+
+    def restore(self, state: tuple) -> None:
+        self.coins, self.spent, self.actions, self.buys = state
+
+
 class Player(ABC):
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, deck=None) -> None:
+        """Creates a player.
+
+        Args:
+            name (str): The player's name.
+            deck (Deck|CompactDeck): Optional starting deck. Defaults to a new
+                Deck.
+        """
         self.name = name
-        self.deck = Deck()
-        self.modifiers = {}
+        self.deck = deck if deck is not None else Deck()
+        self.turn = TurnState()
+        self.n_bought = 0  # Cards bought (not gained) over the whole game
+        self.log_sink = None  # Set by the GameContext; None is the default sink
+        self.recorder = None  # Set by the GameContext if the game is recorded
+
+    @property
+    def show_enabled(self) -> bool:
+        """Whether anything shown to the player is ever read. Messages that are
+        costly to build (e.g. copies of a hand) are skipped when it is not.
+        """
+        return (self.log_sink or logging.default_sink).enabled
 
     @property
     def hand(self):
@@ -29,32 +64,30 @@ class Player(ABC):
 
     @property
     def treasure(self):
-        """ How much treasure the player has on hand."""
-        total = 0
-        for card in self.hand:
-            if card.kind == CardType.TREASURE:
-                total += card.value
-
-        if "extra_treasure" in self.modifiers:
-            total += self.modifiers["extra_treasure"]
-
-        if "spent" in self.modifiers:
-            total -= self.modifiers["spent"]
-
-        return total
+        """ How much treasure the player has on hand: the coins in hand plus any
+        bonus coins, less what was spent this turn.
+        """
+        turn = self.turn
+        return self.deck.hand_coins + turn.coins - turn.spent
 
     def cleanup(self):
-        # Reset modifiers
-        self.modifiers = {}
+        # Start a new turn
+        self.turn = TurnState()
 
         # Move played cards to discard
         self.deck.cleanup()
 
-    def set_modifier(self, key, func, default=0):
-        if key not in self.modifiers:
-            self.modifiers[key] = default
+    def snapshot(self) -> tuple:
+        """Captures the player's mutable game state: their deck, turn state
+        and buy count. Policies are not included.
+        """
+        return (self.deck.snapshot(), self.turn.snapshot(), self.n_bought)
 
-        self.modifiers[key] = func(self.modifiers[key])
+    def restore(self, state: tuple) -> None:
+        """Returns the player to a state captured by snapshot()."""
+        deck_state, turn_state, self.n_bought = state
+        self.deck.restore(deck_state)
+        self.turn.restore(turn_state)
 
     @abstractmethod
     def get_input(self, prompt, options, allow_skip=False):
@@ -84,8 +117,8 @@ class Player(ABC):
 
 
 class HumanPlayer(Player):
-    def __init__(self, name):
-        super().__init__(name)
+    def __init__(self, name, deck=None):
+        super().__init__(name, deck=deck)
         self.type = PlayerType.HUMAN
         self.controller = Controller()
 
@@ -93,22 +126,29 @@ class HumanPlayer(Player):
         """
         @param options (dict): Number -> String option
         """
-        return self.controller.get_input(prompt, options, allow_skip=allow_skip)
+        # Prompts may be lazily rendered Messages
+        choice = self.controller.get_input(str(prompt), options, allow_skip=allow_skip)
+        if self.recorder is not None:
+            self.recorder.record_choice(self, options, choice)
+        return choice
 
     def show(self, text):
         # TODO: incorporate with logging: to player, and to display, but not to game
-        logging.log(self.name, text)
+        logging.log(self.name, text, sink=self.log_sink)
 
 
 class ComputerPlayer(Player):
-    def __init__(self, name: str, policy: Policy) -> None:
-        super().__init__(name)
+    def __init__(self, name: str, policy: Policy, deck=None) -> None:
+        super().__init__(name, deck=deck)
         self.type = PlayerType.COMPUTER
         self.policy = policy
 
     def get_input(self, _, options, allow_skip: bool = False):
         # Consult the policy on what the action should be
-        return self.policy.get_input(options, allow_skip=allow_skip)
+        choice = self.policy.get_input(options, allow_skip=allow_skip)
+        if self.recorder is not None:
+            self.recorder.record_choice(self, options, choice)
+        return choice
 
     def show(self, text):
-        logging.log(self.name, text)
+        logging.log(self.name, text, sink=self.log_sink)
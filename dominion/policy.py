@@ -6,21 +6,62 @@ or test mode.
 """
 
 # Python stdlib
+import math
 import random
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 import numpy as np
 
+# From dominion module
+import dominion.util.logging as logging
+from dominion.batching import InferenceBatcher
+from dominion.policy_server import Address, RemoteModel
+
 
 class Policy(ABC):
     def __init__(self) -> None:
-        pass
+        # Source of the policy's random choices. Replaced by the game's
+        # generator when the policy is bound to a game
+        self.rng = random.Random()
 
     @abstractmethod
     def get_input(self, options, **kwargs):
         pass
 
+    def pop_experiences(self) -> list:
+        """Returns and clears any experience collected since the last call.
+        Policies that do not learn have none.
+        """
+        return []
+
+    def bind(self, ctx) -> None:
+        """Called with the GameContext of each game the policy is seated in,
+        before the game starts. Policies that look at the game override it,
+        and call this to draw from the game's generator.
+        """
+        self.rng = ctx.rng
+
+
+class AsyncPolicy(Policy):
+    """A policy whose get_input is a coroutine, for policies that spend their
+    time waiting rather than computing. Only games played on an event loop
+    (dominion.engine.play_async, SimulationRunner.run_async) can await it.
+    """
+
+    @abstractmethod
+    async def get_input(self, options, **kwargs):
+        pass
+
+    def bind(self, ctx) -> None:
+        """AsyncPolicies can be shared by the games in flight (see
+        SimulationRunner.run_async), so by default they are not bound to any
+        of them, and keep drawing from their own generator. Those that need
+        the game override this, and are then given a copy per game.
+        """
+        pass
+
 
 class RandomPolicy(Policy):
     def __init__(self) -> None:
@@ -30,7 +71,7 @@ class RandomPolicy(Policy):
         if allow_skip:
             options = {**options, -1: "Skip"}
 
-        chosen_action, label = random.choice(list(options.items()))
+        chosen_action, label = self.rng.choice(list(options.items()))
         if chosen_action == -1:
             return label  # "Skip"
         return chosen_action
@@ -51,16 +92,23 @@ class QLearningPolicy(TrainablePolicy):
         self.epsilon = epsilon
         self.prev_reward = None
         self.raw_state_cb = raw_state_cb
+        self.experiences = []
 
     def _get_raw_state(self):
         return self.raw_state_cb()
 
     def _extract_features(self, action: int, action_label: str):
+        # Features are not built from the raw state yet, so this returns None.
+        # Subclasses must override it to give the model precomputed features
         raw_state = self._get_raw_state()
         pass
 
     def _add_experience(self, reward: float, beta):
-        pass
+        self.experiences.append((beta, reward))
+
+    def pop_experiences(self) -> list:
+        experiences, self.experiences = self.experiences, []
+        return experiences
 
     def _get_best_action(self, options):
         # Get betas to feed to network by extracting features
@@ -86,8 +134,8 @@ class QLearningPolicy(TrainablePolicy):
             Uses a Epsilon-greedy policy that updates with each game (after model
             is trained)
             """
-            if random.random() < self.epsilon:  # With probability epsilon, explore
-                chosen_action, label = random.choice(list(options.items()))
+            if self.rng.random() < self.epsilon:  # With probability epsilon, explore
+                chosen_action, label = self.rng.choice(list(options.items()))
                 beta = self._extract_features(chosen_action, label)
             else:
                 chosen_action, beta = self._get_best_action(options)
@@ -103,3 +151,294 @@ class QLearningPolicy(TrainablePolicy):
         else:
             chosen_action, beta = self._get_best_action(options)
             return chosen_action
+
+
+class _BatchedModel:
+    """Stands in for a model, sending its predict calls through a batcher."""
+
+    def __init__(self, batcher: InferenceBatcher) -> None:
+        self.batcher = batcher
+
+    def predict(self, x):
+        return self.batcher.predict(x)
+
+
+class _ModelWrapperPolicy(Policy):
+    """Base of policies that wrap a TrainablePolicy and swap its model for a
+    stand-in. Everything else is delegated to the wrapped policy.
+    """
+
+    def __init__(self, policy: TrainablePolicy, model) -> None:
+        super().__init__()
+        self.policy = policy
+        policy.model = model
+
+    def get_input(self, options, **kwargs):
+        return self.policy.get_input(options, **kwargs)
+
+    def pop_experiences(self) -> list:
+        return self.policy.pop_experiences()
+
+    def bind(self, ctx) -> None:
+        super().bind(ctx)
+        self.policy.bind(ctx)
+
+
+class BatchedPolicy(_ModelWrapperPolicy):
+    def __init__(self, policy: TrainablePolicy, batcher: InferenceBatcher) -> None:
+        """Wraps a policy so its model's predictions are made in batches shared
+        with every other policy using the same batcher. Meant for games played
+        concurrently in threads, with one BatchedPolicy per seat of each game;
+        the wrapped policy otherwise behaves exactly as before.
+
+        Batching only helps policies that have features to predict on:
+        QLearningPolicy._extract_features is still a stub that returns None,
+        so wrap a subclass that implements it.
+
+        Args:
+            policy (TrainablePolicy): The policy to wrap. Its model is replaced
+                by a stand-in that calls the batcher.
+            batcher (InferenceBatcher): Makes the batched calls, usually with
+                the wrapped policy's original model's predict.
+        """
+        super().__init__(policy, _BatchedModel(batcher))
+        self.batcher = batcher
+
+
+class RemotePolicy(_ModelWrapperPolicy):
+    def __init__(
+        self,
+        policy: TrainablePolicy,
+        address: Address,
+        authkey: bytes,
+        model: str = "default",
+    ) -> None:
+        """Wraps a policy so its model runs in a PolicyServer (see
+        dominion.policy_server), over connections pooled by the process. The
+        wrapped policy can be created without a model. Unlike the model
+        itself, a RemotePolicy pickles cheaply, so it can be handed to
+        ParallelSimulationRunner workers.
+
+        Args:
+            policy (TrainablePolicy): The policy to wrap. Its model is replaced
+                by a RemoteModel.
+            address (Address): The server's Unix socket path, or (host, port).
+            authkey (bytes): The server's key (see PolicyServer.authkey and
+                dominion.policy_server.read_authkey).
+            model (str): Which of the server's models to use.
+        """
+        super().__init__(policy, RemoteModel(address, authkey, name=model))
+
+
+class _Node:
+    """A node in an MCTSPolicy search tree. Children are keyed by the choice
+    that leads to them. Since hidden cards are resampled on every rollout, a
+    choice is not always available; avail counts how often it was.
+    """
+
+    __slots__ = ("visits", "value", "avail", "children")
+
+    def __init__(self) -> None:
+        self.visits = 0
+        self.value = 0.0
+        self.avail = 0
+        self.children = {}
+
+    def ucb(self, c: float) -> float:
+        return self.value / self.visits + c * math.sqrt(
+            math.log(self.avail) / self.visits
+        )
+
+
+class MCTSPolicy(Policy):
+    def __init__(
+        self,
+        n_rollouts: Optional[int] = 100,
+        time_limit_ms: Optional[float] = None,
+        rollout_policy: Optional[Policy] = None,
+        max_rollout_turns: Optional[int] = 20,
+        exploration: float = 1.4,
+    ) -> None:
+        """A policy that picks each move with Monte Carlo Tree Search. Every
+        rollout restores the game to the start of the current event, resamples
+        the cards the player cannot see (their draw pile, and other players'
+        hands and draw piles), replays the moves already made in the event, and
+        then plays on. Moves of the searching player are chosen from a tree
+        (UCB1, counting how often each move was available); every other move
+        is made by the rollout policy.
+
+        Search stops when either budget runs out, so at least one must be set.
+
+        Args:
+            n_rollouts (int): Rollouts per move.
+            time_limit_ms (float): Time budget per move, in milliseconds.
+            rollout_policy (Policy): Makes the moves outside the tree, for all
+                players. Defaults to a RandomPolicy.
+            max_rollout_turns (int): Rollouts stop this many turns after the
+                current one and are scored as they stand. If None, rollouts
+                play to the end of the game.
+            exploration (float): The UCB1 exploration constant.
+        Raises:
+            ValueError: If neither budget is set.
+        """
+        super().__init__()
+        if n_rollouts is None and time_limit_ms is None:
+            raise ValueError("MCTSPolicy needs n_rollouts or time_limit_ms")
+
+        self.n_rollouts = n_rollouts
+        self.time_limit_ms = time_limit_ms
+        self.rollout_policy = rollout_policy or RandomPolicy()
+        self.max_rollout_turns = max_rollout_turns
+        self.exploration = exploration
+
+        self.ctx = None
+        self._event = None  # The event the moves in _prefix were made in
+        self._prefix = []
+
+    def bind(self, ctx) -> None:
+        super().bind(ctx)
+        self.rollout_policy.bind(ctx)
+        self.ctx = ctx
+        ctx.checkpoint_events = True
+        self._event = None
+        self._prefix = []
+
+    def get_input(self, options, allow_skip=True):
+        if allow_skip:
+            options = {**options, -1: "Skip"}
+
+        ctx = self.ctx
+        if ctx.current_event is not self._event:
+            self._event = ctx.current_event
+            self._prefix = []
+
+        if len(options) == 1:
+            (choice,) = options
+        else:
+            choice = self._search(options)
+
+        self._prefix.append(choice)
+        if choice == -1:
+            return "Skip"
+        return choice
+
+    def _search(self, options) -> Any:
+        """Runs rollouts until the budget is spent and returns the most visited
+        of the options. The game is left exactly as it was found.
+        """
+        ctx = self.ctx
+        name_to_player = {player.name: player for player in ctx.player_order}
+        me = name_to_player[ctx.current_event.target]
+
+        # Save everything a rollout touches, including the game's generator,
+        # so searching does not change how the real game plays out
+        saved = ctx.snapshot()
+        event, checkpoint, prefix = ctx.current_event, ctx.checkpoint, self._prefix
+        log_sink, recorder, profiler = ctx.log_sink, ctx.recorder, ctx.profiler
+        ctx.checkpoint_events = False
+        ctx.profiler = None  # Searching is timed as part of the real event
+        on_empty, ctx.supply.on_empty = ctx.supply.on_empty, []
+        ctx.set_log_sink(logging.NullSink())
+        ctx.set_recorder(None)
+
+        root = _Node()
+        deadline = None
+        if self.time_limit_ms is not None:
+            deadline = time.perf_counter() + self.time_limit_ms / 1000
+        try:
+            n = 0
+            while self.n_rollouts is None or n < self.n_rollouts:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                self._rollout(root, event, checkpoint, prefix, me, name_to_player)
+                n += 1
+        finally:
+            for player in ctx.player_order:
+                vars(player).pop("get_input", None)  # Remove rollout overrides
+            ctx.restore(saved)
+            ctx.current_event, ctx.checkpoint = event, checkpoint
+            ctx.checkpoint_events = True
+            ctx.set_log_sink(log_sink)
+            ctx.set_recorder(recorder)
+            ctx.profiler = profiler
+            ctx.supply.on_empty = on_empty
+
+        visited = [key for key in options if key in root.children]
+        if not visited:
+            return self.rng.choice(list(options))
+        return max(visited, key=lambda key: root.children[key].visits)
+
+    def _rollout(self, root, event, checkpoint, prefix, me, name_to_player) -> None:
+        """Plays one rollout from the start of the current event and backs its
+        result up the tree.
+        """
+        ctx = self.ctx
+        ctx.restore(checkpoint)
+        me.deck.redeal(include_hand=False)
+        for player in ctx.player_order:
+            if player is not me:
+                player.deck.redeal(include_hand=True)
+
+        rollout_policy = self.rollout_policy
+        replay = list(prefix)
+        path = [root]
+        in_tree = True
+
+        def get_input(_, options, allow_skip=False):
+            nonlocal in_tree
+            choices = {**options, -1: "Skip"} if allow_skip else options
+
+            if replay:
+                choice = replay.pop(0)
+                if choice in choices:
+                    return "Skip" if choice == -1 else choice
+                # Resampling made the recorded move impossible; play on
+                replay.clear()
+
+            if not in_tree:
+                return rollout_policy.get_input(options, allow_skip=allow_skip)
+
+            node = path[-1]
+            for key in choices:
+                if key in node.children:
+                    node.children[key].avail += 1
+
+            untried = [key for key in choices if key not in node.children]
+            if untried:
+                choice = self.rng.choice(untried)
+                node.children[choice] = _Node()
+                node.children[choice].avail = 1
+                in_tree = False  # Expand one node per rollout
+            else:
+                choice = max(
+                    choices, key=lambda key: node.children[key].ucb(self.exploration)
+                )
+            path.append(node.children[choice])
+            return "Skip" if choice == -1 else choice
+
+        def get_other_input(_, options, allow_skip=False):
+            return rollout_policy.get_input(options, allow_skip=allow_skip)
+
+        for player in ctx.player_order:
+            player.get_input = get_input if player is me else get_other_input
+
+        last_turn = None
+        if self.max_rollout_turns is not None:
+            last_turn = ctx.turn + self.max_rollout_turns
+
+        ctx.current_event = event
+        event(ctx, name_to_player[event.target])
+        while not ctx.reached_end():
+            if last_turn is not None and ctx.turn >= last_turn and not ctx.event_queue:
+                break
+            next_event = ctx.get_next_event()
+            next_event(ctx, name_to_player[next_event.target])
+
+        my_score = me.compute_score()
+        best_other = max(p.compute_score() for p in ctx.player_order if p is not me)
+        reward = (
+            1.0 if my_score > best_other else 0.5 if my_score == best_other else 0.0
+        )
+        for node in path:
+            node.visits += 1
+            node.value += reward
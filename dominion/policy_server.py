@@ -0,0 +1,370 @@
+"""A local inference server, so many simulation workers can share a few warm
+models instead of each loading its own. The server hosts one or more named
+models behind a Unix socket or a localhost TCP port. Requests from every
+connection to the same model are batched together (see
+dominion.batching.InferenceBatcher).
+
+The server unpickles what clients send, so only trusted clients may connect:
+every connection must present the server's authkey, and TCP servers only
+listen on loopback addresses.
+
+Clients never import the model's framework: a RemoteModel only needs the
+server's address and key, and sends its predict calls over connections kept
+open in a per-process ConnectionPool. RemoteModels (and the RemotePolicy
+wrapping one in dominion.policy) pickle to just the address and key, so they
+can be shipped to worker processes and connect there on first use.
+
+Intended usage:
+    # In the model host
+    server = PolicyServer({"q": model}, "/tmp/dominion.sock", authkey=key)
+    server.serve_forever()
+
+    # In each worker
+    q_policy = QLearningPolicy(None, raw_state_cb)
+    policy = RemotePolicy(q_policy, "/tmp/dominion.sock", key, model="q")
+
+Or run a host from the command line, with models built by factory functions. It
+writes a new key to policy_server.key (readable by the owner only), for workers
+to load with read_authkey:
+    python -m dominion.policy_server /tmp/dominion.sock --model q=model:Model.get_model
+"""
+
+# Python stdlib
+import argparse
+import importlib
+import ipaddress
+import os
+import signal
+import socket
+import sys
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+# From dominion module
+from dominion.batching import InferenceBatcher
+
+# A Unix socket path, or a (host, port) pair
+Address = Union[str, Tuple[str, int]]
+
+
+def _normalize(address) -> Address:
+    """Helper that turns addresses that went through e.g. JSON back into
+    (host, port) tuples.
+    """
+    return address if isinstance(address, str) else tuple(address)
+
+
+def _is_loopback(host: str) -> bool:
+    """Helper that checks whether a TCP host is only reachable locally."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False  # A hostname, which may resolve to anything
+
+
+def new_authkey() -> bytes:
+    """Returns a random key for a PolicyServer."""
+    return os.urandom(32).hex().encode()
+
+
+def write_authkey(path: str, authkey: bytes) -> None:
+    """Writes a key to a file only its owner can read or write."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.fchmod(fd, 0o600)  # In case the file already existed
+    with os.fdopen(fd, "wb") as f:
+        f.write(authkey)
+
+
+def read_authkey(path: str) -> bytes:
+    """Reads a key written by write_authkey."""
+    with open(path, "rb") as f:
+        return f.read().strip()
+
+
+class PolicyServer:
+    def __init__(
+        self,
+        models: Dict[str, Any],
+        address: Address,
+        authkey: Optional[bytes] = None,
+        max_batch_size: int = 256,
+        max_delay_ms: float = 2.0,
+    ) -> None:
+        """Starts listening on address. Requests are not served until
+        serve_forever() or start() is called.
+
+        Args:
+            models (Dict[str, Any]): Models by name. Each is either an object
+                with a batched predict method, such as a Keras model, or the
+                predict function itself.
+            address (Address): A Unix socket path, or a (host, port) pair
+                with a loopback host. Port 0 picks a free port; see the
+                address attribute.
+            authkey (bytes): The key clients must present. If None, a new key
+                is made; see the authkey attribute.
+            max_batch_size (int): Rows per batched call, per model.
+            max_delay_ms (float): The longest a request waits for others to
+                join its batch, in milliseconds.
+        Raises:
+            ValueError: If a TCP host is not a loopback address. Requests are
+                unpickled, so the server must not be reachable from elsewhere.
+        """
+        address = _normalize(address)
+        if not isinstance(address, str) and not _is_loopback(address[0]):
+            raise ValueError(f"{address[0]!r} is not a loopback address")
+
+        self.batchers = {
+            name: InferenceBatcher(
+                getattr(model, "predict", model),
+                max_batch_size=max_batch_size,
+                max_delay_ms=max_delay_ms,
+            )
+            for name, model in models.items()
+        }
+        self.authkey = authkey if authkey is not None else new_authkey()
+        self._listener = Listener(address, authkey=self.authkey)
+        self.address = self._listener.address
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Serves requests from a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """Accepts connections until the server is closed, serving each from a
+        thread of its own.
+
+        Raises:
+            OSError: If the listening socket fails, e.g. when out of file
+                descriptors.
+        """
+        while True:
+            try:
+                conn = self._listener.accept()
+            except (AuthenticationError, EOFError, ConnectionError):
+                if self._closed:
+                    return
+                continue  # A client that failed to connect or authenticate
+            except OSError:
+                if self._closed:
+                    return
+                raise
+            if self._closed:
+                conn.close()
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: Connection) -> None:
+        """Answers one client's requests until it disconnects."""
+        with conn:
+            while True:
+                try:
+                    name, rows = conn.recv()
+                except (EOFError, OSError):
+                    return
+                batcher = self.batchers.get(name)
+                try:
+                    if batcher is None:
+                        raise KeyError(f"no model named {name!r}")
+                    reply = ("ok", batcher.predict(rows))
+                except Exception as e:
+                    reply = ("error", f"{type(e).__name__}: {e}")
+                try:
+                    conn.send(reply)
+                except OSError:
+                    return
+
+    def close(self) -> None:
+        """Stops accepting connections and serving requests. Clients that
+        are still connected get errors.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        # Wake up the accepting thread, which is blocked until a connection.
+        # A bare socket is used, as a Client would wait for a handshake that
+        # never comes if the thread has stopped on its own meanwhile
+        family = socket.AF_UNIX if isinstance(self.address, str) else socket.AF_INET
+        try:
+            with socket.socket(family) as sock:
+                sock.connect(self.address)
+        except OSError:
+            pass
+        if self._thread is not None:
+            self._thread.join()
+        self._listener.close()
+        for batcher in self.batchers.values():
+            batcher.close()
+
+    def __enter__(self) -> "PolicyServer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ConnectionPool:
+    def __init__(self, address: Address, authkey: bytes) -> None:
+        """Persistent connections to a PolicyServer, shared by every thread of
+        a process. Connections are opened as needed, so there are at most as
+        many as requests made at once, and are kept for reuse.
+
+        Args:
+            address (Address): The server's address.
+            authkey (bytes): The server's key.
+        """
+        self.address = _normalize(address)
+        self.authkey = authkey
+        self.pid = os.getpid()
+        self._idle: List[Connection] = []
+        self._lock = threading.Lock()
+
+    def request(self, model: str, rows: np.ndarray) -> np.ndarray:
+        """Has the server predict rows with the named model.
+
+        Raises:
+            RuntimeError: If the server failed to predict them.
+            OSError: If the server cannot be reached.
+        """
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = Client(self.address, authkey=self.authkey)
+
+        try:
+            conn.send((model, rows))
+            status, payload = conn.recv()
+        except BaseException:
+            conn.close()  # It may be halfway through a message
+            raise
+
+        with self._lock:
+            self._idle.append(conn)
+        if status == "error":
+            raise RuntimeError(f"policy server failed: {payload}")
+        return payload
+
+    def close(self) -> None:
+        """Closes the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_pools: Dict[Tuple[Address, bytes], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(address: Address, authkey: bytes) -> ConnectionPool:
+    """Returns this process's pool of connections to the server at address.
+    A forked child gets pools of its own, rather than sharing its parent's
+    sockets.
+    """
+    key = (_normalize(address), authkey)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.pid != os.getpid():
+            pool = _pools[key] = ConnectionPool(*key)
+        return pool
+
+
+class RemoteModel:
+    def __init__(self, address: Address, authkey: bytes, name: str = "default") -> None:
+        """Stands in for a model hosted by a PolicyServer. Only the address and
+        key are kept, so a RemoteModel can be pickled into other processes.
+
+        Args:
+            address (Address): The server's address.
+            authkey (bytes): The server's key.
+            name (str): Which of the server's models to use.
+        """
+        self.address = _normalize(address)
+        self.name = name
+        self.authkey = authkey
+
+    def predict(self, x) -> np.ndarray:
+        return get_pool(self.address, self.authkey).request(self.name, np.asarray(x))
+
+
+def _load_factory(spec: str):
+    """Helper that resolves "module:attr.path" to the object it names."""
+    module_name, _, path = spec.partition(":")
+    obj = importlib.import_module(module_name)
+    for attr in path.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Host models for RemotePolicy.")
+    parser.add_argument(
+        "address",
+        help="Unix socket path, or host:port to listen on TCP instead. Only "
+        "loopback hosts are allowed.",
+    )
+    parser.add_argument(
+        "--model",
+        action="append",
+        required=True,
+        metavar="NAME=MODULE:FACTORY",
+        help="Serve the model returned by FACTORY() as NAME. Can be repeated.",
+    )
+    parser.add_argument(
+        "--authkey",
+        help="Key clients must present. If not given, a new key is made and "
+        "written to --authkey-file.",
+    )
+    parser.add_argument(
+        "--authkey-file",
+        default="policy_server.key",
+        help="Where to write a new key, readable by the owner only.",
+    )
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-delay-ms", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    address = args.address
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit():
+        address = (host or "127.0.0.1", int(port))
+
+    models = {}
+    for spec in args.model:
+        name, _, factory = spec.partition("=")
+        models[name] = _load_factory(factory)()
+
+    if args.authkey is not None:
+        authkey = args.authkey.encode()
+    else:
+        authkey = new_authkey()
+        write_authkey(args.authkey_file, authkey)
+        print(f"Wrote the key clients must present to {args.authkey_file}")
+
+    server = PolicyServer(
+        models,
+        address,
+        authkey=authkey,
+        max_batch_size=args.max_batch_size,
+        max_delay_ms=args.max_delay_ms,
+    )
+    print(f"Serving {', '.join(models)} on {server.address}")
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # Still clean up
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Opt-in instrumentation for the game loop. A Profiler attached to one or
+more GameContexts times every event, by Event subclass, and every card played,
+keeping call counts, wall time (total, and excluding nested calls) and,
+optionally, the memory allocated. Stats are kept per call stack, e.g. a
+Militia played from a PlayActionEvent is recorded under
+("PlayActionEvent", "Militia.play"), so they can be exported as a flat table,
+as JSON, or as collapsed stacks for flame graph tools.
+
+Intended usage:
+    profiler = Profiler()
+    SimulationRunner(policies, profiler=profiler).run(100)
+    print(profiler.format_table())
+    profiler.save_collapsed("games.folded")  # For flamegraph.pl or speedscope
+"""
+
+# Python stdlib
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+
+class StackStats:
+    """Stats of one call stack, in nanoseconds and bytes."""
+
+    __slots__ = ("calls", "total_ns", "self_ns", "bytes")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_ns = 0
+        self.self_ns = 0  # Excluding time spent in nested events and cards
+        self.bytes = 0  # Net bytes allocated, if the profiler tracks memory
+
+
+class NameStats(NamedTuple):
+    """Stats of one event type or card, over every stack it appears in."""
+
+    name: str
+    calls: int
+    total_ns: int
+    self_ns: int
+    bytes: int
+
+
+class Profiler:
+    def __init__(self, memory: bool = False) -> None:
+        """Creates an empty profiler.
+
+        Args:
+            memory (bool): If True, also records the net memory allocated by
+                each call, using tracemalloc. This slows games down a lot, so
+                timings are best taken with it off.
+        """
+        self.memory = memory
+        self.stats: Dict[Tuple[str, ...], StackStats] = {}
+        self._stack: List[str] = []
+        self._child_ns: List[int] = []  # Time of nested calls, per stack level
+        # Whether tracing was started here, rather than by the caller
+        self._started_tracing = memory and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+
+    def close(self) -> None:
+        """Stops memory tracing, if this profiler started it."""
+        if self._started_tracing:
+            self._started_tracing = False
+            tracemalloc.stop()
+
+    def run(self, name: str, func: Callable[..., Any], *args) -> Any:
+        """Calls func(*args), recording it under name, nested in any calls
+        being recorded already.
+        """
+        self._stack.append(name)
+        self._child_ns.append(0)
+        memory = tracemalloc.get_traced_memory()[0] if self.memory else 0
+        tick = time.perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter_ns() - tick
+            key = tuple(self._stack)
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = StackStats()
+            stats.calls += 1
+            stats.total_ns += elapsed
+            stats.self_ns += elapsed - self._child_ns.pop()
+            if self.memory:
+                stats.bytes += tracemalloc.get_traced_memory()[0] - memory
+
+            self._stack.pop()
+            if self._child_ns:
+                self._child_ns[-1] += elapsed
+
+    def reset(self) -> None:
+        """Clears all stats."""
+        self.stats = {}
+
+    def by_name(self) -> List[NameStats]:
+        """Returns stats per event type or card, summed over every stack it
+        appears in, most total time first. Totals only count the outermost
+        call when a name is nested in itself (e.g. Throne Room on Throne Room).
+        """
+        totals: Dict[str, List[int]] = {}
+        for key, stats in self.stats.items():
+            name = key[-1]
+            entry = totals.setdefault(name, [0, 0, 0, 0])
+            entry[0] += stats.calls
+            entry[2] += stats.self_ns
+            if name not in key[:-1]:
+                entry[1] += stats.total_ns
+                entry[3] += stats.bytes
+        rows = [NameStats(name, *entry) for name, entry in totals.items()]
+        return sorted(rows, key=lambda row: row.total_ns, reverse=True)
+
+    def format_table(self) -> str:
+        """Formats by_name() as a table."""
+        rows = self.by_name()
+        width = max([len(row.name) for row in rows] + [4])
+        header = (
+            f"{'name':<{width}}  {'calls':>9}  {'total ms':>10}  {'self ms':>10}  "
+            f"{'mean us':>9}"
+        )
+        if self.memory:
+            header += f"  {'KiB':>10}"
+        lines = [header, "-" * len(header)]
+        for row in rows:
+            line = (
+                f"{row.name:<{width}}  {row.calls:>9}  {row.total_ns / 1e6:>10.1f}  "
+                f"{row.self_ns / 1e6:>10.1f}  {row.total_ns / row.calls / 1e3:>9.1f}"
+            )
+            if self.memory:
+                line += f"  {row.bytes / 1024:>10.1f}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def to_json(self) -> dict:
+        """Returns the stats, per name and per stack, as JSON-compatible
+        values.
+        """
+        return {
+            "names": [row._asdict() for row in self.by_name()],
+            "stacks": [
+                {
+                    "stack": list(key),
+                    "calls": stats.calls,
+                    "total_ns": stats.total_ns,
+                    "self_ns": stats.self_ns,
+                    "bytes": stats.bytes,
+                }
+                for key, stats in self.stats.items()
+            ],
+        }
+
+    def save_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_json(), f, indent=2)
+
+    def to_collapsed(self) -> str:
+        """Returns the stacks in the collapsed format read by flamegraph.pl,
+        speedscope and similar tools: one "a;b;c <self time in us>" line per
+        stack.
+        """
+        return "\n".join(
+            f"{';'.join(key)} {stats.self_ns // 1000}"
+            for key, stats in sorted(self.stats.items())
+        )
+
+    def save_collapsed(self, path: str) -> None:
+        with open(path, "w") as f:
+            f.write(self.to_collapsed() + "\n")
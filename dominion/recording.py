@@ -0,0 +1,366 @@
+"""Compact binary recordings of games. A GameRecorder appends each game it is
+given to a file: the game's seed, the kingdom, each player's starting draw
+pile, and then, in order, every decision (options offered and choice taken),
+every reshuffle, and every change to the supply, with a marker at the start of
+each turn. A game
+between two random players takes a few kilobytes, instead of the hundreds of
+kilobytes of its text logs.
+
+A ReplayReader reads the games back, and simulate() re-plays any of them
+exactly, up to the end or to the start of any turn. Shuffles are stored as their
+outcomes, so replays do not depend on the random generators or on the policies
+that originally played the game.
+
+Intended usage:
+    recorder = GameRecorder("games.rec")
+    SimulationRunner(policies, recorder=recorder).run(1000)
+    recorder.close()
+
+    reader = ReplayReader("games.rec")
+    ctx = simulate(reader[12], turn=8)
+"""
+
+# Python stdlib
+import os
+import struct
+from collections import deque
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+# From dominion module
+import dominion.util.logging as logging
+from dominion.cards.registry import ALL_CARDS, CARD_IDS
+from dominion.game import GameContext
+from dominion.players import ComputerPlayer, Deck
+from dominion.policy import Policy
+
+MAGIC = b"DOMREC"
+VERSION = 2
+
+# Record tags. Every record is a tag byte followed by its fields.
+TURN = 1  # turn (H)
+CHOICE = 2  # seat (B), n options (B), option keys (h each), choice (h)
+SHUFFLE = 3  # seat (B), n cards (H), card IDs (B each)
+SUPPLY = 4  # n changed piles (B), then pile index (B) and delta (h) for each
+END = 5  # turns (H), then one score (h) per player
+
+SKIP = -1  # How a skipped decision is stored
+
+
+class Choice(NamedTuple):
+    """A decision made during a recorded game. choice is "Skip" if the player
+    skipped.
+    """
+
+    turn: int
+    seat: int
+    options: Tuple[int, ...]
+    choice: object
+
+
+class RecordedGame(NamedTuple):
+    """A game read back from a recording. Lists of cards hold Card objects.
+
+    records holds the game's records in order, as (tag, fields) pairs.
+    """
+
+    names: List[str]
+    seed: int  # Seed of the game's generator
+    kingdom: list
+    draw_piles: List[list]  # Each player's draw pile at the start of the game
+    records: List[Tuple[int, tuple]]
+    turns: int
+    scores: List[int]
+
+    @property
+    def choices(self) -> List[Choice]:
+        """Every decision in the game, in order."""
+        turn, choices = 0, []
+        for tag, fields in self.records:
+            if tag == TURN:
+                (turn,) = fields
+            elif tag == CHOICE:
+                seat, options, choice = fields
+                choice = "Skip" if choice == SKIP else choice
+                choices.append(Choice(turn, seat, options, choice))
+        return choices
+
+
+def _pack_cards(buf: bytearray, cards, fmt: str = "<H") -> None:
+    """Helper that appends a count and the IDs of cards to buf."""
+    buf += struct.pack(fmt, len(cards))
+    buf += bytes([CARD_IDS[card] for card in cards])
+
+
+class GameRecorder:
+    def __init__(self, path: str) -> None:
+        """Opens the recording at path, appending to it if it exists.
+
+        Args:
+            path (str): File the games are written to.
+        Raises:
+            ValueError: If the file exists but is not a recording of this
+                version.
+        """
+        self.path = path
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with open(path, "rb") as f:
+                _read_header(f)
+        self.file = open(path, "ab")
+        if not exists:
+            self.file.write(MAGIC + bytes([VERSION]))
+
+        self.n_games = 0
+        self._buf = None
+
+    def start(self, ctx: GameContext) -> None:
+        """Starts recording a game. Called by the GameContext once it is set
+        up, before any events have been played.
+        """
+        buf = self._buf = bytearray()
+        self._seats = {player: seat for seat, player in enumerate(ctx.player_order)}
+        self._supply = ctx.supply.snapshot()
+        self._turn = ctx.turn
+
+        buf += struct.pack("<QB", ctx.seed, len(ctx.player_order))
+        for player in ctx.player_order:
+            name = player.name.encode()
+            buf.append(len(name))
+            buf += name
+        _pack_cards(buf, list(ctx.supply.kingdom), fmt="<B")
+        for player in ctx.player_order:
+            _pack_cards(buf, list(player.deck.draw_pile))
+
+    def record_event(self, ctx: GameContext) -> None:
+        """Records the start of a new turn and any change to the supply since
+        the last event. Called by the GameContext before each event.
+        """
+        supply = ctx.supply.snapshot()
+        if supply != self._supply:
+            changes = [
+                (idx, n - old)
+                for idx, (old, n) in enumerate(zip(self._supply, supply))
+                if n != old
+            ]
+            self._buf += struct.pack("<BB", SUPPLY, len(changes))
+            for idx, delta in changes:
+                self._buf += struct.pack("<Bh", idx, delta)
+            self._supply = supply
+
+        if ctx.turn != self._turn:
+            self._buf += struct.pack("<BH", TURN, ctx.turn)
+            self._turn = ctx.turn
+
+    def record_choice(self, player, options, choice) -> None:
+        """Records a decision: the option keys offered and the one taken."""
+        keys = list(options)
+        self._buf += struct.pack(
+            f"<BBB{len(keys)}hh",
+            CHOICE,
+            self._seats[player],
+            len(keys),
+            *keys,
+            SKIP if choice == "Skip" else choice,
+        )
+
+    def record_shuffle(self, player, cards) -> None:
+        """Records the order of a player's reshuffled discard pile."""
+        self._buf += struct.pack("<BB", SHUFFLE, self._seats[player])
+        _pack_cards(self._buf, cards)
+
+    def finish(self, ctx: GameContext) -> None:
+        """Ends the game, and appends it to the file as a single write."""
+        self.record_event(ctx)
+        scores = [player.compute_score() for player in ctx.player_order]
+        self._buf += struct.pack(f"<BH{len(scores)}h", END, ctx.turn, *scores)
+
+        self.file.write(struct.pack("<I", len(self._buf)))
+        self.file.write(self._buf)
+        self.n_games += 1
+        self._buf = None
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def _read_header(f) -> None:
+    """Helper that checks the file header of a recording."""
+    header = f.read(len(MAGIC) + 1)
+    if header[: len(MAGIC)] != MAGIC or header[len(MAGIC) :] != bytes([VERSION]):
+        raise ValueError(f"{f.name} is not a version {VERSION} game recording")
+
+
+def _parse_game(data: bytes) -> RecordedGame:
+    """Helper that decodes the payload of one recorded game."""
+    pos = 0
+
+    def take(fmt):
+        nonlocal pos
+        fields = struct.unpack_from(fmt, data, pos)
+        pos += struct.calcsize(fmt)
+        return fields
+
+    def take_cards(fmt="<H"):
+        nonlocal pos
+        (n,) = take(fmt)
+        cards = [ALL_CARDS[idx] for idx in data[pos : pos + n]]
+        pos += n
+        return cards
+
+    seed, n_players = take("<QB")
+    names = []
+    for _ in range(n_players):
+        (n,) = take("<B")
+        names.append(data[pos : pos + n].decode())
+        pos += n
+    kingdom = take_cards("<B")
+    draw_piles = [take_cards() for _ in range(n_players)]
+
+    records = []
+    while True:
+        (tag,) = take("<B")
+        if tag == TURN:
+            records.append((TURN, take("<H")))
+        elif tag == CHOICE:
+            seat, n = take("<BB")
+            *options, choice = take(f"<{n + 1}h")
+            records.append((CHOICE, (seat, tuple(options), choice)))
+        elif tag == SHUFFLE:
+            (seat,) = take("<B")
+            records.append((SHUFFLE, (seat, take_cards())))
+        elif tag == SUPPLY:
+            (n,) = take("<B")
+            records.append((SUPPLY, tuple(take("<Bh") for _ in range(n))))
+        elif tag == END:
+            turns, *scores = take(f"<H{n_players}h")
+            return RecordedGame(
+                names, seed, kingdom, draw_piles, records, turns, scores
+            )
+        else:
+            raise ValueError(f"unknown record tag {tag} at byte {pos - 1}")
+
+
+class _ReplayPolicy(Policy):
+    """Plays back one player's recorded choices."""
+
+    def __init__(self, choices: deque) -> None:
+        super().__init__()
+        self.choices = choices
+
+    def get_input(self, options, allow_skip=True):
+        options_taken, choice = self.choices.popleft()
+        if tuple(options) != options_taken:
+            raise ValueError(
+                f"replay diverged: offered {list(options)}, recorded {options_taken}"
+            )
+        return "Skip" if choice == SKIP else choice
+
+
+class ReplayReader:
+    def __init__(self, path: str) -> None:
+        """Opens a recording and indexes the games in it.
+
+        Args:
+            path (str): File written by a GameRecorder.
+        Raises:
+            ValueError: If the file is not a recording of this version.
+        """
+        self.path = path
+        self.offsets = []  # Where each game's payload starts, and its size
+        file_size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            _read_header(f)
+            while True:
+                size = f.read(4)
+                if len(size) < 4:
+                    break
+                (n,) = struct.unpack("<I", size)
+                if f.tell() + n > file_size:
+                    break  # A game cut off mid-write
+                self.offsets.append((f.tell(), n))
+                f.seek(n, os.SEEK_CUR)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, idx: int) -> RecordedGame:
+        offset, n = self.offsets[idx]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return _parse_game(f.read(n))
+
+    def __iter__(self) -> Iterator[RecordedGame]:
+        with open(self.path, "rb") as f:
+            for offset, n in self.offsets:
+                f.seek(offset)
+                yield _parse_game(f.read(n))
+
+
+def simulate(
+    game: RecordedGame, turn: Optional[int] = None, deck_cls: type = Deck
+) -> GameContext:
+    """Re-simulates a recorded game.
+
+    Args:
+        game (RecordedGame): The game to replay.
+        turn (int): If given, stops at the start of this turn, before any of
+            its events have been played. Turn 0 is the setup. If None, plays
+            the game to the end.
+        deck_cls (type): Deck implementation given to each player.
+    Returns:
+        (GameContext) The game, as it stood when the replay stopped. Its
+        log sink is a NullSink.
+    Raises:
+        ValueError: If the replay diverges from the recording, e.g. because
+            the engine has changed since the game was recorded.
+    """
+    choices = [deque() for _ in game.names]
+    shuffles = [deque() for _ in game.names]
+    for tag, fields in game.records:
+        if tag == CHOICE:
+            seat, options, choice = fields
+            choices[seat].append((options, choice))
+        elif tag == SHUFFLE:
+            seat, cards = fields
+            shuffles[seat].append(cards)
+
+    players = [
+        ComputerPlayer(name, _ReplayPolicy(choices[seat]), deck=deck_cls())
+        for seat, name in enumerate(game.names)
+    ]
+
+    def make_shuffle(seat):
+        def on_shuffle(cards):
+            recorded = shuffles[seat].popleft()
+            if sorted(map(CARD_IDS.get, cards)) != sorted(map(CARD_IDS.get, recorded)):
+                raise ValueError(f"replay diverged: reshuffled {list(cards)}")
+            cards[:] = recorded
+
+        return on_shuffle
+
+    ctx = GameContext(
+        players, log_sink=logging.NullSink(), kingdom=game.kingdom, seed=game.seed
+    )
+    # The context deals fresh starting decks; swap in the recorded ones
+    for seat, player in enumerate(players):
+        player.deck = deck_cls(
+            starter_deck=game.draw_piles[seat], shuffle=False, rng=ctx.rng
+        )
+        player.deck.on_shuffle = make_shuffle(seat)
+    if turn == 0:
+        return ctx
+
+    name_to_player = {player.name: player for player in players}
+    while not ctx.reached_end():
+        if not ctx.event_queue:
+            if turn is not None and ctx.turn + 1 >= turn:
+                break
+            if ctx.turn >= game.turns:
+                break  # The game was stopped at a turn limit
+
+        event = ctx.get_next_event()
+        event(ctx, name_to_player[event.target])
+    return ctx
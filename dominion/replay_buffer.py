@@ -0,0 +1,212 @@
+"""The ReplayBuffer stores (beta, reward, next beta) transitions for Q-learning
+in fixed-capacity ring storage. The arrays are memory-mapped .npy files in a
+directory, so a buffer can hold millions of transitions without keeping them as
+Python objects, and picks up where it left off when reopened by a later run.
+
+Transitions are added an episode at a time, in order, so the next beta of a
+transition is the beta of the following row; only the last transition of an
+episode is done and has none. Each beta is therefore stored once.
+
+Transitions can be sampled uniformly, or in proportion to their priority (e.g.
+their last TD error), as in prioritized experience replay.
+"""
+
+# Python stdlib
+import json
+import os
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# Version 1 stored a copy of each next beta, and never marked episode ends
+_VERSION = 2
+
+
+class ReplayBatch(NamedTuple):
+    """A sample of transitions. weights are the importance-sampling weights
+    that correct for prioritized sampling; they are all 1 for uniform samples.
+    """
+
+    idxs: np.ndarray
+    betas: np.ndarray
+    rewards: np.ndarray
+    next_betas: np.ndarray
+    dones: np.ndarray
+    weights: np.ndarray
+
+
+class ReplayBuffer:
+    def __init__(
+        self,
+        path: str,
+        capacity: int = 100_000,
+        n_features: int = 644,
+        alpha: float = 0.6,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Opens the buffer stored in the directory at path, creating it if it
+        does not exist.
+
+        Args:
+            path (str): Directory holding the buffer's files.
+            capacity (int): Maximum number of transitions. Once full, the oldest
+                transitions are overwritten. The betas take capacity *
+                n_features * 4 bytes on disk, about 260 MB by default.
+            n_features (int): Length of each beta (state-action encoding).
+            alpha (float): How strongly priorities skew sampling; 0 is uniform.
+            seed (int): Seed for sampling.
+        Raises:
+            ValueError: If an existing buffer has a different capacity or
+                number of features, or was written in an older format.
+        """
+        self.path = path
+        self.alpha = alpha
+        self.rng = np.random.default_rng(seed)
+
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get("version", 1) != _VERSION:
+                raise ValueError(f"buffer at {path} was written in an older format")
+            if (meta["capacity"], meta["n_features"]) != (capacity, n_features):
+                raise ValueError(
+                    f"buffer at {path} has capacity {meta['capacity']} and "
+                    f"{meta['n_features']} features"
+                )
+            mode = "r+"
+        else:
+            os.makedirs(path, exist_ok=True)
+            meta = {"size": 0, "pos": 0, "max_priority": 1.0}
+            mode = "w+"
+
+        self.capacity = capacity
+        self.n_features = n_features
+        self.size = meta["size"]
+        self.pos = meta["pos"]  # Where the next transition is written
+        self.max_priority = meta["max_priority"]
+
+        def open_array(name, shape, dtype):
+            filename = os.path.join(path, f"{name}.npy")
+            return np.lib.format.open_memmap(filename, mode, dtype, shape)
+
+        self.betas = open_array("betas", (capacity, n_features), np.float32)
+        self.rewards = open_array("rewards", (capacity,), np.float32)
+        self.dones = open_array("dones", (capacity,), np.bool_)
+        self.priorities = open_array("priorities", (capacity,), np.float64)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(
+        self,
+        betas: np.ndarray,
+        rewards: Sequence[float],
+        dones: Optional[Sequence[bool]] = None,
+    ) -> None:
+        """Adds the transitions of consecutive steps, overwriting the oldest
+        ones if the buffer is full. The next beta of each transition is the
+        beta of the row after it. New transitions get the highest priority seen
+        so far, so each is likely to be sampled at least once.
+
+        Args:
+            betas (np.ndarray): The beta of each step, one row per step.
+            rewards (Sequence[float]): The reward of each step.
+            dones (Sequence[bool]): Which steps end an episode. The last step
+                must. Defaults to the steps being one whole episode.
+        Raises:
+            ValueError: If the last step is not done, as its next beta would
+                be whatever is added after it.
+        """
+        n = len(rewards)
+        if n == 0:
+            return
+        if dones is None:
+            dones = np.zeros(n, dtype=np.bool_)
+            dones[-1] = True
+        if not dones[-1]:
+            raise ValueError("the last transition added must be done")
+
+        # Transitions past the capacity would overwrite each other; keep the last
+        if n > self.capacity:
+            betas, rewards = betas[-self.capacity :], rewards[-self.capacity :]
+            dones = dones[-self.capacity :]
+            n = self.capacity
+
+        idxs = (self.pos + np.arange(n)) % self.capacity
+        self.betas[idxs] = betas
+        self.rewards[idxs] = rewards
+        self.dones[idxs] = dones
+        self.priorities[idxs] = self.max_priority
+
+        self.pos = int((self.pos + n) % self.capacity)
+        self.size = min(self.size + n, self.capacity)
+
+    def sample(
+        self, batch_size: int, prioritized: bool = False, beta: float = 0.4
+    ) -> ReplayBatch:
+        """Samples a batch of transitions, with replacement.
+
+        Args:
+            batch_size (int): Number of transitions to sample.
+            prioritized (bool): If True, samples in proportion to priority**alpha
+                and returns importance-sampling weights; otherwise uniformly.
+            beta (float): Strength of the importance-sampling correction.
+        Returns:
+            (ReplayBatch) The sampled transitions.
+        Raises:
+            ValueError: If the buffer is empty.
+        """
+        if self.size == 0:
+            raise ValueError("cannot sample from an empty ReplayBuffer")
+
+        if prioritized:
+            scaled = self.priorities[: self.size] ** self.alpha
+            cumulative = np.cumsum(scaled)
+            targets = self.rng.random(batch_size) * cumulative[-1]
+            idxs = np.searchsorted(cumulative, targets, side="right")
+            idxs = np.minimum(idxs, self.size - 1)  # Guard against rounding
+        else:
+            idxs = self.rng.integers(0, self.size, size=batch_size)
+        idxs.sort()  # Sorted reads are kinder to the page cache
+        dones = np.asarray(self.dones[idxs])
+        # Done transitions have no next beta; theirs is left as zeros
+        next_betas = np.asarray(self.betas[(idxs + 1) % self.capacity])
+        next_betas[dones] = 0
+
+        weights = np.ones(batch_size)
+        if prioritized:
+            probs = scaled[idxs] / cumulative[-1]
+            weights = (self.size * probs) ** -beta
+            weights /= weights.max()
+
+        return ReplayBatch(
+            idxs=idxs,
+            betas=np.asarray(self.betas[idxs]),
+            rewards=np.asarray(self.rewards[idxs]),
+            next_betas=next_betas,
+            dones=dones,
+            weights=weights,
+        )
+
+    def update_priorities(self, idxs: np.ndarray, td_errors: np.ndarray) -> None:
+        """Sets the priorities of sampled transitions from their TD errors."""
+        priorities = np.abs(np.ravel(td_errors)) + 1e-6
+        self.priorities[idxs] = priorities
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+
+    def flush(self) -> None:
+        """Writes the buffer to disk, so it can be reopened by a later run."""
+        for array in (self.betas, self.rewards, self.dones, self.priorities):
+            array.flush()
+
+        meta = {
+            "version": _VERSION,
+            "capacity": self.capacity,
+            "n_features": self.n_features,
+            "size": self.size,
+            "pos": self.pos,
+            "max_priority": self.max_priority,
+        }
+        with open(os.path.join(self.path, "meta.json"), "w") as f:
+            json.dump(meta, f)
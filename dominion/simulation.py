@@ -0,0 +1,211 @@
+"""Headless batch simulation of Dominion games between computer policies. The
+SimulationRunner logs to a NullSink by default, so no messages are ever rendered,
+making it the fast path for bulk self-play and evaluation.
+"""
+
+# Python stdlib
+import asyncio
+import copy
+import random
+import time
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# From dominion module
+import dominion.util.logging as logging
+from dominion.engine import play_async
+from dominion.game import GameContext
+from dominion.players import ComputerPlayer, Deck
+from dominion.policy import AsyncPolicy, Policy
+from dominion.profiling import Profiler
+from dominion.recording import GameRecorder
+
+
+class GameResult(NamedTuple):
+    """Compact record of a finished game. Lists are indexed by seat, in the
+    order the policies were passed to the SimulationRunner.
+    """
+
+    winner: int
+    scores: List[int]
+    turns: int
+    buys: List[int]
+
+
+def _binds_to_game(policy: Policy) -> bool:
+    """Helper that tells whether a policy keeps state of the game it is bound
+    to, so that games in flight at once need copies of their own.
+    """
+    if not isinstance(policy, AsyncPolicy):
+        return True
+    return type(policy).bind is not AsyncPolicy.bind
+
+
+class SimulationRunner:
+    def __init__(
+        self,
+        policies: Sequence[Policy],
+        max_turns: int = 250,
+        deck_cls: type = Deck,
+        log_sink: Optional[logging.LogSink] = None,
+        recorder: Optional[GameRecorder] = None,
+        seed: Optional[int] = None,
+        profiler: Optional[Profiler] = None,
+    ) -> None:
+        """Creates a runner that plays games between the given policies.
+
+        Args:
+            policies (Sequence[Policy]): One policy per seat. Policies are reused
+                across games, so stateful policies see every game in order
+                (except in concurrent games, see run_async).
+            max_turns (int): Games still running after this many turns are
+                stopped and scored as they stand.
+            deck_cls (type): Deck implementation given to each player, e.g.
+                CompactDeck.
+            log_sink (LogSink): Where games log to, flushed after each game.
+                Defaults to a NullSink.
+            recorder (GameRecorder): Optional recorder that every game is
+                appended to.
+            seed (int): Seed the games' seeds are drawn from, so a runner
+                with the same seed plays the same games. If None, each game
+                draws its seed from the random module.
+            profiler (Profiler): Optional profiler shared by every game, so its
+                stats add up over the whole run.
+        """
+        self.policies = list(policies)
+        self.max_turns = max_turns
+        self.deck_cls = deck_cls
+        self.log_sink = log_sink or logging.NullSink()
+        self.recorder = recorder
+        self.seeds = random.Random(seed) if seed is not None else None
+        self.profiler = profiler
+
+        self.n_games = 0
+        self.time_elapsed = 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """Throughput over all games played by this runner so far."""
+        if self.time_elapsed == 0:
+            return 0.0
+        return self.n_games / self.time_elapsed
+
+    def make_context(self, policies: Optional[Sequence[Policy]] = None) -> GameContext:
+        """Creates a fresh GameContext with one ComputerPlayer per
+        policy.
+
+        Args:
+            policies (Sequence[Policy]): Policies to seat instead of the
+                runner's, e.g. copies of them.
+        """
+        players = [
+            ComputerPlayer(f"Player {idx + 1} (CPU)", policy, deck=self.deck_cls())
+            for idx, policy in enumerate(policies or self.policies)
+        ]
+        seed = self.seeds.getrandbits(64) if self.seeds is not None else None
+        return GameContext(
+            players,
+            log_sink=self.log_sink,
+            recorder=self.recorder,
+            seed=seed,
+            profiler=self.profiler,
+        )
+
+    def play_game(self) -> GameResult:
+        """Plays a single game to completion and returns its result."""
+        ctx = self.make_context()
+        name_to_player = {player.name: player for player in ctx.player_order}
+
+        while not ctx.reached_end():
+            if ctx.turn >= self.max_turns and not ctx.event_queue:
+                break  # Out of turns; score the game as it stands
+
+            event = ctx.get_next_event()
+            event(ctx, name_to_player[event.target])
+
+        return self.finish_game(ctx)
+
+    def finish_game(self, ctx: GameContext) -> GameResult:
+        """Flushes the log, records and scores a game that has ended."""
+        self.log_sink.flush()
+        if self.recorder is not None:
+            self.recorder.finish(ctx)
+        scores = [player.compute_score() for player in ctx.player_order]
+        return GameResult(
+            winner=int(np.argmax(scores)),
+            scores=scores,
+            turns=ctx.turn,
+            buys=[player.n_bought for player in ctx.player_order],
+        )
+
+    def run(self, n_games: int) -> List[GameResult]:
+        """Plays n_games back to back."""
+        tick = time.perf_counter()
+        results = [self.play_game() for _ in range(n_games)]
+        self.time_elapsed += time.perf_counter() - tick
+        self.n_games += n_games
+        return results
+
+    async def play_game_async(
+        self, policies: Optional[Sequence[Policy]] = None
+    ) -> GameResult:
+        """Plays a single game to completion on the running event loop,
+        awaiting policies whose get_input is a coroutine.
+
+        Args:
+            policies (Sequence[Policy]): Policies to seat instead of the
+                runner's, e.g. copies of them.
+        """
+        ctx = self.make_context(policies)
+        await play_async(ctx, max_turns=self.max_turns)
+        return self.finish_game(ctx)
+
+    async def run_async(
+        self, n_games: int, concurrency: Optional[int] = None
+    ) -> List[GameResult]:
+        """Plays n_games concurrently on the running event loop. A game only
+        gives way to the others while it awaits a policy, so this pays off when
+        policies spend their time waiting, e.g. on remote bots.
+
+        Policies are bound to the game they play (see Policy.bind), so a
+        policy cannot be seated in two games at once. With concurrency above
+        1, each game therefore gets its own deep copies of the policies, as
+        VecEnv's games do, and anything the copies learn or collect (e.g.
+        experiences) is dropped with them. AsyncPolicies usually stand for one
+        remote bot or connection, so one instance is awaited by every game in
+        flight and is not bound to any of them (see AsyncPolicy.bind), unless
+        it overrides bind to keep per-game state, in which case it is copied
+        too.
+
+        Args:
+            n_games (int): Games to play.
+            concurrency (int): Most games in flight at once. Defaults to all.
+        Returns:
+            (List[GameResult]) Results in the order the games were started.
+        Raises:
+            ValueError: If games would run concurrently while the runner has a
+                recorder, which records one game at a time.
+        """
+        concurrency = concurrency or n_games
+        if self.recorder is not None and concurrency > 1 and n_games > 1:
+            raise ValueError("a runner with a recorder can only play one game at once")
+
+        slots = asyncio.Semaphore(concurrency)
+        shared = concurrency == 1 or n_games == 1
+
+        async def play_one() -> GameResult:
+            async with slots:
+                if shared:
+                    return await self.play_game_async()
+                policies = [
+                    copy.deepcopy(policy) if _binds_to_game(policy) else policy
+                    for policy in self.policies
+                ]
+                return await self.play_game_async(policies)
+
+        tick = time.perf_counter()
+        results = await asyncio.gather(*[play_one() for _ in range(n_games)])
+        self.time_elapsed += time.perf_counter() - tick
+        self.n_games += n_games
+        return list(results)
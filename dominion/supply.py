@@ -3,10 +3,19 @@ the game.
 """
 
 # Python stdlib
+import random
+from bisect import bisect_right
 from collections import OrderedDict
-from typing import List, MutableMapping, Sequence, Union
-
-import numpy as np
+from typing import (
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 # From dominion module
 from dominion.common import DeckPile
@@ -17,7 +26,11 @@ from .cards.base_game import *
 
 class Supply:
     def __init__(
-        self, n_players: int = 2, debug: bool = False, cards: Sequence[Card] = None
+        self,
+        n_players: int = 2,
+        debug: bool = False,
+        cards: Sequence[Card] = None,
+        rng: Optional[random.Random] = None,
     ) -> None:
         """Creates the supply. The rules for the initial supply are as follows:
         - All treasure cards are included. Each player starts with 7 coppers,
@@ -33,14 +46,16 @@ class Supply:
             debug (bool): If True, puts all the cards in the supply.
             cards (Sequence[Card]): Optional override to determine the 10 kingdom
                 cards
+            rng (random.Random): Generator the kingdom is chosen with. Defaults
+                to the random module.
         """
-        # Choose 10 cards without replacement from set of all kingdom cards
-        kingdom: List[Card] = np.random.choice(KINGDOM_CARDS, size=10, replace=False)
-
-        if debug:
-            kingdom = KINGDOM_CARDS
         if cards:
-            kingdom = list(cards)
+            kingdom: List[Card] = list(cards)
+        elif debug:
+            kingdom = KINGDOM_CARDS
+        else:
+            # Choose 10 cards without replacement from set of all kingdom cards
+            kingdom = (rng or random).sample(KINGDOM_CARDS, 10)
 
         self.kingdom = kingdom
 
@@ -60,6 +75,21 @@ class Supply:
         for card in kingdom:
             self.supply_piles[card] = 10
 
+        # Cards by their index in the supply, which is fixed for the game, and
+        # an index of the non-empty piles as (cost, index) pairs sorted by cost,
+        # so the piles a player can afford are a bisect away
+        self.cards: List[Card] = list(self.supply_piles)
+        self.names: List[str] = [card.name for card in self.cards]
+        self.indices: Dict[Card, int] = {
+            card: idx for idx, card in enumerate(self.cards)
+        }
+        self._by_cost: List[Tuple[int, int]] = []
+        self.n_empty = 0  # Number of empty piles
+        self._index_piles()
+
+        # Called with the card of each pile that runs out
+        self.on_empty: List[Callable[[Card], None]] = []
+
     """ If the supply is indexed, iterated over, or its items retrieved,
     defer to the self.supply_piles object inside. Presents an abstraction wrapper
     w/o subclassing.
@@ -77,6 +107,44 @@ class Supply:
     def __getitem__(self, index):
         return self.supply_piles.__getitem__(index)
 
+    def _index_piles(self) -> None:
+        """Helper that rebuilds the cost index and the count of empty piles
+        from the pile counts.
+        """
+        self._by_cost = sorted(
+            (card.cost, idx)
+            for idx, card in enumerate(self.cards)
+            if self.supply_piles[card] > 0
+        )
+        self.n_empty = len(self.cards) - len(self._by_cost)
+
+    def affordable(self, max_cost: int) -> List[int]:
+        """Returns the indices of the non-empty piles whose cards cost at most
+        max_cost, in supply order.
+        """
+        end = bisect_right(self._by_cost, (max_cost, len(self.cards)))
+        return sorted([idx for _, idx in self._by_cost[:end]])
+
+    def options(self, max_cost: int) -> Dict[int, str]:
+        """Returns the non-empty piles whose cards cost at most max_cost, as a
+        dict from supply index to card name.
+        """
+        names = self.names
+        return {idx: names[idx] for idx in self.affordable(max_cost)}
+
+    def snapshot(self) -> tuple:
+        """Captures the number of cards left in each pile, in supply order."""
+        return tuple(self.supply_piles.values())
+
+    def restore(self, state: tuple) -> None:
+        """Returns the piles to the counts captured by snapshot(). The kingdom
+        is fixed for a game, so only the counts are restored. Piles emptied by
+        a restore are not announced to on_empty.
+        """
+        for card, n in zip(self.supply_piles, state):
+            self.supply_piles[card] = n
+        self._index_piles()
+
     def buy(
         self,
         target: Union[int, Card],
@@ -96,19 +164,24 @@ class Supply:
             to_pile: (DeckPile): Which pile the purchased card should be placed in.
         """
         if isinstance(target, int):
-            card = list(self.supply_piles.keys())[target]
+            card = self.cards[target]
         elif isinstance(target, Card):
             card = target
         else:
             raise TypeError(f"must be int or card, not {type(target).__name__}")
 
         self.supply_piles[card] -= 1
+        if self.supply_piles[card] == 0:
+            self._by_cost.remove((card.cost, self.indices[card]))
+            self.n_empty += 1
+            for callback in self.on_empty:
+                callback(card)
         buyer.deck.add([card], to_pile=to_pile)
 
         if free:
             return card
 
-        if "spent" not in buyer.modifiers:
-            buyer.modifiers["spent"] = 0
-        buyer.modifiers["spent"] += card.cost
+        buyer.n_bought += 1
+        buyer.turn.buys += 1
+        buyer.turn.spent += card.cost
         return card
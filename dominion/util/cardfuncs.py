@@ -5,12 +5,13 @@ filtering cards by certain properties, etc.)
 from dominion.cards import Card
 from dominion.common import CardType
 
+ACTION_KINDS = frozenset(
+    [CardType.ACTION, CardType.ACTION_ATTACK, CardType.ACTION_REACTION]
+)
+
+
 # TODO: add stuff
 def is_action_card(card: Card) -> bool:
     """ Returns whether the passed in card is an action or not.
     """
-    return card.kind in [
-        CardType.ACTION,
-        CardType.ACTION_ATTACK,
-        CardType.ACTION_REACTION,
-    ]
+    return card.kind in ACTION_KINDS
@@ -7,11 +7,15 @@ and player logs (what each player "sees").
 import logging
 import os
 import re
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List, MutableMapping, Sequence, Union
+from typing import List, MutableMapping, Optional, Sequence, Union
 
 # From dominion module
 from dominion.common import LogTarget
+from dominion.util.message import Message
 from utilities.log import Log
 
 targetsT = Union[List[Union[LogTarget, str]], LogTarget, str]
@@ -49,18 +53,21 @@ class NoColorFormatter(logging.Formatter):
         pass
 
     def format(self, record):
-        return strip_style(record.msg)
+        return strip_style(str(record.msg))
 
 
 def getLogger(
-    name: str, to_console: bool = False, to_file: bool = True
+    name: str, dir_path: str, to_console: bool = False, to_file: bool = True
 ) -> logging.Logger:
-    """Adapter for logging.getLogger and adding handlers"""
+    """Adapter for logging.getLogger and adding handlers. Loggers are named
+    after their directory, so sinks logging to different runs do not share
+    handlers.
+    """
     # Create the logging directory if it doesn't exist
     if not os.path.exists(dir_path):
         os.makedirs(dir_path)
-    
-    logger = logging.getLogger(name)
+
+    logger = logging.getLogger(f"{dir_path}.{name}")
 
     if to_console:
         stream_handler = logging.StreamHandler()
@@ -75,60 +82,228 @@ def getLogger(
     return logger
 
 
-# Globals keep instances of all loggers used
-loggers: MutableMapping[LogTarget, logging.Logger] = {}
-player_loggers: MutableMapping[str, logging.Logger] = {}
-output_observer = True
+def as_targets(targets: targetsT) -> List[Union[LogTarget, str]]:
+    """Normalizes the targets of a log message to a list."""
+    if not isinstance(targets, list):
+        return [targets]
+    return targets
 
-def log(targets: targetsT, message: str):
-    global loggers
 
-    # Lazy initialize the loggers
-    if not loggers:
-        loggers = {
-            LogTarget.GAME: getLogger("game"),
-            LogTarget.OBSERVER: getLogger("observer", to_console=output_observer),
-        }
+def player_log_name(target: str) -> str:
+    """Turns a player's name into the name of their log file."""
+    return target.lower().replace(" ", "-").replace("(", "").replace(")", "")
 
-    if not isinstance(targets, list):
-        targets = [targets]
 
-    for target in targets:
-        if not isinstance(target, LogTarget):
-            if target not in player_loggers:
-                to_console = False if "CPU" in target else True
-                target_name = (
-                    target.lower().replace(" ", "-").replace("(", "").replace(")", "")
-                )
-                player_loggers[target] = getLogger(target_name, to_console=to_console)
-            logger = player_loggers[target]
-        else:
-            logger = loggers[target]
+class LogSink(ABC):
+    """A LogSink is where the messages of a game go. Each GameContext (and the
+    players in it) writes to one sink, so games running side by side can log to
+    different places, or nowhere.
+
+    Messages sent to the OBSERVER target are seen by every player as well.
+    """
+
+    # False for sinks that drop every message, so callers can skip building them
+    enabled: bool = True
 
-        logger.info(message)
+    @abstractmethod
+    def write(
+        self, targets: List[Union[LogTarget, str]], message: Union[str, Message]
+    ) -> None:
+        """Takes a message for the targets. Messages may be lazily rendered
+        Messages; sinks that never show them should not call str() on them.
+        """
+        pass
+
+    def flush(self) -> None:
+        """Called at the end of each game. Sinks that buffer write out here."""
+        pass
 
-        if target == LogTarget.OBSERVER:
-            # Apply log message to all players, since they see it too
-            for logger in player_loggers.values():
-                logger.info(message)
+    def close(self) -> None:
+        """Flushes and releases any resources the sink holds."""
+        self.flush()
+
+
+class NullSink(LogSink):
+    """Drops every message. Used for training and bulk simulation."""
+
+    enabled = False
+
+    def write(self, targets, message) -> None:
+        pass
+
+
+class RingBufferSink(LogSink):
+    def __init__(self, capacity: int = 1000) -> None:
+        """Keeps the last capacity messages in memory, e.g. to show the end of
+        a game that went wrong.
+        """
+        self.records = deque(maxlen=capacity)
+
+    def write(self, targets, message) -> None:
+        self.records.append((tuple(targets), message))
+
+    def messages(
+        self, target: Union[LogTarget, str, None] = None, kind: Optional[str] = None
+    ) -> List[str]:
+        """Returns the buffered messages, oldest first, optionally only those a
+        target saw. Players see their own messages and the OBSERVER's.
+
+        Args:
+            target (LogTarget|str): Only return messages this target saw.
+            kind (str): Only return Messages of this kind, e.g. "buy".
+        """
+        seen = {target}
+        if isinstance(target, str):
+            seen.add(LogTarget.OBSERVER)
+        return [
+            str(message)
+            for targets, message in self.records
+            if (target is None or seen.intersection(targets))
+            and (kind is None or getattr(message, "kind", None) == kind)
+        ]
+
+
+class FileSink(LogSink):
+    def __init__(self, dir_path: str = None, output_observer: bool = True) -> None:
+        """Logs the game transcript, full game log, and each player's log to
+        files in dir_path, as they happen. Human players' logs and the observer
+        log are echoed to the console. The directory and files are created on
+        the first message.
+
+        Args:
+            dir_path (str): Directory to log to. Defaults to a run_* directory
+                named after the current time.
+            output_observer (bool): If False, the observer log is not echoed to
+                the console.
+        """
+        if dir_path is None:
+            now = datetime.now(timezone.utc)
+            dir_path = f"run_{now.strftime('%Y-%m-%d_%H-%M-%S')}"
+        self.dir_path = dir_path
+        self.output_observer = output_observer
+
+        self.loggers: MutableMapping[LogTarget, logging.Logger] = {}
+        self.player_loggers: MutableMapping[str, logging.Logger] = {}
+
+    def write(self, targets, message) -> None:
+        # Lazy initialize the loggers
+        if not self.loggers:
+            self.loggers = {
+                LogTarget.GAME: getLogger("game", self.dir_path),
+                LogTarget.OBSERVER: getLogger(
+                    "observer", self.dir_path, to_console=self.output_observer
+                ),
+            }
+
+        for target in targets:
+            if not isinstance(target, LogTarget):
+                if target not in self.player_loggers:
+                    to_console = False if "CPU" in target else True
+                    self.player_loggers[target] = getLogger(
+                        player_log_name(target), self.dir_path, to_console=to_console
+                    )
+                logger = self.player_loggers[target]
+            else:
+                logger = self.loggers[target]
+
+            logger.info(message)
+
+            if target == LogTarget.OBSERVER:
+                # Apply log message to all players, since they see it too
+                for logger in self.player_loggers.values():
+                    logger.info(message)
+
+
+class BatchedFileSink(LogSink):
+    def __init__(self, dir_path: str) -> None:
+        """Logs to the same files as a FileSink, but keeps messages in memory
+        and appends them to the files in one go on a background thread when
+        flushed, i.e. at the end of each game. Nothing is echoed to the console.
+
+        Args:
+            dir_path (str): Directory to log to. Created on the first flush.
+        """
+        self.dir_path = dir_path
+        self.buffers: MutableMapping[str, List[str]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+
+    def _buffer(self, name: str) -> List[str]:
+        if name not in self.buffers:
+            self.buffers[name] = []
+        return self.buffers[name]
+
+    def write(self, targets, message) -> None:
+        for target in targets:
+            if target == LogTarget.GAME:
+                self._buffer("game").append(message)
+            elif target == LogTarget.OBSERVER:
+                self._buffer("observer").append(message)
+                # Apply log message to all players, since they see it too
+                for name, lines in self.buffers.items():
+                    if name not in ("game", "observer"):
+                        lines.append(message)
+            else:
+                self._buffer(player_log_name(target)).append(message)
+
+    def flush(self) -> None:
+        """Hands the buffered messages to the writer thread and returns. Waits
+        for the previous flush's write first, raising any error from it, so
+        that no error goes unreported and at most one write is in flight.
+        """
+        if not any(self.buffers.values()):
+            return
+        buffers = self.buffers
+        self.buffers = {name: [] for name in buffers}
+        self._wait()
+        self._pending = self._executor.submit(self._write, buffers)
+
+    def _wait(self) -> None:
+        """Helper that waits for the write in flight, if any, and raises any
+        error from it.
+        """
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.result()
+
+    def _write(self, buffers: MutableMapping[str, List[str]]) -> None:
+        os.makedirs(self.dir_path, exist_ok=True)
+        for name, lines in buffers.items():
+            if not lines:
+                continue
+            with open(os.path.join(self.dir_path, f"{name}.log"), "a") as f:
+                f.write("".join(f"{strip_style(str(line))}\n" for line in lines))
+
+    def close(self) -> None:
+        """Flushes, then waits for all writes to finish."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self._wait()
+
+
+# The sink used when none is chosen, e.g. by log() and by GameContexts created
+# without one
+default_sink: LogSink = FileSink(dir_path)
+
+
+def log(targets: targetsT, message: Union[str, Message], sink: LogSink = None) -> None:
+    """Logs a message to the given sink, or the default sink."""
+    (sink or default_sink).write(as_targets(targets), message)
 
 
 def silence_console_output() -> None:
-    global output_observer
-    output_observer = False
+    default_sink.output_observer = False
 
 
 def configure_time() -> None:
+    """Points the default sink at a new run_* directory named after the
+    current time.
+    """
     global dir_path
-    global loggers
-    global player_loggers
-
-    now = datetime.now(timezone.utc)
-    dir_path = f"run_{now.strftime('%Y-%m-%d_%H-%M-%S')}"
+    global default_sink
 
-    # Clear any previous loggers
-    loggers = {}
-    player_loggers = {}
+    default_sink = FileSink(output_observer=default_sink.output_observer)
+    dir_path = default_sink.dir_path
 
 
 # Make constants available from module
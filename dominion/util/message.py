@@ -0,0 +1,85 @@
+"""A Message is a log or display message that is only rendered to text when it
+is read, e.g. by a sink that writes to a file or a human player's console. Games
+between computer players never read most of what they log, so building messages
+has to be cheap; rendering (card colors, supply tables) happens on demand.
+
+Arguments that change later must be copied, and copies are not free, so such
+messages are only built when someone will read them:
+
+Intended usage:
+    Message("{} bought {}.", player.name, card, kind="buy", player=player.name)
+    if player.show_enabled:
+        player.show(Message(hand_to_str, tuple(player.hand)))
+"""
+
+# Python stdlib
+from typing import Any, Callable, Optional, Tuple, Union
+
+# From dominion module
+from dominion.cards import Card
+from dominion.util.prettyprint import card_to_str
+
+
+class Message:
+    __slots__ = ("template", "args", "kind", "player", "_text")
+
+    def __init__(
+        self,
+        template: Union[str, Callable[..., str]],
+        *args: Any,
+        kind: Optional[str] = None,
+        player: Optional[str] = None,
+    ) -> None:
+        """Creates a message. Arguments are kept as they are until rendering,
+        so callers must pass copies of anything that may change in the meantime
+        (e.g. tuple(player.hand), not player.hand).
+
+        Args:
+            template (str|Callable): A str.format template, in which Card
+                arguments are shown with card_to_str; or a function that renders
+                the arguments itself, such as hand_to_str.
+            args: The values shown in the message.
+            kind (str): Optional label for the game event the message is
+                about, for sinks that keep structured records: "setup",
+                "play", "buy", "gain", "no_gain", "trash", "upgrade" (trash
+                and gain), "reveal", "defend", "discard", "topdeck",
+                "cleanup", "start", "end" or "win".
+            player (str): Optional name of the player the message is about.
+        """
+        self.template = template
+        self.args = args
+        self.kind = kind
+        self.player = player
+        self._text = None
+
+    @property
+    def card_ids(self) -> Tuple[int, ...]:
+        """IDs of the cards the message mentions, including cards in tuple
+        arguments.
+        """
+        # From dominion module
+        # Imported here: the registry imports the cards, whose events use Message
+        from dominion.cards.registry import CARD_IDS
+
+        ids = []
+        for arg in self.args:
+            cards = arg if isinstance(arg, tuple) else (arg,)
+            ids.extend(CARD_IDS[card] for card in cards if isinstance(card, Card))
+        return tuple(ids)
+
+    def render(self) -> str:
+        """Formats the message to text. The text is cached."""
+        if self._text is None:
+            if callable(self.template):
+                self._text = self.template(*self.args)
+            else:
+                self._text = self.template.format(
+                    *(card_to_str(a) if isinstance(a, Card) else a for a in self.args)
+                )
+        return self._text
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return f"Message({self.render()!r})"
@@ -0,0 +1,262 @@
+"""A vectorized environment that steps many games at once, so a single policy
+call can serve a whole batch of decisions. Each game is advanced to the next
+decision of a seat the caller controls. The pending decisions of all games are
+then returned together as arrays: one observation row per game, the card each
+option refers to, and masks of the legal options.
+
+Each game is driven by a GameEngine, which suspends it at every decision of
+the caller's seats, so all the games live in one thread. Games are advanced in
+slot order, so a batch plays out the same way on every run with the same seed.
+
+Intended usage:
+    env = VecEnv([None, RandomPolicy()], n_envs=64, seed=0)
+    batch = env.reset()
+    while training:
+        actions = choose(batch)  # One option slot per game, or -1 to skip
+        batch = env.step(actions)
+        ...  # batch.rewards and batch.dones report games that ended
+    env.close()
+"""
+
+# Python stdlib
+import copy
+import random
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# From dominion module
+from dominion.cards.registry import ALL_CARDS, CARD_IDS, NUM_CARDS, card_counts
+from dominion.engine import GameEngine
+from dominion.events import Decision
+from dominion.game import GameContext
+from dominion.players import Deck
+from dominion.policy import Policy
+from dominion.simulation import GameResult, SimulationRunner
+
+# Observation layout: card counts by ID, then a few scalars
+HAND, DECK, OPPONENTS, SUPPLY = (
+    slice(i * NUM_CARDS, (i + 1) * NUM_CARDS) for i in range(4)
+)
+SCALARS = ("treasure", "actions", "buys", "turn")
+OBS_SIZE = 4 * NUM_CARDS + len(SCALARS)
+
+NAME_IDS: Dict[str, int] = {card.name: idx for idx, card in enumerate(ALL_CARDS)}
+
+
+def observe(ctx: GameContext, seat: int) -> np.ndarray:
+    """Encodes the game as seen by the player in seat, as a vector of OBS_SIZE
+    ints: the player's hand, the player's whole deck, the other players' decks
+    (summed) and the supply, each as counts by card ID, followed by the
+    player's treasure, actions and buys used this turn, and the turn number.
+    Supply cards that are not in the game are counted as -1.
+    """
+    player = ctx.player_order[seat]
+    obs = np.zeros(OBS_SIZE, dtype=np.int16)
+    obs[HAND] = card_counts(player.hand)
+    for idx, other in enumerate(ctx.player_order):
+        counts = obs[DECK] if idx == seat else obs[OPPONENTS]
+        for card, n in other.deck.counts.items():
+            counts[CARD_IDS[card]] += n
+
+    supply = obs[SUPPLY]
+    supply[:] = -1
+    for card, n in ctx.supply.items():
+        supply[CARD_IDS[card]] = n
+    obs[-4:] = (player.treasure, player.turn.actions, player.turn.buys, ctx.turn)
+    return obs
+
+
+class Batch(NamedTuple):
+    """The pending decisions of every game in a VecEnv, one row per game.
+    Options are given in slots, in the order of the options dict; an action is
+    the slot of the chosen option, or -1 to skip.
+
+    rewards and dones describe games that ended on the last step. Those games
+    have already been replaced by new ones, whose first decisions are in the
+    other fields.
+    """
+
+    obs: np.ndarray  # (n_envs, OBS_SIZE), see observe()
+    option_cards: np.ndarray  # (n_envs, max options) card IDs; -1 if not a card
+    mask: np.ndarray  # (n_envs, max options) True for real options
+    allow_skip: np.ndarray  # (n_envs,)
+    seats: np.ndarray  # (n_envs,) the seat to move
+    rewards: np.ndarray  # (n_envs, n_seats) +1 win, -1 loss, 0 tie
+    dones: np.ndarray  # (n_envs,)
+    decisions: List[Decision]
+
+
+class _ExternalPolicy(Policy):
+    """Placeholder policy of the seats played through VecEnv.step()."""
+
+    def get_input(self, options, allow_skip=True):
+        raise RuntimeError("decisions of this seat are made through VecEnv.step()")
+
+
+class _Slot:
+    """One game slot of a VecEnv: plays games back to back, each driven by a
+    GameEngine.
+    """
+
+    def __init__(self, runner: SimulationRunner, external: List[int]) -> None:
+        self.runner = runner
+        self.external = external
+        self.new_game()
+
+    def new_game(self) -> None:
+        self.ctx = self.runner.make_context()
+        self.engine = GameEngine(
+            self.ctx, external=self.external, max_turns=self.runner.max_turns
+        )
+
+
+class VecEnv:
+    def __init__(
+        self,
+        policies: Sequence[Optional[Policy]],
+        n_envs: int,
+        max_turns: int = 250,
+        deck_cls: type = Deck,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Creates n_envs games, played back to back in each slot.
+
+        Args:
+            policies (Sequence[Optional[Policy]]): One entry per seat. None
+                seats are played by the caller, through step(). Other seats
+                are played by a copy of the given policy in each game slot.
+            n_envs (int): Games stepped at once.
+            max_turns (int): Games still running after this many turns are
+                stopped and scored as they stand.
+            deck_cls (type): Deck implementation given to each player.
+            seed (int): Seed the slots' seeds are drawn from. If None, games
+                draw their seeds from the random module.
+        Raises:
+            ValueError: If no seat is played by the caller.
+        """
+        if all(policy is not None for policy in policies):
+            raise ValueError("at least one seat must be None, to be played by step()")
+
+        self.policies = list(policies)
+        self.n_envs = n_envs
+        self.max_turns = max_turns
+        self.deck_cls = deck_cls
+        seeds = random.Random(seed) if seed is not None else None
+        self._seeds = [
+            seeds.getrandbits(64) if seeds is not None else None for _ in range(n_envs)
+        ]
+        self.external = [seat for seat, policy in enumerate(policies) if policy is None]
+        self.slots: List[_Slot] = []
+        self.decisions: List[Decision] = []
+        self.results: List[GameResult] = []  # Every game finished so far
+
+    @property
+    def n_seats(self) -> int:
+        return len(self.policies)
+
+    def reset(self) -> Batch:
+        """Starts a new game in every slot and returns their first decisions."""
+        self.slots = []
+        for seed in self._seeds:
+            seated = [
+                _ExternalPolicy() if policy is None else copy.deepcopy(policy)
+                for policy in self.policies
+            ]
+            runner = SimulationRunner(
+                seated, max_turns=self.max_turns, deck_cls=self.deck_cls, seed=seed
+            )
+            self.slots.append(_Slot(runner, self.external))
+
+        self.decisions = [None] * self.n_envs
+        rewards = np.zeros((self.n_envs, self.n_seats), dtype=np.float32)
+        dones = np.zeros(self.n_envs, dtype=bool)
+        for idx in range(self.n_envs):
+            self._advance(idx, None, rewards, dones)
+        return self._batch(rewards, dones)
+
+    def step(self, actions: Sequence[int]) -> Batch:
+        """Answers every pending decision and advances each game to its next
+        one. Games that end are scored and replaced by new games.
+
+        Args:
+            actions (Sequence[int]): For each game, the slot of the chosen
+                option, or -1 to skip.
+        Returns:
+            (Batch) The next decisions, and the outcome of any games that ended.
+        Raises:
+            ValueError: If there is not one action per game, or an action is
+                not a legal option of its game.
+            RuntimeError: If there are no games, before reset() or after close().
+        """
+        if not self.slots:
+            raise RuntimeError("no games in progress; call reset() first")
+        if len(actions) != self.n_envs:
+            raise ValueError(f"expected {self.n_envs} actions, got {len(actions)}")
+
+        choices = []
+        for decision, action in zip(self.decisions, actions):
+            keys = list(decision.options)
+            if action == -1 and decision.allow_skip:
+                choices.append("Skip")
+            elif 0 <= action < len(keys):
+                choices.append(keys[action])
+            else:
+                raise ValueError(f"{action} is not a legal action in {decision}")
+
+        rewards = np.zeros((self.n_envs, self.n_seats), dtype=np.float32)
+        dones = np.zeros(self.n_envs, dtype=bool)
+        for idx, choice in enumerate(choices):
+            self._advance(idx, choice, rewards, dones)
+        return self._batch(rewards, dones)
+
+    def _advance(
+        self, idx: int, choice, rewards: np.ndarray, dones: np.ndarray
+    ) -> None:
+        """Helper that answers the decision of game slot idx and runs it up to
+        its next decision, starting a new game if it ends on the way.
+        """
+        slot = self.slots[idx]
+        decision = slot.engine.step(choice)
+        while decision is None:
+            result = slot.runner.finish_game(slot.ctx)
+            self.results.append(result)
+            scores = np.array(result.scores)
+            best_other = [np.delete(scores, seat).max() for seat in range(len(scores))]
+            rewards[idx] = np.sign(scores - best_other)
+            dones[idx] = True
+            slot.new_game()
+            decision = slot.engine.step()
+        self.decisions[idx] = decision
+
+    def _batch(self, rewards: np.ndarray, dones: np.ndarray) -> Batch:
+        """Helper that encodes the pending decisions as a Batch."""
+        width = max(len(decision.options) for decision in self.decisions)
+        obs = np.zeros((self.n_envs, OBS_SIZE), dtype=np.int16)
+        option_cards = np.full((self.n_envs, width), -1, dtype=np.int16)
+        mask = np.zeros((self.n_envs, width), dtype=bool)
+        seats = np.zeros(self.n_envs, dtype=np.int8)
+        for idx, (slot, decision) in enumerate(zip(self.slots, self.decisions)):
+            seats[idx] = slot.engine.seats[decision.player]
+            obs[idx] = observe(slot.ctx, seats[idx])
+            labels = decision.options.values()
+            option_cards[idx, : len(labels)] = [
+                NAME_IDS.get(name, -1) for name in labels
+            ]
+            mask[idx, : len(labels)] = True
+
+        return Batch(
+            obs=obs,
+            option_cards=option_cards,
+            mask=mask,
+            allow_skip=np.array([d.allow_skip for d in self.decisions]),
+            seats=seats,
+            rewards=rewards,
+            dones=dones,
+            decisions=list(self.decisions),
+        )
+
+    def close(self) -> None:
+        """Abandons the games in progress."""
+        self.slots = []
+        self.decisions = []
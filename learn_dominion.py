@@ -7,6 +7,7 @@ import os
 import shutil
 import time         # For timing training
 import pickle
+import random
 import numpy as np
 
 from util import strip_style
@@ -14,6 +15,7 @@ from policy import QLearningPolicy, RandomPolicy
 from computer_player import ComputerPlayer
 from game import Dominion
 from utilities.filelog import FileLog
+from dominion.replay_buffer import ReplayBuffer
 
 CWD = os.getcwd()
 
@@ -87,6 +89,10 @@ def parse_args():
     parser.add_argument('--niters', type=int, default=100, help='number of iterations to train for')
     parser.add_argument('--testevery', type=int, default=50, help='how often to test the policy')
     parser.add_argument('--levels', type=int, default=0, help='number of CPU levels to train against, tournament-style')
+    parser.add_argument('--replay', default=None, help='directory of a replay buffer to learn from, kept across runs')
+    parser.add_argument('--replaysize', type=int, default=100000, help='capacity of the replay buffer, in transitions')
+    parser.add_argument('--prioritized', action='store_true', help='sample the replay buffer by priority')
+    parser.add_argument('--seed', type=int, default=1, help='seed for the random and np.random generators')
     # parser.add_argument('--experiment', '-e', default=0, type=int, help='Experiment number.')
     # parser.add_argument('--test', '-t', action='store_true', help='Run test set (default: False).')
     # parser.add_argument('--save_weights', '-s', action='store_true', help='Save weights (default: False).')
@@ -260,8 +266,13 @@ def run_experiment(settings):
     testiters = 10
     # TODO: add verbose, cache every (?), log games on test (?), discount (?)
 
-    # Create QLearningPolicy
-    policy = QLearningPolicy(instanced=True, fileid=1)
+    # Create QLearningPolicy, learning from a replay buffer if one is given
+    replay_buffer = None
+    if settings.get('replay'):
+        replay_buffer = ReplayBuffer(settings['replay'], capacity=settings['replaysize'])
+        print('Replay buffer at "{}" holds {} transitions.'.format(settings['replay'], len(replay_buffer)))
+    policy = QLearningPolicy(instanced=True, fileid=1, replay_buffer=replay_buffer,
+                             prioritized=settings.get('prioritized', False))
     policy_clone = QLearningPolicy(instanced=True, fileid=2)
     assert(policy.model == policy_clone.model) # Should be same ref
 
@@ -315,6 +326,11 @@ def run_experiment(settings):
             test_policy(i)
             dump_weights(path, policy, i)
             print('Dumped weights.')
+            if replay_buffer is not None:
+                replay_buffer.flush()
+
+    if replay_buffer is not None:
+        replay_buffer.flush()
 
 
 def main():
@@ -322,6 +338,10 @@ def main():
     Extract args and begin experiment.
     """
     args = parse_args()
+    # Seed here, once, rather than as a side effect of importing policy/table
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+
     if args.interactive: 
         settings = prompt_settings()
     else:
@@ -334,6 +354,9 @@ def main():
             'niters': args.niters,
             'testevery': args.testevery,
             'levels': args.levels,
+            'replay': args.replay,
+            'replaysize': args.replaysize,
+            'prioritized': args.prioritized,
         }
 
         if os.path.exists(path) and os.path.isdir(path):
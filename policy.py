@@ -11,15 +11,14 @@ import random
 import pickle
 from collections import defaultdict
 from util import sparseDot
-from card import get_card_id, ALL_CARDS
+from card import ALL_CARDS, CARD_TO_IDX
 from model import Model
 
 from utilities.filelog import FileLog
 
-np.random.seed(1)
-random.seed(1)
-
 NUM_CARDS = len(ALL_CARDS)
+NUM_ACTION_SLOTS = 100 # Size of the action one-hot
+NUM_HAND_SLOTS = 15 # Cards in hand that get a one-hot each
 
 class Policy:
     def __init__(self):
@@ -67,11 +66,18 @@ class QLearningPolicy(Policy):
     # Can only update weights of PREVIOUS thing AFTER this phase
     # Computer extracts raw state, we extract FEATURES here.
     # NOTE: writing out files is a responsibility deferred to learn_dominion.py
-    def __init__(self, discount=0.95, instanced=False, fileid=1, from_weights=None):
+    def __init__(self, discount=0.95, instanced=False, fileid=1, from_weights=None, batch_size=32,
+                 replay_buffer=None, prioritized=False):
         super().__init__() # Call parent constructor
 
         self.discount = discount
         self.decay = 0.9
+        self.batch_size = batch_size # Experience tuples per update in update_weights
+
+        # Optional dominion.replay_buffer.ReplayBuffer. If given, each game's
+        # transitions are stored there, and learning samples from all of them
+        self.replay_buffer = replay_buffer
+        self.prioritized = prioritized
 
         self.num_features = 644 # TODO: update as more features added
 
@@ -102,79 +108,78 @@ class QLearningPolicy(Policy):
         return np.zeros((self.num_features,))
 
 
-    def extract_features(self, raw_state, action): # TODO: include action name
-        """
-        When given the raw state by the computer player, extract relevant features
-        and return a one-dimensional vector with n components, where n is the number
-        of features. This will be provided as input to the QLearning algorithm.
+    def extract_state_features(self, raw_state):
         """
-        # TODO: clean up
-        EYE = np.eye(100) # Only 100 sparse vectors can be pulled!
+        Extract the part of the feature vector that only depends on the state:
+        one-hots for the cards in our hand, then the number of cards left in each
+        pile on the table. Every candidate action in a decision shares it.
 
+        Note: CARD_TO_IDX maps a card to an index associated
+        with it. This consistency lets us refer to cards by number when constructing
+        the feature vector.
+        """
         # Unpack entries from raw_state
         table = raw_state['table']
         players = raw_state['players']
         me = players[0] # TODO: fix this later, player 0 may not always be us!
-        
+
         # TODO: add whose turn, number of rounds so far, current player's deck n hand...
+        state = np.zeros((self.num_features - NUM_ACTION_SLOTS,))
 
-        all_features = np.array([])
+        """
+        Features about ourselves
 
+        Hand: weird, because you can have almost unbounded number of cards in hand. 
+        One one-hot vector is set per card, for up to 15 cards; unused slots
+        stay zero for 'no card' (=340 params). Cards past the 15th are dropped.
         """
-        Features about action being taken
+        hand = me.hand[:NUM_HAND_SLOTS]
+        hand_idxs = [CARD_TO_IDX[card] for card in hand]
+        hand_features = state[:NUM_HAND_SLOTS * NUM_CARDS].reshape(NUM_HAND_SLOTS, NUM_CARDS)
+        hand_features[np.arange(len(hand_idxs)), hand_idxs] = 1
 
-        One hot vector of the action is produced. Think of it like visual input:
-        we type the number specified by the one-hot.
         """
-        # Shift all actions by one
-        if action == None: 
-            action = 0
-        else:
-            action += 1
-        action_one_hot = EYE[action]
-        all_features = np.concatenate([all_features, action_one_hot])
+        Features about the table
 
+        Store this as a vector the size of the number of distinct cards. Store
+        the number of cards remaining in each component of the vector.
         """
-        Features about ourselves
+        table_idxs = [CARD_TO_IDX[card] for card in table.cards]
+        lefts = [table.table[card] for card in table.cards]
+        state[NUM_HAND_SLOTS * NUM_CARDS:][table_idxs] = lefts
 
-        Note: get_card_id takes as input a card and returns an index associated
-        with it. This consistency lets us refer to cards by number when constructing
-        the feature vector.
+        return state
 
-        Hand: weird, because you can have almost unbounded number of cards in hand. How many one-hot
-        vectors do we extract?
+
+    def extract_features_batch(self, raw_state, action_space):
         """
-        hand, draw_pile, discard_pile = (me.hand, me.deck.draw_pile, me.deck.discard_pile)
-        idxs = []
-        for card in hand:
-            idxs.append(get_card_id(card))
-        
-        # Example code to create a bunch of one-hot vectors
-        targets = np.eye(NUM_CARDS)[idxs] # Repeatedly sample rows of the id matrix
-        if targets.shape[0] < 15:
-            # Pad up to 15 cards with zeros for 'no card' (=340 params)
-            pad = np.zeros((15 - targets.shape[0], targets.shape[1]))
-            targets = np.concatenate([targets, pad], axis=0)
-        all_features = np.concatenate([all_features, targets.flatten()])
-        
+        Extract the features for every action in action_space at once, as an
+        (n_actions x num_features) matrix. The state features are computed once
+        and shared across rows; only the action one-hot differs.
         """
-        Features about the table
+        betas = np.zeros((len(action_space), self.num_features))
 
-        Store this as a vector the size of the number of distinct cards. Store
-        the number of cards remaining in each component of the vector.
         """
-        present = []
-        for card in table.cards:
-            left = table.table[card]
-            idx = get_card_id(card)
-            present.append(np.eye(NUM_CARDS)[idx] * left)
-
-        present = np.sum(present, axis=0)
-        all_features = np.concatenate([all_features, present])
-        
-        # print(all_features.shape[0])
-        assert(all_features.shape[0] == self.num_features)
-        return all_features
+        Features about action being taken
+
+        One hot vector of the action is produced. Think of it like visual input:
+        we type the number specified by the one-hot. Actions are shifted by one
+        so that None maps to 0. Only 100 actions can be encoded!
+        """
+        action_idxs = [0 if action is None else action + 1 for action in action_space]
+        betas[np.arange(len(action_space)), action_idxs] = 1
+
+        betas[:, NUM_ACTION_SLOTS:] = self.extract_state_features(raw_state)
+        return betas
+
+
+    def extract_features(self, raw_state, action): # TODO: include action name
+        """
+        When given the raw state by the computer player, extract relevant features
+        and return a one-dimensional vector with n components, where n is the number
+        of features. This will be provided as input to the QLearning algorithm.
+        """
+        return self.extract_features_batch(raw_state, [action])[0]
 
         # TODO: dbl-check, revise, and reincorporate code below...
         
@@ -239,35 +244,60 @@ class QLearningPolicy(Policy):
         print('(policy) Learning on {} experience tuples.'.format(len(betas)))
         # print(rewards)
 
-        old_beta = betas[0]
-        old_reward = rewards[0]
-        for i in range(1, len(rewards)):
-            beta = betas[i]
-            reward = rewards[i]
-            
-            Q_hat = self.model.predict(old_beta.reshape(1, -1))
-            Qp_hat = self.model.predict(beta.reshape(1, -1))
-            # print('Q vals, predicted', Q_hat, Qp_hat) # Debug
-
-            # old   new
-            # . . . x x x
-            # s a r s a r
-            y = old_reward + self.discount * Qp_hat
-            # print('Ideal y', y) # Debug
-            loss = self.model.train_on_batch(old_beta.reshape(1, -1), y)
+        if self.replay_buffer is not None:
+            # The whole game is one episode: its last transition is done, and
+            # is fit to the final reward alone
+            self.replay_buffer.add(betas, rewards)
+            self.learn_from_replay(n_batches=-(-len(betas) // self.batch_size))
+            self.experiences = []
+            self.prev_beta = None
+            return
+
+        # Q-values of every (s, a) in the game in one pass. Experience i is
+        # followed by experience i + 1, so Q(s', a') is just the next row.
+        # old   new
+        # . . . x x x
+        # s a r s a r
+        Q_hats = self.model.predict(betas, batch_size=len(betas))
+        # print('Q vals, predicted', Q_hats) # Debug
+        ys = rewards[:-1].reshape(-1, 1) + self.discount * Q_hats[1:]
+
+        # Fit the (s, a) -> y targets in mini-batches, in game order. The last
+        # experience has no successor, so it only serves as the final Q(s', a')
+        xs = betas[:-1]
+        for start in range(0, len(ys), self.batch_size):
+            end = start + self.batch_size
+            loss = self.model.train_on_batch(xs[start:end], ys[start:end])
             self.file.write(loss)
             # print('(policy) loss: {}'.format(loss)) # Loss is in the 9000's
 
-            old_beta = beta
-            old_reward = reward
-
-            # TODO: will miss final reward? does it matter?
+        # TODO: will miss final reward? does it matter?
 
         # Refresh: once we've learned, discard experiences and start over
         self.experiences = []
         self.prev_beta = None
 
 
+    def learn_from_replay(self, n_batches):
+        """
+        Fits the model on n_batches mini-batches sampled from the replay buffer.
+        With prioritized replay, transitions are reweighted by importance and
+        their priorities are refreshed with the new TD errors.
+        """
+        for _ in range(n_batches):
+            batch = self.replay_buffer.sample(self.batch_size, prioritized=self.prioritized)
+            Qp_hats = self.model.predict(batch.next_betas, batch_size=len(batch.idxs))
+            not_done = (1 - batch.dones).reshape(-1, 1)
+            ys = batch.rewards.reshape(-1, 1) + self.discount * not_done * Qp_hats
+
+            if self.prioritized:
+                Q_hats = self.model.predict(batch.betas, batch_size=len(batch.idxs))
+                self.replay_buffer.update_priorities(batch.idxs, ys - Q_hats)
+
+            loss = self.model.train_on_batch(batch.betas, ys, sample_weight=batch.weights)
+            self.file.write(loss)
+
+
     def add_experience(self, reward, beta):
         """
         Called each time the policy is asked to return a new action. In training
@@ -300,8 +330,7 @@ class QLearningPolicy(Policy):
         def get_best_action(action_space, raw_state):
             # Extract features, calculate betas, feed to network for processing.
             # print('calculating q vals for action space of size {}'.format(len(action_space)))
-            betas = [self.extract_features(raw_state, action) for action in action_space]
-            betas = np.array(betas)
+            betas = self.extract_features_batch(raw_state, action_space)
             Q_vals = self.model.predict(betas)
             # print(Q_vals) # Debug
             best_action = action_space[np.argmax(Q_vals)]
@@ -2,8 +2,6 @@ from card import *
 from collections import OrderedDict as ordereddict
 import numpy as np
 
-np.random.seed(1)
-
 # Flip debug to True to test all cards.
 DEBUG = False
 FIXED = True
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+# From dominion module
+from dominion.policy import QLearningPolicy
+
+
+class FakeModel:
+    # Scores each row by its sum, and remembers the size of every batch
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, x):
+        self.batch_sizes.append(len(x))
+        return np.asarray(x).sum(axis=1)
+
+
+class FeaturePolicy(QLearningPolicy):
+    # QLearningPolicy with features made from the option key alone, since
+    # QLearningPolicy._extract_features is still a stub
+    def _extract_features(self, action, action_label):
+        return [action, len(action_label)]
+
+
+@pytest.fixture
+def fake_model():
+    return FakeModel()
+
+
+@pytest.fixture
+def feature_policy():
+    # A factory, as tests need several policies, some sharing a model
+    def make(model=None):
+        return FeaturePolicy(model, None, train=False)
+
+    return make
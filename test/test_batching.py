@@ -0,0 +1,64 @@
+# Python stdlib
+import threading
+
+import numpy as np
+import pytest
+
+# From dominion module
+from dominion.batching import InferenceBatcher
+from dominion.policy import BatchedPolicy
+
+
+def run_threads(target, n):
+    threads = [threading.Thread(target=target, args=(idx,)) for idx in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_batches_requests_from_threads(fake_model):
+    results = {}
+    with InferenceBatcher(fake_model.predict, max_batch_size=24, max_delay_ms=200) as b:
+        barrier = threading.Barrier(8)
+
+        def request(idx):
+            rows = np.full((3, 2), idx)
+            barrier.wait()
+            results[idx] = b.predict(rows)
+
+        run_threads(request, 8)
+        assert b.n_rows == 24 and b.n_batches == len(fake_model.batch_sizes)
+
+    assert fake_model.batch_sizes == [24], "A full batch runs without waiting it out"
+    for idx, result in results.items():
+        assert list(result) == [2 * idx] * 3, "Each caller gets its own rows back"
+
+
+def test_deadline_and_errors(fake_model):
+    with InferenceBatcher(fake_model.predict, max_batch_size=100, max_delay_ms=1) as b:
+        assert list(b.predict([[1, 2], [3, 4]])) == [3, 7]
+        assert list(b.predict(np.ones((150, 1)))) == [1] * 150
+    assert fake_model.batch_sizes == [2, 150], "Oversized requests run on their own"
+    with pytest.raises(RuntimeError):
+        b.predict([[1]])
+
+    def fail(x):
+        raise ValueError("bad batch")
+
+    with InferenceBatcher(fail) as b:
+        with pytest.raises(ValueError):
+            b.predict([[1]])
+
+
+def test_batched_policy(fake_model, feature_policy):
+    options = {0: "Copper", 3: "Gold", 5: "Village"}
+    chosen = []
+    with InferenceBatcher(fake_model.predict, max_batch_size=32, max_delay_ms=50) as b:
+        policies = [BatchedPolicy(feature_policy(fake_model), b) for _ in range(8)]
+        run_threads(lambda idx: chosen.append(policies[idx].get_input(options)), 8)
+
+    batch_sizes = fake_model.batch_sizes
+    assert sum(batch_sizes) == 8 * 4 and len(batch_sizes) < 8
+    expected = feature_policy(fake_model).get_input(options)
+    assert chosen == [expected] * 8, "Batching does not change the policy's choice"
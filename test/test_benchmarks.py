@@ -0,0 +1,33 @@
+# From dominion module
+from benchmarks import engine  # noqa: F401 (registers the benchmarks)
+from benchmarks import harness
+
+
+def test_run_and_compare(tmp_path):
+    results = harness.run("Player.*", min_time=0.001, repeat=2)
+    assert [r.name for r in results] == ["Player.treasure", "Player.compute_score"]
+    assert all(r.ns_per_op > 0 and r.n_ops >= 1 for r in results)
+
+    path = str(tmp_path / "baseline.json")
+    harness.save(results, path)
+    baseline = harness.load(path)
+    assert set(baseline) == {"Player.treasure", "Player.compute_score"}
+
+    # Pretend the baseline was twice as fast for one benchmark, and missing
+    # for the other
+    baseline["Player.treasure"] = results[0].ns_per_op / 2
+    del baseline["Player.compute_score"]
+    changes = harness.compare(results, baseline)
+    assert changes[0].ratio == 2
+    assert changes[1].ratio is None, "Missing baselines should be reported as new"
+    assert harness.regressions(changes) == [changes[0]]
+
+    report = harness.format_report(changes)
+    assert "REGRESSION" in report and "new" in report
+
+
+def test_game_benchmark():
+    # Whole-game benchmarks should play real games
+    op = harness.BENCHMARKS["Deck.game"]()
+    result = op()
+    assert result.turns > 0
@@ -0,0 +1,80 @@
+# Python stdlib
+import random
+
+import numpy as np
+import pytest
+
+# From dominion module
+from dominion.cards.base_game import COPPER, ESTATE, SILVER, VILLAGE
+from dominion.cards.registry import card_id
+from dominion.common import DeckPile
+from dominion.players import CompactDeck, Deck
+from dominion.policy import RandomPolicy
+from dominion.simulation import SimulationRunner
+
+
+def test_compact_deck_init():
+    # Create a new CompactDeck
+    deck = CompactDeck(debug=True)
+
+    assert len(deck) == 10, "Starting deck size should be 10"
+    assert len(deck.hand) == 0, "Starting hand should be empty"
+    assert len(deck.draw_pile) == 10, "Starting draw pile size should be 10"
+    assert deck.counts[COPPER] == 7, "Should start with 7 Coppers"
+    assert deck.counts[SILVER] == 0, "Should start with no Silvers"
+    assert SILVER not in deck.counts
+
+
+def test_compact_draw_and_move():
+    # Draw, move a Copper to discard, then play a card
+    deck = CompactDeck(starter_deck=[COPPER] * 4 + [VILLAGE], debug=True)
+    hand = deck.draw_cards(5)
+
+    assert hand == deck.hand, "Hand should match deck.hand"
+    assert VILLAGE in deck.hand, "Village should be in hand"
+
+    deck.move(COPPER, from_pile=DeckPile.HAND, to_pile=DeckPile.DISCARD)
+    deck.move(VILLAGE, from_pile=DeckPile.HAND, to_pile=DeckPile.PLAYED)
+
+    assert len(deck.hand) == 3, "Hand should have 3 cards"
+    assert deck.discard_pile[0] == COPPER, "Copper should be at top of discard"
+    assert deck.pile_counts(DeckPile.PLAYED)[card_id(VILLAGE)] == 1
+
+    deck.cleanup()
+    assert len(deck.played_cards) == 0, "Deck should have no played cards"
+    assert len(deck.discard_pile) == 2, "Discard pile should have 2 cards"
+
+
+def test_compact_trash_add():
+    # Trash by index, draw to caller, and add cards back on top of the draw pile
+    deck = CompactDeck(debug=True)
+    deck.draw_cards(5)
+    deck.trash([0, 1])
+    assert len(deck) == 8, "Deck should have 8 cards"
+
+    cards = deck.draw_cards(2, to_caller=True)
+    assert len(deck) == 6, "Deck should have 6 cards"
+
+    deck.add(cards, to_pile=DeckPile.DRAW)
+    assert deck.draw_pile[:2] == cards, "Cards should be on top of draw pile"
+    assert len(deck) == 8, "Deck should have 8 cards"
+
+
+def test_compact_move_card_not_found():
+    # Attempting to move a card that is not in hand raises
+    deck = CompactDeck(starter_deck=[ESTATE] * 5)
+    deck.draw_cards(5)
+    with pytest.raises(RuntimeError):
+        deck.move(SILVER, from_pile=DeckPile.HAND, to_pile=DeckPile.DRAW)
+
+
+def test_compact_matches_deck():
+    # Seeded games play out identically with either kind of deck
+    results = []
+    for deck_cls in [Deck, CompactDeck]:
+        random.seed(3)
+        np.random.seed(3)
+        runner = SimulationRunner([RandomPolicy(), RandomPolicy()], deck_cls=deck_cls)
+        results.append(runner.run(3))
+
+    assert results[0] == results[1], "Games should match"
@@ -1,9 +1,15 @@
+# Python stdlib
+from functools import partial
+
 import pytest
 
 # From dominion module
 from dominion.cards.base_game import COPPER, SILVER, VILLAGE
+from dominion.cards.registry import count_coins
 from dominion.common import DeckPile
-from dominion.players import Deck
+from dominion.players import CompactDeck, Deck
+from dominion.policy import RandomPolicy
+from dominion.simulation import SimulationRunner
 
 
 def test_deck_init():
@@ -142,3 +148,74 @@ def test_move_empty():
     deck.move([], from_pile=DeckPile.HAND, to_pile=DeckPile.TRASH)
     assert len(deck.hand) == 5, "Should have hand of 5 cards"
     assert len(deck) == 10, "Should have deck of 10 cards"
+
+
+def test_counts():
+    # Counts follow cards as they are added, trashed and drawn to the caller
+    deck = Deck(debug=True)
+    assert deck.counts[COPPER] == 7, "Should start with 7 Coppers"
+
+    deck.draw_cards(5)
+    deck.add([SILVER, SILVER])
+    assert deck.counts[SILVER] == 2, "Should have 2 Silvers"
+
+    deck.trash(deck.hand[:2])
+    assert len(deck) == 10, "Deck should have 10 cards"
+
+    cards = deck.draw_cards(3, to_caller=True)
+    assert len(deck) == 7, "Deck should have 7 cards"
+    assert sum(deck.counts.values()) == 7, "Counts should sum to deck size"
+
+    deck.add(cards, to_pile=DeckPile.DRAW)
+    assert len(deck) == 10, "Deck should have 10 cards"
+
+
+def test_move_to_trash_counts():
+    # Moving cards straight to the trash also removes them from the counts
+    deck = Deck(starter_deck=[VILLAGE, VILLAGE], debug=True)
+    deck.draw_cards(2)
+    deck.move(VILLAGE, from_pile=DeckPile.HAND, to_pile=DeckPile.TRASH)
+
+    assert len(deck) == 1, "Deck should have 1 card"
+    assert deck.counts[VILLAGE] == 1, "Should have 1 Village left"
+
+
+def test_check_counts():
+    # Tampering with a pile directly is caught by the consistency check
+    deck = Deck()
+    deck.check_counts()
+
+    deck.draw_pile.append(SILVER)
+    with pytest.raises(RuntimeError):
+        deck.check_counts()
+
+
+def test_hand_coins():
+    # Hand coins follow the hand through every operation, in both decks
+    for deck_cls in [Deck, CompactDeck]:
+        deck = deck_cls(starter_deck=[COPPER] * 3 + [SILVER] * 2 + [VILLAGE] * 2)
+        assert deck.hand_coins == 0
+        deck.draw_cards(7)
+        assert deck.hand_coins == 7
+        deck.move(SILVER, from_pile=DeckPile.HAND, to_pile=DeckPile.PLAYED)
+        deck.trash(COPPER)
+        assert deck.hand_coins == 4
+        deck.add(SILVER, to_pile=DeckPile.HAND)
+        deck.move(COPPER, from_pile=DeckPile.HAND, to_pile=DeckPile.DRAW)
+        assert deck.hand_coins == 5
+
+        state = deck.snapshot()
+        deck.draw_cards(5)
+        deck.restore(state)
+        assert deck.hand_coins == 5
+        deck.redeal()
+        assert deck.hand_coins == count_coins(deck.hand)
+        deck.cleanup()
+        deck.draw_cards(0)
+        assert deck.hand_coins == 0, "Replacing the hand discards its coins"
+
+
+def test_hand_coins_in_games():
+    # The debug check verifies hand coins after every change to the counts
+    deck_cls = partial(Deck, debug=True)
+    SimulationRunner([RandomPolicy(), RandomPolicy()], deck_cls=deck_cls).run(2)
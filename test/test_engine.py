@@ -0,0 +1,128 @@
+# Python stdlib
+import asyncio
+
+import pytest
+
+# From dominion module
+from dominion.engine import GameEngine
+from dominion.policy import AsyncPolicy, RandomPolicy
+from dominion.recording import GameRecorder, ReplayReader, simulate
+from dominion.simulation import SimulationRunner
+
+
+def answer(ctx, decision):
+    # The choice the player's own policy would have made. Policies are shared by
+    # the runner's games, so point it at this game's generator first
+    policy = decision.player.policy
+    policy.bind(ctx)
+    return policy.get_input(decision.options, allow_skip=decision.allow_skip)
+
+
+def test_matches_blocking_games():
+    # Games driven one decision at a time, interleaved in a single thread, play
+    # out exactly as the same seeded games played with blocking input
+    expected = SimulationRunner([RandomPolicy(), RandomPolicy()], seed=5).run(4)
+
+    runner = SimulationRunner([RandomPolicy(), RandomPolicy()], seed=5)
+    contexts = [runner.make_context() for _ in range(4)]
+    engines = [GameEngine(ctx, max_turns=runner.max_turns) for ctx in contexts]
+    pending = [engine.step() for engine in engines]
+    while any(decision is not None for decision in pending):
+        for idx, (engine, decision) in enumerate(zip(engines, pending)):
+            if decision is not None:
+                assert engine.pending_decision() is decision
+                pending[idx] = engine.step(answer(engine.ctx, decision))
+
+    assert all(engine.done for engine in engines)
+    assert [runner.finish_game(ctx) for ctx in contexts] == expected
+
+
+def test_external_seats_and_recording(tmp_path):
+    path = str(tmp_path / "games.rec")
+    recorder = GameRecorder(path)
+    runner = SimulationRunner([RandomPolicy(), RandomPolicy()], recorder=recorder)
+    ctx = runner.make_context()
+    engine = GameEngine(ctx, external=[1])
+
+    decision = engine.step()
+    with pytest.raises(ValueError):
+        engine.step(max(decision.options) + 1)
+    assert engine.pending_decision() is decision, "A bad choice changes nothing"
+
+    while decision is not None:
+        assert decision.player is ctx.player_order[1], "Only seat 1 is external"
+        decision = engine.step(answer(ctx, decision))
+    result = runner.finish_game(ctx)
+    recorder.close()
+
+    # Choices made through step() are recorded like any other
+    replay = simulate(ReplayReader(path)[0])
+    assert [p.compute_score() for p in replay.player_order] == result.scores
+
+
+class SlowRandomPolicy(AsyncPolicy):
+    # Waits as if asking a remote bot, then picks like a RandomPolicy bound to
+    # the game, so each game in flight needs its own copy
+    def __init__(self):
+        super().__init__()
+        self.policy = RandomPolicy()
+
+    def bind(self, ctx):
+        super().bind(ctx)
+        self.policy.bind(ctx)
+
+    async def get_input(self, options, allow_skip=True):
+        await asyncio.sleep(0)
+        return self.policy.get_input(options, allow_skip=allow_skip)
+
+
+class SlowFirstPolicy(AsyncPolicy):
+    # Waits as if asking a remote bot, then always takes the first option.
+    # Keeps no per-game state, so one instance serves every game in flight
+    def __init__(self):
+        super().__init__()
+        self.waiting = 0
+        self.most_waiting = 0
+
+    async def get_input(self, options, allow_skip=True):
+        self.waiting += 1
+        self.most_waiting = max(self.most_waiting, self.waiting)
+        await asyncio.sleep(0)
+        self.waiting -= 1
+        return next(iter(options))
+
+
+def test_async_games(tmp_path):
+    # One game at a time, awaited policies play exactly as blocking ones
+    expected = SimulationRunner([RandomPolicy(), RandomPolicy()], seed=3).run(3)
+    runner = SimulationRunner([SlowRandomPolicy(), RandomPolicy()], seed=3)
+    assert asyncio.run(runner.run_async(3, concurrency=1)) == expected
+
+    # Games in flight take turns while their policies wait. A shared
+    # AsyncPolicy is not bound to any of them
+    first = SlowFirstPolicy()
+    rng = first.rng
+    runner = SimulationRunner([first, SlowFirstPolicy()], max_turns=10)
+    results = asyncio.run(runner.run_async(8))
+    assert len(results) == 8 and runner.n_games == 8
+    assert first.most_waiting == 8, "Every game waits on the policy at once"
+    assert first.rng is rng
+
+    # Each game in flight binds its own copies of policies that keep per-game
+    # state, so they draw from their own game's generator and play as they
+    # would alone
+    def play(concurrency):
+        blocking, slow = RandomPolicy(), SlowRandomPolicy()
+        rngs = (blocking.rng, slow.policy.rng)
+        runner = SimulationRunner([blocking, slow], seed=1)
+        results = asyncio.run(runner.run_async(6, concurrency=concurrency))
+        return results, rngs == (blocking.rng, slow.policy.rng)
+
+    results, unbound = play(concurrency=3)
+    assert unbound, "Copies are bound, not the runner's policies"
+    assert play(concurrency=1)[0] == results
+
+    runner.recorder = GameRecorder(str(tmp_path / "games.rec"))
+    with pytest.raises(ValueError):
+        asyncio.run(runner.run_async(2))
+    runner.recorder.close()
@@ -0,0 +1,72 @@
+# From dominion module
+from dominion.common import QueuePosition
+from dominion.event_queue import EventQueue
+from dominion.events import BuyEvent, CleanupEvent, PlayActionEvent
+
+
+def make_turn(name="P1"):
+    return [PlayActionEvent(name), BuyEvent(name), CleanupEvent(name)]
+
+
+def kinds(queue):
+    return [type(event) for event in queue]
+
+
+def test_back_and_front():
+    # Events added to the front come out first, in order
+    queue = EventQueue(make_turn())
+    queue.add([BuyEvent("P1"), PlayActionEvent("P1")], where=QueuePosition.FRONT)
+
+    assert len(queue) == 5, "Queue should have 5 events"
+    assert kinds(queue) == [
+        BuyEvent,
+        PlayActionEvent,
+        PlayActionEvent,
+        BuyEvent,
+        CleanupEvent,
+    ]
+    assert type(queue.popleft()) is BuyEvent
+    assert len(queue) == 4, "Popping should shrink the queue"
+
+
+def test_count_and_clear_front():
+    # Consecutive events of one type at the front are counted and cleared
+    queue = EventQueue(make_turn())
+    queue.add([PlayActionEvent("P1")] * 2, where=QueuePosition.FRONT)
+
+    assert queue.count_front(PlayActionEvent) == 3, "Should count 3 actions"
+    assert queue.count_front(BuyEvent) == 0, "Buys are not at the front"
+
+    queue.clear_front(BuyEvent)
+    assert len(queue) == 5, "Clearing another type should do nothing"
+
+    queue.clear_front(PlayActionEvent)
+    assert kinds(queue) == [BuyEvent, CleanupEvent]
+
+
+def test_after_next():
+    # Events are inserted behind the next event
+    queue = EventQueue(make_turn())
+    queue.add([BuyEvent("P1")], where=QueuePosition.AFTER_NEXT)
+
+    assert kinds(queue) == [PlayActionEvent, BuyEvent, BuyEvent, CleanupEvent]
+    assert queue.count_front(PlayActionEvent) == 1
+
+    # An empty queue just takes the events
+    queue = EventQueue()
+    queue.add([CleanupEvent("P1")], where=QueuePosition.AFTER_NEXT)
+    assert kinds(queue) == [CleanupEvent]
+
+
+def test_before_next_buy():
+    # Events are inserted ahead of the next BuyEvent
+    queue = EventQueue(make_turn() + make_turn("P2"))
+    queue.add([PlayActionEvent("P1")], where=QueuePosition.BEFORE_NEXT_BUY)
+
+    assert kinds(queue)[:3] == [PlayActionEvent, PlayActionEvent, BuyEvent]
+    assert queue.count_front(PlayActionEvent) == 2, "Runs should be merged"
+
+    # With no BuyEvent queued, events go to the back
+    queue = EventQueue([CleanupEvent("P1")])
+    queue.add([PlayActionEvent("P1")], where=QueuePosition.BEFORE_NEXT_BUY)
+    assert kinds(queue) == [CleanupEvent, PlayActionEvent]
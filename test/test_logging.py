@@ -0,0 +1,99 @@
+import pytest
+
+# From dominion module
+import dominion.util.logging as logging
+from dominion.common import LogTarget
+from dominion.game import GameContext
+from dominion.players import ComputerPlayer
+from dominion.policy import RandomPolicy
+from dominion.simulation import SimulationRunner
+from dominion.util.message import Message
+
+
+def play(log_sink, n_events=300):
+    players = [ComputerPlayer(f"Player {i} (CPU)", RandomPolicy()) for i in (1, 2)]
+    ctx = GameContext(players, log_sink=log_sink)
+    name_to_player = {player.name: player for player in players}
+    for _ in range(n_events):
+        if ctx.reached_end():
+            break
+        event = ctx.get_next_event()
+        event(ctx, name_to_player[event.target])
+    log_sink.flush()
+    return ctx
+
+
+def test_ring_buffer():
+    sink = logging.RingBufferSink(capacity=50)
+    ctx = play(sink)
+
+    assert len(sink.records) == 50, "Ring buffer should keep the last messages"
+    assert all(player.log_sink is sink for player in ctx.player_order)
+
+    # Players see their own messages and everything sent to the observer
+    observed = sink.messages(logging.OBSERVER)
+    seen = sink.messages("Player 1 (CPU)")
+    assert set(observed) <= set(seen)
+    assert len(seen) > len(observed), "Player should have their own messages"
+
+
+def test_batched_file_sink(tmp_path):
+    sink = logging.BatchedFileSink(str(tmp_path / "logs"))
+    play(sink)
+    sink.close()
+
+    names = sorted(path.name for path in (tmp_path / "logs").iterdir())
+    assert names == ["game.log", "observer.log", "player-1-cpu.log", "player-2-cpu.log"]
+    text = (tmp_path / "logs" / "game.log").read_text()
+    assert "\x1b" not in text, "Styles should be stripped from log files"
+    assert "draws 5 cards" in text
+
+
+def test_batched_file_sink_errors(tmp_path):
+    # A failed write is reported by the next flush, not lost
+    (tmp_path / "logs").write_text("not a directory")
+    sink = logging.BatchedFileSink(str(tmp_path / "logs"))
+    sink.write([LogTarget.GAME], "first game")
+    sink.flush()
+    sink.write([LogTarget.GAME], "second game")
+    with pytest.raises(OSError):
+        sink.flush()
+
+
+def test_null_sink(tmp_path, monkeypatch):
+    # Nothing should be written anywhere, not even the run_* directory
+    monkeypatch.chdir(tmp_path)
+    play(logging.NullSink())
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_disabled_sink():
+    # Sinks that drop messages let games skip building them, which must not
+    # change how the games play out
+    def run(log_sink):
+        runner = SimulationRunner(
+            [RandomPolicy(), RandomPolicy()], log_sink=log_sink, seed=4
+        )
+        return runner.run(3)
+
+    ctx = play(logging.NullSink(), n_events=1)
+    assert not ctx.log_enabled
+    assert not any(player.show_enabled for player in ctx.player_order)
+    assert play(logging.RingBufferSink(), n_events=1).log_enabled
+
+    assert run(logging.NullSink()) == run(logging.RingBufferSink())
+
+
+def test_structured_records():
+    # Every game event is logged as a Message saying what happened and to whom
+    sink = logging.RingBufferSink(capacity=100000)
+    ctx = play(sink, n_events=2000)
+    names = {player.name for player in ctx.player_order}
+    records = [
+        message for targets, message in sink.records if LogTarget.GAME in targets
+    ]
+    assert records and all(isinstance(message, Message) for message in records)
+    assert all(message.kind and message.player in names for message in records)
+
+    buys = sink.messages(logging.GAME, kind="buy")
+    assert buys and all(" bought " in text for text in buys)
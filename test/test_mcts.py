@@ -0,0 +1,66 @@
+# Python stdlib
+import random
+
+import numpy as np
+import pytest
+
+# From dominion module
+from dominion.players import CompactDeck
+from dominion.policy import MCTSPolicy, RandomPolicy
+from dominion.simulation import SimulationRunner
+
+
+def test_needs_budget():
+    with pytest.raises(ValueError):
+        MCTSPolicy(n_rollouts=None, time_limit_ms=None)
+
+
+@pytest.mark.parametrize("deck_cls", [None, CompactDeck])
+def test_play_game(deck_cls):
+    # A cheap search should still play a full, legal game
+    random.seed(0)
+    np.random.seed(0)
+    policy = MCTSPolicy(n_rollouts=4, max_rollout_turns=2)
+    kwargs = {"deck_cls": deck_cls} if deck_cls else {}
+    runner = SimulationRunner([policy, RandomPolicy()], max_turns=15, **kwargs)
+    (result,) = runner.run(1)
+
+    assert result.turns > 0, "Game should be played"
+    ctx = policy.ctx
+    for player in ctx.player_order:
+        assert "get_input" not in vars(player), "Search should clean up"
+        player.deck.check_counts()
+
+
+def test_search_leaves_game_unchanged():
+    random.seed(1)
+    np.random.seed(1)
+    policy = MCTSPolicy(n_rollouts=8, max_rollout_turns=2)
+    runner = SimulationRunner([policy, RandomPolicy()])
+    ctx = runner.make_context()
+    name_to_player = {player.name: player for player in ctx.player_order}
+
+    # Play until the policy faces its first real choice, then search there
+    # repeatedly: each search should see (and leave) the same game
+    while True:
+        event = ctx.get_next_event()
+        if event.target == ctx.player_order[0].name and type(event).__name__ == (
+            "BuyEvent"
+        ):
+            break
+        event(ctx, name_to_player[event.target])
+
+    me = ctx.player_order[0]
+    before = (list(me.hand), list(me.deck.draw_pile), list(ctx.supply.values()))
+    options = {0: "Copper", 1: "Silver"}
+    for _ in range(3):
+        assert policy.get_input(options) in (0, 1, "Skip")
+        after = (list(me.hand), list(me.deck.draw_pile), list(ctx.supply.values()))
+        assert after == before, "Search should restore the game"
+
+
+def test_time_limit():
+    policy = MCTSPolicy(n_rollouts=None, time_limit_ms=5, max_rollout_turns=1)
+    runner = SimulationRunner([policy, RandomPolicy()], max_turns=3)
+    (result,) = runner.run(1)
+    assert result.turns > 0, "Game should be played with a time budget"
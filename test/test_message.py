@@ -0,0 +1,35 @@
+# From dominion module
+import dominion.util.logging as logging
+from dominion.cards.base_game import COPPER, GOLD
+from dominion.cards.registry import card_id
+from dominion.util.message import Message
+from dominion.util.prettyprint import card_to_str, hand_to_str
+
+
+def test_render():
+    message = Message("{} bought {}.", "Player 1", GOLD, kind="buy")
+    assert str(message) == f"Player 1 bought {card_to_str(GOLD)}."
+    assert message.card_ids == (card_id(GOLD),)
+
+    hand = (COPPER, GOLD)
+    message = Message(hand_to_str, hand)
+    assert str(message) == hand_to_str(hand)
+    assert message.card_ids == (card_id(COPPER), card_id(GOLD))
+
+
+def test_lazy():
+    calls = []
+
+    def render(*args):
+        calls.append(args)
+        return "rendered"
+
+    message = Message(render, 1, 2)
+    logging.log(logging.GAME, message, sink=logging.NullSink())
+    assert calls == [], "Discarded messages should never be rendered"
+
+    sink = logging.RingBufferSink(capacity=10)
+    logging.log(logging.GAME, message, sink=sink)
+    assert sink.messages(logging.GAME) == ["rendered"]
+    assert str(message) == "rendered"
+    assert calls == [(1, 2)], "Rendered text should be cached"
@@ -0,0 +1,27 @@
+# From dominion module
+from dominion.parallel import ParallelSimulationRunner
+from dominion.policy import RandomPolicy
+
+
+def test_parallel_run():
+    # Play games across two workers in uneven chunks
+    policies = [RandomPolicy(), RandomPolicy()]
+    with ParallelSimulationRunner(policies, n_workers=2, chunk_size=3) as runner:
+        batch = runner.run(8)
+
+    assert len(batch.results) == 8, "Should return one result per game"
+    assert sum(batch.wins) == 8, "Every game should have a winner"
+    assert len(batch.experiences) == 2, "Should have experiences per seat"
+
+
+def test_parallel_seeded():
+    # The same base seed should reproduce the same games
+    policies = [RandomPolicy(), RandomPolicy()]
+    batches = []
+    for _ in range(2):
+        with ParallelSimulationRunner(
+            policies, n_workers=2, chunk_size=2, seed=7
+        ) as runner:
+            batches.append(runner.run(4))
+
+    assert batches[0].results == batches[1].results, "Seeded runs should match"
@@ -0,0 +1,97 @@
+# Python stdlib
+import os
+import pickle
+import stat
+import threading
+from multiprocessing import AuthenticationError
+
+import numpy as np
+import pytest
+
+# From dominion module
+from dominion.policy import RemotePolicy
+from dominion.policy_server import (
+    PolicyServer,
+    RemoteModel,
+    get_pool,
+    read_authkey,
+    write_authkey,
+)
+
+
+def row_sums(x):
+    return np.asarray(x).sum(axis=1)
+
+
+def test_remote_predictions(tmp_path):
+    address = str(tmp_path / "policy.sock")
+    models = {"sum": row_sums, "max": lambda x: np.asarray(x).max(axis=1)}
+    with PolicyServer(models, address, max_delay_ms=20) as server:
+        server.start()
+        key = server.authkey
+        assert key, "A key is made when none is given"
+        model = RemoteModel(address, key, "sum")
+        assert list(model.predict([[1, 2], [3, 4]])) == [3, 7]
+        assert list(RemoteModel(address, key, "max").predict([[1, 2]])) == [2]
+        with pytest.raises(RuntimeError):
+            RemoteModel(address, key, "missing").predict([[1]])
+
+        results = {}
+
+        def request(idx):
+            results[idx] = model.predict(np.full((2, 3), idx))
+
+        threads = [threading.Thread(target=request, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(list(results[idx]) == [3 * idx] * 2 for idx in range(8))
+
+        pool = get_pool(address, key)
+        assert 1 <= len(pool._idle) <= 8, "Connections are kept for reuse"
+        assert server.batchers["sum"].n_batches < 10, "Clients share batches"
+        pool.close()
+
+
+def test_remote_policy_over_tcp(fake_model, feature_policy):
+    options = {0: "Copper", 3: "Gold", 5: "Village"}
+    expected = feature_policy(fake_model).get_input(options)
+
+    with PolicyServer({"q": fake_model}, ("127.0.0.1", 0), authkey=b"key") as server:
+        server.start()
+        policy = RemotePolicy(feature_policy(), server.address, b"key", model="q")
+        assert policy.get_input(options) == expected
+
+        # Only the address and key travel, so workers can connect on their own
+        copy = pickle.loads(pickle.dumps(policy))
+        assert copy.get_input(options) == expected
+
+        with pytest.raises(Exception):
+            RemoteModel(server.address, b"wrong", "q").predict([[1]])
+
+
+def test_security(tmp_path, monkeypatch):
+    # Requests are unpickled, so the server only listens on loopback addresses
+    for host in ("0.0.0.0", "", "example.com"):
+        with pytest.raises(ValueError):
+            PolicyServer({}, (host, 0))
+
+    path = str(tmp_path / "policy_server.key")
+    write_authkey(path, b"secret")
+    assert read_authkey(path) == b"secret"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600, "Only the owner can read"
+
+    # Failed handshakes are skipped, but other accept errors are raised
+    server = PolicyServer({}, str(tmp_path / "policy.sock"))
+    errors = [AuthenticationError("digest received was wrong"), EOFError()]
+    errors.append(OSError("too many open files"))
+
+    def accept():
+        raise errors.pop(0)
+
+    monkeypatch.setattr(server._listener, "accept", accept)
+    with pytest.raises(OSError):
+        server.serve_forever()
+    assert not errors
+    server.close()
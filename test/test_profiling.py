@@ -0,0 +1,81 @@
+# Python stdlib
+import json
+import tracemalloc
+
+# From dominion module
+from dominion.policy import MCTSPolicy, RandomPolicy
+from dominion.profiling import Profiler
+from dominion.simulation import SimulationRunner
+
+
+def test_profile_games(tmp_path):
+    profiler = Profiler()
+    policies = [RandomPolicy(), RandomPolicy()]
+    results = SimulationRunner(policies, profiler=profiler, seed=3).run(3)
+
+    rows = {row.name: row for row in profiler.by_name()}
+    turns = sum(result.turns for result in results)
+    # Every player gets one CleanupEvent per turn, except in a final turn cut
+    # short by the game ending
+    assert turns <= rows["CleanupEvent"].calls <= 2 * turns
+    assert rows["SetupEvent"].calls == 2 * len(results)
+    for row in rows.values():
+        assert 0 <= row.self_ns <= row.total_ns
+
+    cards = [key for key in profiler.stats if key[-1].endswith(".play")]
+    assert cards, "Random players should play some action cards"
+    for key in cards:
+        assert key[0].endswith("Event"), "Cards are played from events"
+
+    assert "PlayActionEvent" in profiler.format_table()
+    path = tmp_path / "profile.json"
+    profiler.save_json(str(path))
+    data = json.loads(path.read_text())
+    assert len(data["stacks"]) == len(profiler.stats)
+    for line in profiler.to_collapsed().splitlines():
+        stack, us = line.rsplit(" ", 1)
+        assert tuple(stack.split(";")) in profiler.stats and int(us) >= 0
+
+
+def test_nesting():
+    profiler = Profiler(memory=True)
+
+    def outer():
+        profiler.run("inner", lambda: [0] * 10000)
+        profiler.run("inner", lambda: None)
+
+    profiler.run("outer", outer)
+    profiler.close()
+
+    inner = profiler.stats[("outer", "inner")]
+    outer = profiler.stats[("outer",)]
+    assert inner.calls == 2 and outer.calls == 1
+    assert outer.total_ns == outer.self_ns + inner.total_ns
+    assert not profiler._stack, "The stack should be empty between calls"
+
+    profiler.reset()
+    assert not profiler.stats
+
+
+def test_close_keeps_callers_tracing():
+    # Tracing the caller started is left running when the profiler closes
+    tracemalloc.start()
+    try:
+        Profiler(memory=True).close()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    Profiler(memory=True).close()
+    assert not tracemalloc.is_tracing(), "Tracing started by the profiler stops"
+
+
+def test_mcts_search_not_profiled():
+    profiler = Profiler()
+    mcts = MCTSPolicy(n_rollouts=3, max_rollout_turns=2)
+    runner = SimulationRunner(
+        [mcts, RandomPolicy()], max_turns=4, profiler=profiler, seed=0
+    )
+    (result,) = runner.run(1)
+    rows = {row.name: row for row in profiler.by_name()}
+    assert rows["BuyEvent"].calls <= 2 * result.turns, "Rollouts are not counted"
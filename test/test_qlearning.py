@@ -0,0 +1,97 @@
+# Python stdlib
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# The legacy QLearningPolicy builds a Keras model when it is created
+pytest.importorskip("tensorflow")
+
+# From dominion module
+from card import ALL_CARDS, get_card_id  # noqa: E402
+from policy import NUM_CARDS, QLearningPolicy  # noqa: E402
+from table import Table  # noqa: E402
+
+
+class LinearModel:
+    # Fixed Q(s, a) = w . beta, recording every batch it is trained on
+    def __init__(self, n_features):
+        self.w = np.random.RandomState(0).normal(size=(n_features, 1))
+        self.trained = []
+
+    def predict(self, x, batch_size=None):
+        return np.asarray(x) @ self.w
+
+    def train_on_batch(self, x, y, sample_weight=None):
+        self.trained.append((np.array(x), np.array(y)))
+        return 0.0
+
+
+def make_policy(batch_size=32):
+    policy = QLearningPolicy(batch_size=batch_size)
+    policy.model = LinearModel(policy.num_features)
+    return policy
+
+
+def sequential_targets(policy, betas, rewards):
+    # The (x, y) pairs the original per-step loop trained on, one at a time
+    pairs = []
+    for i in range(1, len(rewards)):
+        Qp_hat = policy.model.predict(betas[i].reshape(1, -1))
+        pairs.append((betas[i - 1], rewards[i - 1] + policy.discount * Qp_hat[0]))
+    return pairs
+
+
+def sequential_features(policy, raw_state, action):
+    # The original one-action-at-a-time feature extraction
+    me = raw_state["players"][0]
+    table = raw_state["table"]
+    action_one_hot = np.eye(100)[0 if action is None else action + 1]
+    hand = np.eye(NUM_CARDS)[[get_card_id(card) for card in me.hand]]
+    hand = np.concatenate([hand, np.zeros((15 - len(hand), NUM_CARDS))])
+    present = np.sum(
+        [np.eye(NUM_CARDS)[get_card_id(c)] * table.table[c] for c in table.cards],
+        axis=0,
+    )
+    return np.concatenate([action_one_hot, hand.flatten(), present])
+
+
+@pytest.mark.parametrize("n_experiences,batch_size", [(10, 32), (40, 8), (17, 16)])
+def test_batched_update_matches_sequential(n_experiences, batch_size):
+    policy = make_policy(batch_size)
+    rng = np.random.RandomState(n_experiences)
+    for _ in range(n_experiences):
+        beta = rng.randint(0, 2, size=policy.num_features).astype(float)
+        policy.experiences.append((beta, float(rng.randint(-1, 2))))
+
+    # Rewards after propagating the final reward back, as update_weights does
+    betas, rewards = map(np.array, zip(*policy.experiences))
+    decay = policy.decay ** np.arange(len(rewards) - 1, -1, -1.0)
+    decay[-1] = 0
+    rewards = rewards + rewards[-1] * decay
+    expected = sequential_targets(policy, betas, rewards)
+
+    policy.update_weights()
+    xs = np.concatenate([x for x, _ in policy.model.trained])
+    ys = np.concatenate([y for _, y in policy.model.trained])
+    assert all(len(x) == len(y) for x, y in policy.model.trained)
+    assert len(xs) == n_experiences - 1, "Every experience but the last is fit"
+    assert np.array_equal(xs, np.array([x for x, _ in expected]))
+    assert np.allclose(ys, np.array([y for _, y in expected]))
+    assert policy.experiences == [], "Experiences are cleared after learning"
+
+
+def test_batched_features_match_sequential():
+    policy = make_policy()
+    random.seed(0)
+    table = Table(2)
+    for n_hand in (0, 5, 15):
+        me = SimpleNamespace(hand=random.sample(ALL_CARDS, n_hand))
+        raw_state = {"table": table, "players": [me]}
+        actions = [None, 0, 3, 7]
+        betas = policy.extract_features_batch(raw_state, actions)
+        for action, beta in zip(actions, betas):
+            expected = sequential_features(policy, raw_state, action)
+            assert np.array_equal(beta, expected), f"Mismatch for action {action}"
+            assert np.array_equal(policy.extract_features(raw_state, action), beta)
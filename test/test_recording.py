@@ -0,0 +1,82 @@
+import pytest
+
+# From dominion module
+from dominion.players import CompactDeck
+from dominion.policy import MCTSPolicy, RandomPolicy
+from dominion.recording import GameRecorder, ReplayReader, simulate
+from dominion.simulation import SimulationRunner
+
+
+def record(path, n_games, policies=None, **kwargs):
+    recorder = GameRecorder(path)
+    policies = policies or [RandomPolicy(), RandomPolicy()]
+    runner = SimulationRunner(policies, recorder=recorder, **kwargs)
+    results = runner.run(n_games)
+    recorder.close()
+    return results
+
+
+def test_record_and_replay(tmp_path):
+    path = str(tmp_path / "games.rec")
+    results = record(path, 5)
+
+    reader = ReplayReader(path)
+    assert len(reader) == 5, "Should have one recorded game per game played"
+    for result, game in zip(results, reader):
+        assert game.scores == result.scores
+        assert game.turns == result.turns
+        assert game.choices, "Decisions should be recorded"
+
+        # Re-simulating the game should reproduce it exactly
+        ctx = simulate(game)
+        assert ctx.turn == result.turns
+        assert [p.compute_score() for p in ctx.player_order] == result.scores
+        assert [p.n_bought for p in ctx.player_order] == result.buys
+
+
+def test_seek(tmp_path):
+    path = str(tmp_path / "games.rec")
+    record(path, 1)
+    game = ReplayReader(path)[0]
+
+    ctx = simulate(game, turn=4)
+    assert ctx.turn == 3 and not ctx.event_queue, "Should stop before turn 4"
+    turn_choices = [c for c in game.choices if c.turn < 4]
+    policies = [player.policy for player in ctx.player_order]
+    assert sum(len(p.choices) for p in policies) == len(game.choices) - len(
+        turn_choices
+    ), "Only the choices of later turns should be left"
+
+    ctx = simulate(game, turn=0)
+    assert all(len(player.hand) == 0 for player in ctx.player_order)
+
+
+def test_append_and_compact_deck(tmp_path):
+    # Recordings can be appended to, and replayed with either kind of deck
+    path = str(tmp_path / "games.rec")
+    record(path, 2, max_turns=5)
+    results = record(path, 1, deck_cls=CompactDeck)
+
+    reader = ReplayReader(path)
+    assert len(reader) == 3
+    ctx = simulate(reader[2], deck_cls=CompactDeck)
+    assert [p.compute_score() for p in ctx.player_order] == results[0].scores
+
+
+def test_mcts_search_not_recorded(tmp_path):
+    # Rollouts replay parts of the game; only the real moves should be recorded
+    path = str(tmp_path / "games.rec")
+    mcts = MCTSPolicy(n_rollouts=5, max_rollout_turns=2)
+    (result,) = record(path, 1, policies=[mcts, RandomPolicy()], max_turns=6)
+
+    ctx = simulate(ReplayReader(path)[0])
+    assert [p.compute_score() for p in ctx.player_order] == result.scores
+
+
+def test_bad_file(tmp_path):
+    path = tmp_path / "games.rec"
+    path.write_bytes(b"not a recording")
+    with pytest.raises(ValueError):
+        ReplayReader(str(path))
+    with pytest.raises(ValueError):
+        GameRecorder(str(path))
@@ -0,0 +1,56 @@
+import numpy as np
+
+# From dominion module
+from dominion.cards.base_game import COPPER, GARDENS, MILITIA, MOAT, PROVINCE
+from dominion.cards.registry import (
+    ALL_CARDS,
+    COST,
+    IS_ACTION,
+    IS_ATTACK,
+    IS_REACTION,
+    NUM_CARDS,
+    VALUE,
+    card_counts,
+    card_id,
+    score,
+)
+from dominion.policy import RandomPolicy
+from dominion.simulation import SimulationRunner
+from dominion.util.cardfuncs import is_action_card
+
+
+def deck_cards(deck):
+    return [*deck.draw_pile, *deck.discard_pile, *deck.hand, *deck.played_cards]
+
+
+def test_tables():
+    assert len(COST) == NUM_CARDS
+    assert list(COST) == [card.cost for card in ALL_CARDS]
+    assert list(IS_ACTION) == [is_action_card(card) for card in ALL_CARDS]
+    assert VALUE[card_id(COPPER)] == 1 and VALUE[card_id(PROVINCE)] == 0
+    assert IS_ATTACK[card_id(MILITIA)] and IS_REACTION[card_id(MOAT)]
+    assert not COST.flags.writeable, "Tables are shared and read-only"
+
+    counts = card_counts([COPPER, COPPER, GARDENS])
+    assert counts[card_id(COPPER)] == 2 and counts.sum() == 3
+
+
+def test_score_matches_players():
+    runner = SimulationRunner([RandomPolicy(), RandomPolicy()], seed=0)
+    contexts = []
+    for _ in range(5):
+        ctx = runner.make_context()
+        contexts.append(ctx)
+        while not ctx.reached_end() and ctx.turn < 100:
+            event = ctx.get_next_event()
+            event(ctx, {p.name: p for p in ctx.player_order}[event.target])
+
+    # Scores of every player of every game, at once
+    counts = np.array(
+        [
+            [card_counts(deck_cards(p.deck)) for p in ctx.player_order]
+            for ctx in contexts
+        ]
+    )
+    expected = [[p.compute_score() for p in ctx.player_order] for ctx in contexts]
+    assert score(counts).tolist() == expected
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+# From dominion module
+from dominion.replay_buffer import ReplayBuffer
+
+
+def make_transitions(start, n, n_features=4):
+    # Transition i has beta [i, i, ...] and reward i, so it is easy to identify
+    betas = np.repeat(np.arange(start, start + n, dtype=np.float32), n_features)
+    betas = betas.reshape(n, n_features)
+    return betas, np.arange(start, start + n, dtype=np.float32)
+
+
+def test_ring_storage(tmp_path):
+    buffer = ReplayBuffer(str(tmp_path / "replay"), capacity=10, n_features=4)
+    buffer.add(*make_transitions(0, 8))
+    assert len(buffer) == 8
+
+    # Overflowing the capacity overwrites the oldest transitions
+    buffer.add(*make_transitions(8, 5))
+    assert len(buffer) == 10, "Buffer should not grow past its capacity"
+    assert sorted(buffer.rewards) == list(range(3, 13)), "Oldest should go first"
+
+    batch = buffer.sample(64)
+    assert batch.betas.shape == (64, 4)
+    assert np.all(batch.betas[:, 0] == batch.rewards), "Rows should line up"
+    done = np.isin(batch.rewards, [7, 12])  # The ends of the two episodes
+    assert np.all(batch.dones == done), "Only each episode's last step is done"
+    assert np.all(batch.next_betas[~done] == batch.betas[~done] + 1)
+    assert np.all(batch.next_betas[done] == 0), "Done steps have no next beta"
+    assert np.all(batch.weights == 1), "Uniform samples are not reweighted"
+
+    with pytest.raises(ValueError):
+        buffer.add(*make_transitions(13, 2), dones=[False, False])
+
+
+def test_persistence(tmp_path):
+    path = str(tmp_path / "replay")
+    buffer = ReplayBuffer(path, capacity=10, n_features=4)
+    buffer.add(*make_transitions(0, 6))
+    buffer.flush()
+    del buffer
+
+    reopened = ReplayBuffer(path, capacity=10, n_features=4)
+    assert len(reopened) == 6, "Reopened buffer should keep its transitions"
+    assert list(reopened.rewards[:6]) == list(range(6))
+
+    reopened.add(*make_transitions(6, 2))
+    assert reopened.pos == 8, "Reopened buffer should append after the old data"
+
+    with pytest.raises(ValueError):
+        ReplayBuffer(path, capacity=20, n_features=4)
+
+
+def test_prioritized(tmp_path):
+    buffer = ReplayBuffer(str(tmp_path / "replay"), capacity=10, n_features=4, seed=0)
+    buffer.add(*make_transitions(0, 10))
+
+    # Give one transition nearly all the priority
+    buffer.update_priorities(np.arange(10), np.full(10, 0.01))
+    buffer.update_priorities(np.array([7]), np.array([100.0]))
+
+    batch = buffer.sample(200, prioritized=True)
+    assert np.mean(batch.rewards == 7) > 0.9, "High priority should dominate"
+    assert batch.weights.max() == 1, "Weights should be normalized"
+    assert batch.weights[batch.idxs == 7].max() < 1, "Frequent picks weigh less"
+
+
+def test_empty(tmp_path):
+    buffer = ReplayBuffer(str(tmp_path / "replay"), capacity=10, n_features=4)
+    with pytest.raises(ValueError):
+        buffer.sample(1)
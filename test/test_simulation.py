@@ -0,0 +1,41 @@
+# From dominion module
+from dominion.policy import RandomPolicy
+from dominion.simulation import GameResult, SimulationRunner
+
+
+def test_run_games():
+    # Play a handful of random-vs-random games headlessly
+    runner = SimulationRunner([RandomPolicy(), RandomPolicy()])
+    results = runner.run(5)
+
+    assert len(results) == 5, "Should return one result per game"
+    assert runner.n_games == 5, "Runner should count games played"
+    for result in results:
+        assert isinstance(result, GameResult)
+        assert len(result.scores) == 2, "Should have a score per player"
+        assert len(result.buys) == 2, "Should have a buy count per player"
+        assert result.scores[result.winner] == max(result.scores)
+        assert result.turns > 0, "Games should last at least one turn"
+
+
+def test_max_turns():
+    # Games are cut off once they reach the turn limit
+    runner = SimulationRunner([RandomPolicy(), RandomPolicy()], max_turns=3)
+    (result,) = runner.run(1)
+
+    assert result.turns <= 3, "Game should stop at the turn limit"
+
+
+def test_seeded_games():
+    # A seed fixes every random choice of a game, so the same seed replays it
+    def play(seed, policies=None):
+        policies = policies or [RandomPolicy(), RandomPolicy()]
+        return SimulationRunner(policies, seed=seed).run(3)
+
+    assert play(5) == play(5), "Same seed should play the same games"
+    assert play(5) != play(6), "Different seeds should play different games"
+
+    # Policies are reseeded by each game, whatever state they come in with
+    used = [RandomPolicy(), RandomPolicy()]
+    used[0].rng.random()
+    assert play(5, used) == play(5), "Games should not depend on policy state"
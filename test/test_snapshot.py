@@ -0,0 +1,71 @@
+# Python stdlib
+import random
+
+import numpy as np
+
+# From dominion module
+from dominion.players import CompactDeck, Deck
+from dominion.policy import RandomPolicy
+from dominion.simulation import SimulationRunner
+
+
+def advance(ctx, n_events):
+    name_to_player = {player.name: player for player in ctx.player_order}
+    for _ in range(n_events):
+        if ctx.reached_end():
+            break
+        event = ctx.get_next_event()
+        event(ctx, name_to_player[event.target])
+
+
+def game_state(ctx):
+    # Everything a restore should bring back, as plain comparable values
+    return (
+        ctx.turn,
+        [(type(e), e.target) for e in ctx.event_queue],
+        list(ctx.supply.values()),
+        [
+            (
+                list(p.deck.draw_pile),
+                list(p.deck.discard_pile),
+                list(p.hand),
+                list(p.deck.played_cards),
+                dict(p.deck.counts),
+                p.turn.snapshot(),
+                p.n_bought,
+            )
+            for p in ctx.player_order
+        ],
+    )
+
+
+def check_restore(deck_cls):
+    random.seed(0)
+    np.random.seed(0)
+    runner = SimulationRunner([RandomPolicy(), RandomPolicy()], deck_cls=deck_cls)
+    ctx = runner.make_context()
+
+    advance(ctx, 200)
+    snapshot = ctx.snapshot()
+    before = game_state(ctx)
+
+    # Play on, then rewind and replay: the game should retrace its steps
+    advance(ctx, 200)
+    after = game_state(ctx)
+    ctx.restore(snapshot)
+    assert game_state(ctx) == before, "Restore should rewind the game"
+
+    advance(ctx, 200)
+    assert game_state(ctx) == after, "Replay should match with the same RNG"
+
+    # A snapshot can be restored more than once
+    ctx.restore(snapshot)
+    assert game_state(ctx) == before, "Snapshots should be reusable"
+
+
+def test_restore_deck():
+    check_restore(Deck)
+
+
+def test_restore_compact_deck():
+    check_restore(CompactDeck)
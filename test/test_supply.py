@@ -0,0 +1,66 @@
+# Python stdlib
+import random
+
+# From dominion module
+from dominion.cards.base_game import CURSE, DUCHY, SILVER
+from dominion.players import ComputerPlayer
+from dominion.policy import RandomPolicy
+from dominion.simulation import SimulationRunner
+from dominion.supply import Supply
+
+
+def brute_force_options(supply, max_cost):
+    # What the index should agree with: every non-empty pile within budget
+    return {
+        idx: card.name
+        for idx, card in enumerate(supply)
+        if card.cost <= max_cost and supply[card] > 0
+    }
+
+
+def test_options_track_piles():
+    supply = Supply(rng=random.Random(0))
+    player = ComputerPlayer("Player 1", RandomPolicy())
+    rng = random.Random(1)
+    state = supply.snapshot()
+
+    for _ in range(200):
+        max_cost = rng.randrange(9)
+        options = supply.options(max_cost)
+        assert options == brute_force_options(supply, max_cost)
+        assert list(options) == sorted(options), "Options are in supply order"
+        if options:
+            idx = rng.choice(list(options))
+            assert supply.buy(idx, player, free=True) is supply.cards[idx]
+
+    supply.restore(state)
+    assert supply.options(8) == brute_force_options(supply, 8)
+    assert len(supply.options(8)) == 17, "Restoring refills every pile"
+
+    while supply[CURSE] > 0:
+        supply.buy(CURSE, player, free=True)
+    assert supply.indices[CURSE] not in supply.options(0), "Empty piles are dropped"
+    assert supply.buy(SILVER, player) is SILVER
+    assert (player.turn.buys, player.turn.spent) == (1, 3), "Free gains are not buys"
+
+
+def test_empty_piles():
+    ctx = SimulationRunner([RandomPolicy(), RandomPolicy()], seed=0).make_context()
+    supply, player = ctx.supply, ctx.player_order[0]
+    emptied = []
+    supply.on_empty.append(emptied.append)
+
+    for card in (CURSE, SILVER):
+        while supply[card] > 0:
+            assert not ctx.reached_end()
+            supply.buy(card, player, free=True)
+    assert supply.n_empty == 2 and emptied == [CURSE, SILVER]
+    assert not ctx.reached_end()
+
+    state = supply.snapshot()
+    while supply[DUCHY] > 0:
+        supply.buy(DUCHY, player, free=True)
+    assert supply.n_empty == 3 and ctx.reached_end(), "3 empty piles end the game"
+    supply.restore(state)
+    assert supply.n_empty == 2 and not ctx.reached_end()
+    assert emptied == [CURSE, SILVER, DUCHY]
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+# From dominion module
+from dominion.policy import RandomPolicy
+from dominion.vec_env import OBS_SIZE, VecEnv
+
+
+def random_actions(batch, rng):
+    # A legal action for every game: any masked-in slot, or -1 if skippable
+    actions = []
+    for mask, allow_skip in zip(batch.mask, batch.allow_skip):
+        low = -1 if allow_skip else 0
+        actions.append(int(rng.integers(low, mask.sum())))
+    return actions
+
+
+def play(n_games, seed):
+    env = VecEnv([None, RandomPolicy()], n_envs=4, max_turns=30, seed=seed)
+    batch = env.reset()
+    assert batch.obs.shape == (4, OBS_SIZE)
+    assert batch.mask.shape == batch.option_cards.shape
+    assert (batch.seats == 0).all(), "Only seat 0 is played by the caller"
+
+    rng = np.random.default_rng(0)
+    n_done = 0
+    while n_done < n_games:
+        batch = env.step(random_actions(batch, rng))
+        n_done += batch.dones.sum()
+        for rewards, done in zip(batch.rewards, batch.dones):
+            if done:
+                assert rewards[0] == -rewards[1] or rewards.sum() == 0
+    env.close()
+    return env.results
+
+
+def test_vec_env():
+    results = play(6, seed=0)
+    assert len(results) >= 6
+    assert results == play(6, seed=0), "Seeded envs should play the same games"
+
+
+def test_illegal_action():
+    env = VecEnv([None, None], n_envs=2, seed=0)
+    batch = env.reset()
+    with pytest.raises(ValueError):
+        env.step([batch.mask.shape[1]] * 2)
+    with pytest.raises(ValueError):
+        env.step([0] * 3)  # One action per game
+    env.close()
+    with pytest.raises(RuntimeError):
+        env.step([-1, -1])  # The games were dropped on close
+
+    with pytest.raises(ValueError):
+        VecEnv([RandomPolicy(), RandomPolicy()], n_envs=2)